@@ -0,0 +1,78 @@
+"""
+Parse many uploads concurrently with ofxparse.aio and report how long the
+event loop was ever kept from running other work (its worst lag), next to
+parsing the same uploads synchronously on the loop.
+
+    python -m benchmarks.bench_aio [uploads] [transactions]
+"""
+import asyncio
+import io
+import sys
+import time
+
+from ofxparse import OfxParser, aio
+
+from .synthetic import bank_statement
+
+
+async def upload(data, chunk_size=16 * 1024):
+    """
+    Feed data to a StreamReader a chunk at a time, like a slow client.
+    """
+    reader = asyncio.StreamReader()
+
+    async def send():
+        for i in range(0, len(data), chunk_size):
+            reader.feed_data(data[i:i + chunk_size])
+            await asyncio.sleep(0)
+        reader.feed_eof()
+
+    asyncio.ensure_future(send())
+    return reader
+
+
+async def measure_lag(done, interval=0.001):
+    worst = 0.0
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+async def run(name, handler, uploads, data):
+    done = asyncio.Event()
+    lag = asyncio.ensure_future(measure_lag(done))
+    start = time.perf_counter()
+    await asyncio.gather(*[handler(data) for _ in range(uploads)])
+    seconds = time.perf_counter() - start
+    done.set()
+    print('%-22s %7.3fs  worst loop lag %6.1f ms' % (
+        name, seconds, await lag * 1000))
+
+
+async def blocking(data):
+    reader = await upload(data)
+    OfxParser.parse(io.BytesIO(await reader.read()), backend='native')
+
+
+async def aio_parse(data):
+    await aio.parse(await upload(data), backend='native')
+
+
+async def aio_iter_transactions(data):
+    async for _ in aio.iter_transactions(await upload(data)):
+        pass
+
+
+async def main(uploads=200, transactions=200):
+    data = bank_statement(transactions)
+    print('%d uploads of %d transactions' % (uploads, transactions))
+    await run('blocking parse', blocking, uploads, data)
+    await run('aio.parse', aio_parse, uploads, data)
+    await run('aio.iter_transactions', aio_iter_transactions, uploads, data)
+
+
+if __name__ == '__main__':
+    asyncio.new_event_loop().run_until_complete(
+        main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,29 @@
+"""
+Compare parse throughput of the tree-building backends.
+
+    python -m benchmarks.bench_backends [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import timeit
+
+from ofxparse.ofxparse import BACKENDS, OfxParser
+
+from .synthetic import bank_statement
+
+
+def main(transactions=20000):
+    data = bank_statement(transactions)
+    print('%d transactions, %.1f MB' % (transactions, len(data) / 1e6))
+    for backend in sorted(BACKENDS):
+        seconds = min(timeit.repeat(
+            lambda: OfxParser.parse(io.BytesIO(data), backend=backend),
+            number=1, repeat=3))
+        print('%-15s %7.3fs  %8.0f transactions/s' % (
+            backend, seconds, transactions / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""
+Compare parsing a statement file compressed with gzip, bzip2 and xz, read
+through a file object that decompresses it as it is parsed, with parsing
+the file uncompressed: the size of each file and the time of a parse with
+the native backend.
+
+    python -m benchmarks.bench_compressed [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import tempfile
+import timeit
+
+from ofxparse.ofxparse import OfxParser
+
+from .synthetic import bank_statement
+
+COMPRESSORS = [
+    ('.ofx', lambda data: data),
+    ('.ofx.gz', gzip.compress),
+    ('.ofx.bz2', bz2.compress),
+    ('.ofx.xz', lzma.compress),
+]
+
+
+def parse(path):
+    with open(path, 'rb') as f:
+        return OfxParser.parse(f, backend='native')
+
+
+def main(transactions=100000):
+    data = bank_statement(transactions)
+    print('%d transactions' % transactions)
+    for suffix, compress in COMPRESSORS:
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(compress(data))
+            seconds = min(timeit.repeat(lambda: parse(path),
+                                        number=1, repeat=3))
+            print('%-8s %7.1f MB %7.3fs per parse'
+                  % (suffix, os.path.getsize(path) / 1e6, seconds))
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
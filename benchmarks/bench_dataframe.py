@@ -0,0 +1,49 @@
+"""
+Time building a pandas DataFrame of a statement's transactions: from a
+list of records made row by row, and with to_dataframe() from parsed
+statements in list and columnar form.
+
+    python -m benchmarks.bench_dataframe [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import time
+
+import pandas as pd
+
+from ofxparse import OfxParser
+from ofxparse.ofxframe import TRANSACTION_FIELDS
+
+from .synthetic import bank_statement
+
+
+def records(ofx):
+    return pd.DataFrame.from_records(
+        [dict((field, getattr(transaction, field))
+              for field in TRANSACTION_FIELDS)
+         for transaction in ofx.account.statement.transactions],
+        columns=TRANSACTION_FIELDS)
+
+
+def timed(label, function, *args):
+    start = time.time()
+    frame = function(*args)
+    print('%-24s %7.3fs  %d rows' % (label, time.time() - start, len(frame)))
+
+
+def main(transactions=100000):
+    data = bank_statement(transactions)
+    ofx = OfxParser.parse(io.BytesIO(data), backend='native')
+    columnar = OfxParser(columnar=True).parse(io.BytesIO(data),
+                                              backend='native')
+    timed('records', records, ofx)
+    timed('to_dataframe', ofx.to_dataframe)
+    timed('to_dataframe float', ofx.to_dataframe, False, 'float')
+    timed('columnar to_dataframe', columnar.to_dataframe)
+    timed('columnar float', columnar.to_dataframe, False, 'float')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
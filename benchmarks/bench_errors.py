@@ -0,0 +1,50 @@
+"""
+Time parsing a statement whose transactions are all discarded, with
+fail_fast off, against the same statement with valid transactions, and
+report the memory each result keeps.
+
+    python -m benchmarks.bench_errors [transactions] [backend]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import time
+
+from ofxparse import OfxParser
+
+from .bench_intern import deep_size
+from .synthetic import bank_statement
+
+
+def dirty_statement(transactions):
+    """
+    Return bank_statement(transactions) with amounts that do not parse and
+    an empty currency, so every transaction is discarded with a warning
+    for the statement.
+    """
+    return bank_statement(transactions) \
+        .replace(b'<TRNAMT>-', b'<TRNAMT>$') \
+        .replace(b'<CURDEF>USD', b'<CURDEF>')
+
+
+def measure(label, data, backend):
+    parser = OfxParser(fail_fast=False)
+    start = time.time()
+    ofx = parser.parse(io.BytesIO(data), backend=backend)
+    elapsed = time.time() - start
+    statement = ofx.account.statement
+    print('%s: %.2f s, %.0f kB kept, %d transactions, %d discarded, '
+          '%d warnings' % (
+              label, elapsed, deep_size(ofx) / 1e3,
+              len(statement.transactions), len(statement.discarded_entries),
+              len(statement.warnings)))
+
+
+def main(transactions=100000, backend='beautifulsoup'):
+    measure('valid', bank_statement(transactions), backend)
+    measure('dirty', dirty_statement(transactions), backend)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) if arg.isdigit() else arg for arg in sys.argv[1:]))
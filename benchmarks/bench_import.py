@@ -0,0 +1,53 @@
+"""
+Measure what importing ofxparse costs a fresh interpreter, in time and
+peak RSS, and what first using its parts adds on top.
+
+    python -m benchmarks.bench_import [runs]
+"""
+from __future__ import absolute_import, print_function
+
+import json
+import subprocess
+import sys
+
+CASES = [
+    ('interpreter', ''),
+    ('import ofxparse', 'import ofxparse'),
+    ('+ OfxParser', 'from ofxparse import OfxParser'),
+    ('+ MCC lookup', "import ofxparse; from ofxparse import mcc; "
+                     "mcc.codes.get('5411')"),
+    ('+ warmup()', 'import ofxparse; ofxparse.warmup()'),
+]
+
+CHILD = '''
+import json, resource, time
+start = time.time()
+%s
+seconds = time.time() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([seconds, rss]))
+'''
+
+
+def measure(statement):
+    output = subprocess.check_output(
+        [sys.executable, '-c', CHILD % statement])
+    return json.loads(output.decode('ascii'))
+
+
+def main(runs=10):
+    print('%s, best of %d fresh interpreters' % (
+        sys.version.split()[0], runs))
+    for label, statement in CASES:
+        results = [measure(statement) for _ in range(runs)]
+        seconds = min(r[0] for r in results)
+        rss = min(r[1] for r in results)
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+        if sys.platform == 'darwin':
+            rss //= 1024
+        print('%-16s %8.1f ms  peak RSS %7.1f MB' % (
+            label, seconds * 1000, rss / 1024.0))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
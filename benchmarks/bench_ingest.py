@@ -0,0 +1,56 @@
+"""
+Report the peak memory of reading a document into the text a tree
+builder is given, as a multiple of the file size, for bytes and text
+handles and each kind of OfxFile, and the peak of whole parses.
+
+    python -m benchmarks.bench_ingest [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import tracemalloc
+
+from ofxparse import OfxParser
+from ofxparse.ofxparse import OfxFile, OfxPreprocessedFile
+
+from .synthetic import bank_statement
+
+
+def peak(func, *args):
+    """
+    Return the peak memory allocated while func(*args) runs, including
+    what it returns.
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def ingest(file_cls, handle):
+    return file_cls(handle).fh.read()
+
+
+def main(transactions=20000):
+    data = bank_statement(transactions)
+    text = data.decode('ascii')
+    size = float(len(data))
+    print('%d transactions, %.1f MB' % (transactions, size / 1e6))
+    for file_cls in (OfxFile, OfxPreprocessedFile):
+        for label, handle in (('bytes', io.BytesIO(data)),
+                              ('text', io.StringIO(text))):
+            used, _ = peak(ingest, file_cls, handle)
+            print('  %s from %s: %.1fx the file size'
+                  % (file_cls.__name__, label, used / size))
+    for backend in ('native', 'beautifulsoup', 'lxml'):
+        used, _ = peak(OfxParser.parse, io.BytesIO(data), None, None,
+                       backend)
+        print('  parse with %s: %.1fx the file size'
+              % (backend, used / size))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
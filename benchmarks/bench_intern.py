@@ -0,0 +1,78 @@
+"""
+Report the memory that parse results keep, with the parser's interning
+of repeated values and without, on the test fixtures and on a synthetic
+statement.
+
+    python -m benchmarks.bench_intern [transactions] [backend]
+"""
+from __future__ import absolute_import, print_function
+
+import gc
+import io
+import os
+import sys
+import types
+
+from ofxparse import OfxParser
+
+from .synthetic import bank_statement
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
+
+
+def fixtures():
+    documents = []
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.endswith('.ofx'):
+            with open(os.path.join(FIXTURES, name), 'rb') as f:
+                documents.append(f.read())
+    return documents
+
+
+def deep_size(obj):
+    """
+    Return the bytes taken by obj and every object it refers to, counting
+    shared objects once and leaving out classes and modules.
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, types.ModuleType)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+def retained(parser, documents, backend):
+    """
+    Return the bytes held by the results of parsing documents.
+    """
+    return deep_size([parser.parse(io.BytesIO(data), backend=backend)
+                      for data in documents])
+
+
+def report(label, documents, backend):
+    plain = retained(OfxParser(fail_fast=False, intern=False), documents,
+                     backend)
+    interned = retained(OfxParser(fail_fast=False, intern=True), documents,
+                       backend)
+    session = retained(OfxParser(fail_fast=False, intern=True).session(),
+                       documents, backend)
+    print('%s: %.0f kB plain, %.0f kB interned (%.0f%% less), '
+          '%.0f kB in one session' % (
+              label, plain / 1e3, interned / 1e3,
+              100.0 * (plain - interned) / plain, session / 1e3))
+
+
+def main(transactions=1000000, backend='native'):
+    report('fixtures', fixtures(), backend)
+    report('%d transactions' % transactions,
+           [bank_statement(transactions)], backend)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) if arg.isdigit() else arg for arg in sys.argv[1:]))
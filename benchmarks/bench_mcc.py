@@ -0,0 +1,46 @@
+"""
+Compare classifying card transactions by MCC one row at a time, through
+the mcc.codes mapping, with mcc.classify_codes.
+
+    python -m benchmarks.bench_mcc [rows]
+"""
+from __future__ import absolute_import, print_function
+
+import random
+import sys
+import time
+
+from ofxparse import mcc
+
+
+def per_row(codes):
+    result = []
+    for code in codes:
+        entry = mcc.codes.get(code)
+        if entry is None:
+            result.append((code, None, mcc.category(code), None))
+        else:
+            result.append((
+                code, entry['combined description'], mcc.category(code),
+                mcc.reportability(entry['Reportable under 6041/6041A and '
+                                        'Authority for Exception'])))
+    return result
+
+
+def main(rows=1000000):
+    rng = random.Random(0)
+    known = list(mcc.codes)
+    codes = [rng.choice(known) if rng.random() < 0.95
+             else str(rng.randint(1, 9999)) for _ in range(rows)]
+    print('%d rows' % rows)
+    for label, function in (('per row', per_row),
+                            ('classify_codes', mcc.classify_codes)):
+        start = time.time()
+        function(codes)
+        seconds = time.time() - start
+        print('%-15s %7.3fs  %10.0f rows/s' % (
+            label, seconds, rows / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,84 @@
+"""
+Report the memory each parsed transaction takes, with the model classes'
+__slots__, with a per-instance __dict__ as they had before, and in the
+columns of a TransactionTable (OfxParser(columnar=True)).  Only the
+objects themselves are counted; the values they hold are shared, except
+that a table stores its dates and amounts in place of the objects.
+
+    python -m benchmarks.bench_memory [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import tracemalloc
+
+from ofxparse import OfxParser
+from ofxparse.ofxtable import TransactionTable
+
+from .synthetic import bank_statement
+
+
+class DictBacked(object):
+    """
+    A copy of a model object that keeps its attributes in a __dict__.
+    """
+
+    def __init__(self, obj):
+        for name in type(obj).__slots__:
+            if hasattr(obj, name):
+                setattr(self, name, getattr(obj, name))
+
+
+class Slotted(object):
+    """
+    Make copies of model objects of the slotted class itself.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+
+    def __call__(self, obj):
+        copy = self.cls.__new__(self.cls)
+        for name in self.cls.__slots__:
+            if hasattr(obj, name):
+                setattr(copy, name, getattr(obj, name))
+        return copy
+
+
+def allocated(make, objects):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = [make(obj) for obj in objects]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # Leave out the list holding the copies.
+    return (size - sys.getsizeof(copies)) / float(len(copies))
+
+
+def table_allocated(objects):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = TransactionTable()
+    table.extend(objects)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / float(len(table))
+
+
+def main(transactions=100000):
+    ofx = OfxParser.parse(io.BytesIO(bank_statement(transactions)),
+                          backend='native')
+    objects = ofx.account.statement.transactions
+    cls = type(objects[0])
+    print('%d transactions' % len(objects))
+    print('%-12s %6.0f bytes per transaction' % (
+        '__dict__', allocated(DictBacked, objects)))
+    print('%-12s %6.0f bytes per transaction' % (
+        '__slots__', allocated(Slotted(cls), objects)))
+    print('%-12s %6.0f bytes per transaction' % (
+        'columnar', table_allocated(objects)))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Compare parsing a statement file on disk with the native backend, which
+reads and decodes all of it, and the mmap backend, which maps it and
+tokenizes its bytes in place: the time of repeated parses, and the memory
+Python allocates for the document besides the tree.
+
+    python -m benchmarks.bench_mmap [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from ofxparse.ofxparse import OfxFile, OfxMappedFile, OfxParser
+
+from .synthetic import bank_statement
+
+
+def parse(path, backend):
+    with open(path, 'rb') as f:
+        return OfxParser.parse(f, backend=backend)
+
+
+def document_peak(path, file_cls):
+    """
+    Return the peak memory allocated reading the document at path with
+    file_cls, as the tree builder gets it.
+    """
+    with open(path, 'rb') as f:
+        tracemalloc.start()
+        try:
+            document = file_cls(f).read()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            if hasattr(document, 'close'):
+                document.close()
+
+
+def main(transactions=100000):
+    fd, path = tempfile.mkstemp(suffix='.ofx')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(bank_statement(transactions))
+        size = os.path.getsize(path)
+        print('%d transactions, %.1f MB' % (transactions, size / 1e6))
+        for backend, file_cls in (('native', OfxFile),
+                                  ('mmap', OfxMappedFile)):
+            seconds = min(timeit.repeat(lambda: parse(path, backend),
+                                        number=1, repeat=3))
+            print('%-8s %7.3fs per parse, %6.1f MB to read the document'
+                  % (backend, seconds, document_peak(path, file_cls) / 1e6))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""
+Compare parsing a directory of files one at a time with
+OfxParser.parse_many.
+
+    python -m benchmarks.bench_parse_many [files] [transactions] [workers]
+"""
+from __future__ import absolute_import, print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from ofxparse import OfxParser
+
+from .synthetic import bank_statement
+
+
+def main(files=200, transactions=200, workers=None):
+    directory = tempfile.mkdtemp()
+    try:
+        data = bank_statement(transactions)
+        paths = []
+        for i in range(files):
+            path = os.path.join(directory, '%05d.ofx' % i)
+            with open(path, 'wb') as fh:
+                fh.write(data)
+            paths.append(path)
+        print('%d files of %d transactions' % (files, transactions))
+
+        start = time.time()
+        for path in paths:
+            with open(path, 'rb') as fh:
+                OfxParser.parse(fh)
+        seconds = time.time() - start
+        print('loop        %7.3fs  %6.1f files/s' % (seconds, files / seconds))
+
+        for batch_size in (1, 10):
+            start = time.time()
+            for result in OfxParser.parse_many(paths, workers=workers,
+                                               batch_size=batch_size):
+                if result.error is not None:
+                    raise result.error
+            seconds = time.time() - start
+            print('parse_many  %7.3fs  %6.1f files/s  (batch_size %d)' % (
+                seconds, files / seconds, batch_size))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
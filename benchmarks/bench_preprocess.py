@@ -0,0 +1,31 @@
+"""
+Show how SGML preprocessing (closing the unclosed leaf elements) scales
+with the number of transactions.  The time per transaction should stay
+flat as documents grow.
+
+    python -m benchmarks.bench_preprocess [largest]
+"""
+from __future__ import absolute_import, print_function
+
+import sys
+import timeit
+
+from ofxparse.ofxparse import close_tags
+
+from .synthetic import bank_statement
+
+
+def main(largest=1000000):
+    transactions = 1000
+    while transactions <= largest:
+        text = bank_statement(transactions, mixed=True).decode('ascii')
+        seconds = min(timeit.repeat(lambda: close_tags(text),
+                                    number=1, repeat=3))
+        print('%8d transactions %8.1f MB %8.3fs %6.2f us/transaction' % (
+            transactions, len(text) / 1e6, seconds,
+            seconds / transactions * 1e6))
+        transactions *= 10
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
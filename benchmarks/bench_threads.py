@@ -0,0 +1,58 @@
+"""
+Measure how parse throughput scales with threads sharing one OfxParser.
+On a free-threaded CPython build (3.13t and later, with the GIL disabled)
+throughput should grow with the thread count; with the GIL it stays flat.
+
+    python -m benchmarks.bench_threads [documents] [transactions] [backend]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import threading
+import time
+
+from ofxparse import OfxParser
+
+from .synthetic import bank_statement
+
+
+def gil_enabled():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run(parser, data, documents, threads, backend):
+    def work(count):
+        for _ in range(count):
+            parser.parse(io.BytesIO(data), backend=backend)
+
+    workers = [threading.Thread(target=work, args=(documents // threads,))
+               for _ in range(threads)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.time() - start
+
+
+def main(documents=64, transactions=500, backend='native'):
+    data = bank_statement(transactions)
+    parser = OfxParser(fail_fast=False)
+    print('%s, GIL %s, %d documents of %d transactions, %s backend' % (
+        sys.version.split()[0],
+        'enabled' if gil_enabled() else 'disabled',
+        documents, transactions, backend))
+    baseline = None
+    threads = 1
+    while threads <= 16:
+        seconds = run(parser, data, documents, threads, backend)
+        baseline = baseline or seconds
+        print('%2d threads %7.3fs  %6.1f documents/s  speedup %.2fx' % (
+            threads, seconds, documents / seconds, baseline / seconds))
+        threads *= 2
+
+
+if __name__ == '__main__':
+    main(*(int(arg) if arg.isdigit() else arg for arg in sys.argv[1:]))
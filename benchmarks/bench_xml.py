@@ -0,0 +1,32 @@
+"""
+Compare parsing an OFX 2.x (XML) statement, which skips SGML repair when
+it is well-formed, with parsing the same statement as OFX 1.02 (SGML).
+
+    python -m benchmarks.bench_xml [transactions]
+"""
+from __future__ import absolute_import, print_function
+
+import io
+import sys
+import timeit
+
+from ofxparse.ofxparse import BACKENDS, OfxParser
+
+from .synthetic import bank_statement, xml_bank_statement
+
+
+def main(transactions=5000):
+    documents = (('sgml', bank_statement(transactions)),
+                 ('xml', xml_bank_statement(transactions)))
+    print('%d transactions' % transactions)
+    for backend in sorted(BACKENDS):
+        for kind, data in documents:
+            seconds = min(timeit.repeat(
+                lambda: OfxParser.parse(io.BytesIO(data), backend=backend),
+                number=1, repeat=3))
+            print('%-15s %-5s %7.3fs  %8.0f transactions/s' % (
+                backend, kind, seconds, transactions / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
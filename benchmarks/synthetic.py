@@ -0,0 +1,106 @@
+"""
+Synthetic OFX documents for the benchmarks in this directory.
+"""
+from __future__ import absolute_import
+
+from ofxparse.ofxparse import close_tags
+
+HEADER = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+SECURITY:NONE
+ENCODING:USASCII
+CHARSET:1252
+COMPRESSION:NONE
+OLDFILEUID:NONE
+NEWFILEUID:NONE
+
+"""
+
+XML_HEADER = """<?xml version="1.0" encoding="US-ASCII"?>
+<?OFX OFXHEADER="200" VERSION="211" SECURITY="NONE" OLDFILEUID="NONE" \
+NEWFILEUID="NONE"?>
+"""
+
+SIGNON = """<OFX>
+<SIGNONMSGSRSV1><SONRS><STATUS><CODE>0<SEVERITY>INFO</STATUS>
+<DTSERVER>20090523122017<LANGUAGE>ENG<FI><ORG>BANK<FID>1234</FI></SONRS>
+</SIGNONMSGSRSV1>
+"""
+
+STATEMENT_START = """<BANKMSGSRSV1><STMTTRNRS><TRNUID>1<STATUS><CODE>0<SEVERITY>INFO
+</STATUS><STMTRS><CURDEF>USD<BANKACCTFROM><BANKID>160000100
+<ACCTID>12300000012345678<ACCTTYPE>CHECKING</BANKACCTFROM>
+<BANKTRANLIST><DTSTART>20090401<DTEND>20090523122017
+"""
+
+TRANSACTION = """<STMTTRN>
+<TRNTYPE>%(type)s
+<DTPOSTED>200904%(day)02d122017.000[-5:EST]
+<TRNAMT>-%(amount)d.%(cents)02d
+<FITID>%(id)012d
+<NAME>%(payee)s
+<MEMO>POS MERCHANDISE;%(payee)s
+</STMTTRN>
+"""
+
+# The same transaction with its leaf elements closed, as some servers do.
+CLOSED_TRANSACTION = """<STMTTRN>
+<TRNTYPE>%(type)s</TRNTYPE>
+<DTPOSTED>200904%(day)02d122017.000[-5:EST]</DTPOSTED>
+<TRNAMT>-%(amount)d.%(cents)02d</TRNAMT>
+<FITID>%(id)012d</FITID>
+<NAME>%(payee)s</NAME>
+<MEMO>POS MERCHANDISE;%(payee)s</MEMO>
+</STMTTRN>
+"""
+
+STATEMENT_END = """</BANKTRANLIST><LEDGERBAL><BALAMT>382.34<DTASOF>20090523122017
+</LEDGERBAL><AVAILBAL><BALAMT>682.34<DTASOF>20090523122017</AVAILBAL>
+</STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+TYPES = ('POS', 'DEBIT', 'CREDIT', 'CHECK', 'ATM')
+PAYEES = ("MCDONALD'S #112", 'SHELL OIL 5744', 'SAFEWAY #1234',
+          'AMAZON MKTPLACE', 'PAYROLL ACME CORP', 'CITY OF SPRINGFIELD')
+
+
+def iter_bank_statement(transactions, mixed=False):
+    """
+    Yield the text of an OFX 1.02 bank statement holding the given number
+    of transactions, piece by piece.  With mixed, every other transaction
+    has its leaf elements closed.
+    """
+    yield HEADER
+    yield SIGNON
+    yield STATEMENT_START
+    for i in range(transactions):
+        template = CLOSED_TRANSACTION if mixed and i % 2 else TRANSACTION
+        yield template % {
+            'type': TYPES[i % len(TYPES)],
+            'day': i % 28 + 1,
+            'amount': i % 500,
+            'cents': i % 100,
+            'id': i,
+            'payee': PAYEES[i % len(PAYEES)],
+        }
+    yield STATEMENT_END
+
+
+def bank_statement(transactions, mixed=False):
+    """
+    Return an OFX 1.02 bank statement with the given number of
+    transactions as bytes.
+    """
+    return ''.join(iter_bank_statement(transactions, mixed)).encode('ascii')
+
+
+def xml_bank_statement(transactions):
+    """
+    Return the OFX 2.11 (XML) equivalent of bank_statement(transactions)
+    as bytes.
+    """
+    sgml = ''.join(iter_bank_statement(transactions))
+    body = close_tags(sgml[len(HEADER):])
+    return (XML_HEADER + body).encode('ascii')
@@ -1,16 +1,77 @@
+"""
+The names below are imported from their modules on first use, so that
+``import ofxparse`` stays cheap for short-lived processes; call warmup()
+to import everything up front instead.
+"""
 from __future__ import absolute_import
 
-from .ofxparse import (OfxParser, OfxParserException, AccountType, Account,
-                       Statement, Transaction)
-from .ofxprinter import OfxPrinter
+import importlib
+import sys
 
 __version__ = '0.21'
 __all__ = [
     'OfxParser',
     'OfxParserException',
+    'ErrorRecord',
     'AccountType',
     'Account',
     'Statement',
     'Transaction',
     'OfxPrinter'
 ]
+
+# The module each name in __all__ comes from.
+EXPORTS = {
+    'OfxParser': 'ofxparse',
+    'OfxParserException': 'ofxparse',
+    'ErrorRecord': 'ofxparse',
+    'AccountType': 'ofxparse',
+    'Account': 'ofxparse',
+    'Statement': 'ofxparse',
+    'Transaction': 'ofxparse',
+    'OfxPrinter': 'ofxprinter',
+}
+
+# The submodules that importing the package used to import.
+SUBMODULES = frozenset(['ofxparse', 'ofxprinter', 'ofxtree', 'ofxlxml', 'mcc'])
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name not in EXPORTS:
+        raise AttributeError('module %r has no attribute %r'
+                             % (__name__, name))
+    module = importlib.import_module('.' + EXPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(EXPORTS))
+
+
+def warmup():
+    """
+    Import everything ofxparse may use and load its data now rather than
+    on first use.  A server that forks workers can call this before
+    forking, so the work is done once and the workers share the memory.
+    """
+    from . import mcc, ofxparse
+    for name in EXPORTS:
+        __getattr__(name)
+    ofxparse.load_soup_maker()
+    try:
+        from . import ofxlxml  # noqa: F401
+    except ImportError:
+        pass
+    mcc.table()
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ needs Python 3.7.
+    from .ofxparse import (OfxParser, OfxParserException,  # noqa: F401
+                           ErrorRecord,
+                           AccountType, Account, Statement, Transaction)
+    from .ofxprinter import OfxPrinter  # noqa: F401
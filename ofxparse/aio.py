@@ -0,0 +1,128 @@
+"""
+asyncio entry points for OfxParser (Python 3.6 and later).
+
+They read a document from an asyncio.StreamReader, or any object with a
+coroutine read(n) method, or an async iterable of bytes, without blocking
+the event loop, and run the parsing itself in an executor:
+
+    ofx = await ofxparse.aio.parse(reader)
+
+    async for account, transaction in ofxparse.aio.iter_transactions(reader):
+        ...
+"""
+import asyncio
+import codecs
+import functools
+import io
+
+from .ofxparse import OfxFile, OfxParser, TransactionStream
+
+# OfxFile looks for headers in the first 10KB of a document.
+HEADER_SIZE = 10 * 1024
+
+
+async def iter_chunks(source, chunk_size=64 * 1024):
+    """
+    Yield the bytes of source a chunk at a time.
+    """
+    if hasattr(source, 'read'):
+        while True:
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in source:
+            if chunk:
+                yield chunk
+
+
+async def next_chunk(chunks):
+    """
+    Return the next chunk from chunks, or b'' at the end.
+    """
+    async for chunk in chunks:
+        return chunk
+    return b''
+
+
+def running_loop():
+    """
+    Return the event loop running the current coroutine.
+    """
+    # asyncio.get_running_loop() is new in Python 3.7.
+    get_running_loop = getattr(asyncio, 'get_running_loop', None)
+    if get_running_loop is None:
+        return asyncio.get_event_loop()
+    return get_running_loop()
+
+
+async def parse(source, parser=None, executor=None, backend='beautifulsoup'):
+    """
+    Read the whole of source, then parse it with parser (by default an
+    OfxParser with the default settings) in executor (by default, the
+    event loop's), and return the ofx object.  Any executor will do,
+    including a ProcessPoolExecutor.
+
+    The whole document is held in memory before it is parsed, so this
+    takes as much memory as OfxParser.parse; use iter_transactions to
+    process large uploads as they arrive.
+    """
+    if parser is None:
+        parser = OfxParser()
+    data = b''.join([chunk async for chunk in iter_chunks(source)])
+    loop = running_loop()
+    return await loop.run_in_executor(executor, functools.partial(
+        parser.parse, io.BytesIO(data), backend=backend))
+
+
+def feed(stream, text, eof):
+    """
+    Feed text to stream, and return the pairs it completes and the
+    exception that ended them, if any.
+    """
+    pairs = []
+    try:
+        for pair in stream.feed(text, eof):
+            pairs.append(pair)
+    except Exception as e:
+        return pairs, e
+    return pairs, None
+
+
+async def iter_transactions(source, parser=None, executor=None,
+                            chunk_size=64 * 1024):
+    """
+    The asynchronous counterpart of OfxParser.iter_transactions: yield
+    (account, transaction) pairs from source as they arrive, parsing each
+    chunk in executor (by default, the event loop's).  The parsing state
+    stays in this process, so executor must be a thread pool.
+    """
+    if parser is None:
+        parser = OfxParser()
+    loop = running_loop()
+    chunks = iter_chunks(source, chunk_size)
+
+    head = b''
+    while len(head) < HEADER_SIZE:
+        chunk = await next_chunk(chunks)
+        if not chunk:
+            break
+        head += chunk
+    decoder = codecs.getincrementaldecoder(
+        OfxFile(io.BytesIO(head)).encoding or 'ascii')()
+    stream = TransactionStream(parser)
+
+    data = head
+    while True:
+        eof = not data
+        text = decoder.decode(data, final=eof)
+        pairs, error = await loop.run_in_executor(
+            executor, feed, stream, text, eof)
+        for pair in pairs:
+            yield pair
+        if error is not None:
+            raise error
+        if eof:
+            return
+        data = await next_chunk(chunks)
@@ -0,0 +1,156 @@
+"""
+Reading and writing compressed OFX: gzip, bzip2, xz and zip.
+
+OfxFile reads compressed documents by their magic bytes, whatever they are
+called, through a file object that decompresses as it is read, so the
+document is never inflated into memory or a temporary file first.  Output
+is compressed by the extension of the file name.
+
+xz needs the lzma module, which Python 2 does not have.
+"""
+from __future__ import absolute_import
+
+import bz2
+import contextlib
+import gzip
+import io
+import os
+import zipfile
+
+import six
+
+# The magic bytes each format starts with.
+MAGIC_NUMBERS = [
+    (six.b('\x1f\x8b'), 'gzip'),
+    (six.b('BZh'), 'bz2'),
+    (six.b('\xfd7zXZ\x00'), 'xz'),
+    (six.b('PK\x03\x04'), 'zip'),
+]
+
+MAGIC_SIZE = max(len(magic) for magic, _ in MAGIC_NUMBERS)
+
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zip': 'zip',
+}
+
+# The extensions of the members of a zip archive that are read as OFX.
+MEMBER_EXTENSIONS = ('.ofx', '.qfx')
+
+
+def import_lzma():
+    try:
+        import lzma
+    except ImportError:
+        raise ImportError('xz compressed OFX requires the lzma module')
+    return lzma
+
+
+def detect(fh):
+    """
+    Return the compression format of a byte stream from its first bytes,
+    or None if it is not compressed, leaving fh where it was.
+    """
+    pos = fh.tell()
+    head = fh.read(MAGIC_SIZE)
+    fh.seek(pos)
+    if not isinstance(head, bytes):
+        return None
+    for magic, compression in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def compression_of(filename):
+    """
+    Return the compression format named by the extension of filename, or
+    None.
+    """
+    return EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def ofx_members(archive):
+    """
+    Return the members of a zip archive that hold OFX documents: those
+    with an OFX or QFX extension, or if there are none, every file.
+    """
+    files = [info for info in archive.infolist()
+             if not info.filename.endswith('/')]
+    members = [info for info in files
+               if info.filename.lower().endswith(MEMBER_EXTENSIONS)]
+    return members or files
+
+
+def open_archive(fh):
+    """
+    Open a zip archive, which has its directory at the end, and so can
+    only be read from a stream that can seek.
+    """
+    seekable = getattr(fh, 'seekable', None)
+    if seekable is not None and not seekable():
+        raise io.UnsupportedOperation(
+            'a zip archive can only be read from a stream that can seek')
+    return zipfile.ZipFile(fh)
+
+
+def decompressed(fh, compression):
+    """
+    Return a byte stream of the data of fh, compressed in the given format,
+    that decompresses it as it is read.  A zip archive has to hold a
+    single document.
+    """
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=fh, mode='rb')
+    if compression == 'bz2':
+        return bz2.BZ2File(fh)
+    if compression == 'xz':
+        return import_lzma().LZMAFile(fh)
+    if compression == 'zip':
+        archive = open_archive(fh)
+        members = ofx_members(archive)
+        if len(members) != 1:
+            raise ValueError('the zip archive holds %d documents, not one; '
+                             'iter_parse() reads each of them'
+                             % len(members))
+        return archive.open(members[0])
+    raise ValueError('Unknown compression %r, expected one of %s'
+                     % (compression, ', '.join(sorted(EXTENSIONS.values()))))
+
+
+def text_writer(fh):
+    """
+    Wrap a binary stream for writing text as open(filename, 'w') would.
+    """
+    if six.PY2:
+        return fh
+    return io.TextIOWrapper(fh)
+
+
+@contextlib.contextmanager
+def open_output(filename):
+    """
+    Open filename for writing text, compressed in the format its extension
+    names, if any.  A zip archive is written with a single member, named
+    after the archive.
+    """
+    compression = compression_of(filename)
+    if compression is None:
+        with open(filename, 'w') as f:
+            yield f
+    elif compression == 'zip':
+        name = os.path.splitext(os.path.basename(filename))[0]
+        with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as archive:
+            with text_writer(archive.open(name, 'w')) as f:
+                yield f
+    else:
+        if compression == 'gzip':
+            binary = gzip.GzipFile(filename, 'wb')
+        elif compression == 'bz2':
+            binary = bz2.BZ2File(filename, 'wb')
+        else:
+            binary = import_lzma().LZMAFile(filename, 'wb')
+        with text_writer(binary) as f:
+            yield f
@@ -0,0 +1,201 @@
+"""
+pandas DataFrames of parsed OFX.
+
+to_dataframe() builds one frame from any number of files, accounts or
+statements, one column at a time: each field is collected across all the
+statements in a single pass and converted to a column of the right dtype
+at once.  Fields that repeat, such as the transaction type, the payee, the
+currency and the account, are categorical.
+
+pandas (and numpy) are only needed when a frame is built.
+"""
+from __future__ import absolute_import
+
+import operator
+
+from .ofxparse import Account, InvestmentStatement, Ofx, Statement
+from .ofxtable import DateColumn, DecimalColumn, ObjectColumn, Table
+
+TRANSACTION_FIELDS = ['id', 'type', 'date', 'user_date', 'amount', 'payee',
+                      'memo', 'checknum', 'sic', 'mcc']
+
+INVESTMENT_TRANSACTION_FIELDS = [
+    'tradeDate', 'settleDate', 'security', 'income_type', 'units',
+    'unit_price', 'commission', 'fees', 'total', 'tferaction',
+    'inv401ksource']
+
+POSITION_FIELDS = ['security', 'units', 'unit_price', 'market_value', 'date']
+
+DATE_FIELDS = frozenset(['date', 'user_date', 'tradeDate', 'settleDate'])
+
+DECIMAL_FIELDS = frozenset(['amount', 'units', 'unit_price', 'commission',
+                            'fees', 'total', 'market_value'])
+
+CATEGORICAL_FIELDS = frozenset(['source', 'account', 'currency', 'type',
+                                'payee', 'security', 'income_type'])
+
+
+def import_pandas():
+    try:
+        import numpy
+        import pandas
+    except ImportError:
+        raise ImportError('to_dataframe() requires pandas to be installed')
+    return numpy, pandas
+
+
+def iter_statements(obj, source=None):
+    """
+    Yield (source, account, statement) for each statement in obj: an Ofx,
+    an Account, a statement, a list of them or a dict mapping the name of
+    each source to one of them.
+    """
+    if isinstance(obj, dict):
+        for name, value in obj.items():
+            for item in iter_statements(value, name):
+                yield item
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            for item in iter_statements(value, source):
+                yield item
+    elif isinstance(obj, Ofx):
+        for account in getattr(obj, 'accounts', []):
+            for item in iter_statements(account, source):
+                yield item
+    elif isinstance(obj, Account):
+        if obj.statement is not None:
+            yield source, obj, obj.statement
+    elif isinstance(obj, (Statement, InvestmentStatement)):
+        yield source, None, obj
+    else:
+        raise TypeError('to_dataframe() takes Ofx, Account and statement '
+                        'objects, not %s' % type(obj).__name__)
+
+
+class Chunks(object):
+    """
+    The values of one field across statements, as the numpy arrays or
+    lists that each statement gives.
+    """
+
+    def __init__(self, name, decimals):
+        self.name = name
+        self.decimals = decimals
+        self.chunks = []
+
+    def add(self, rows, count):
+        if isinstance(rows, Table):
+            # The rows of a table have no attributes but its columns.
+            column = rows.columns.get(self.name)
+            if column is None:
+                values = [None] * count
+            elif isinstance(column, ObjectColumn):
+                values = column.values
+            elif isinstance(column, DateColumn) and not column.others or \
+                    isinstance(column, DecimalColumn) and \
+                    self.decimals == 'float':
+                values = column.to_numpy()
+            else:
+                values = [column[i] for i in range(count)]
+        else:
+            try:
+                values = list(map(operator.attrgetter(self.name), rows))
+            except AttributeError:
+                # Some rows do not have the attribute.
+                values = [getattr(row, self.name, None) for row in rows]
+        self.chunks.append(values)
+
+    def dtype(self):
+        if self.name in DATE_FIELDS:
+            return 'datetime64[us]'
+        if self.name in DECIMAL_FIELDS and self.decimals == 'float':
+            return 'float64'
+        return object
+
+    def column(self, np, pd):
+        """
+        Return the values as one array, or a Categorical.
+        """
+        dtype = self.dtype()
+        arrays = []
+        for chunk in self.chunks:
+            if isinstance(chunk, np.ndarray):
+                arrays.append(chunk)
+            elif dtype == 'float64':
+                arrays.append(np.array([to_float(value) for value in chunk],
+                                       dtype=dtype))
+            elif dtype == 'datetime64[us]':
+                arrays.append(np.asarray(pd.DatetimeIndex(chunk), dtype=dtype))
+            elif dtype is object:
+                # Filled in place, so tuples and the like stay values.
+                array = np.empty(len(chunk), dtype=object)
+                array[:] = chunk
+                arrays.append(array)
+        array = np.concatenate(arrays) if arrays else np.array([], dtype)
+        if self.name in CATEGORICAL_FIELDS:
+            return pd.Categorical(array)
+        return array
+
+
+def to_float(value):
+    if value is None:
+        return float('nan')
+    return float(value)
+
+
+def to_dataframe(obj, positions=False, decimals='decimal'):
+    """
+    Build a pandas DataFrame of the transactions (or, if positions is True,
+    the positions) in obj: an Ofx, an Account, a Statement or an
+    InvestmentStatement, a list of them, or a dict mapping the name of
+    each source, such as a file name, to one of them.
+
+    Each row also has the account id and the statement's currency, and
+    with a dict, the source name.  Investment transaction fields are
+    included when there are investment statements.  Dates are datetime64
+    columns.  Amounts are exact Decimals, or floats if decimals is
+    'float'.
+    """
+    if decimals not in ('decimal', 'float'):
+        raise ValueError("decimals must be 'decimal' or 'float', not %r"
+                         % (decimals,))
+    np, pd = import_pandas()
+    statements = list(iter_statements(obj))
+
+    fields = ['account', 'currency']
+    if isinstance(obj, dict):
+        fields.insert(0, 'source')
+    if positions:
+        fields += POSITION_FIELDS
+    else:
+        fields += TRANSACTION_FIELDS
+        if any(isinstance(statement, InvestmentStatement)
+               for _, _, statement in statements):
+            fields += INVESTMENT_TRANSACTION_FIELDS
+    chunks = [Chunks(name, decimals) for name in fields]
+
+    for source, account, statement in statements:
+        if positions:
+            rows = getattr(statement, 'positions', [])
+        else:
+            rows = statement.transactions
+        count = len(rows)
+        if not count:
+            continue
+        account_id = account.account_id if account is not None else None
+        currency = getattr(statement, 'currency', '') or \
+            (getattr(account, 'curdef', None) if account is not None
+             else None)
+        for chunk in chunks:
+            if chunk.name == 'source':
+                chunk.chunks.append([source] * count)
+            elif chunk.name == 'account':
+                chunk.chunks.append([account_id] * count)
+            elif chunk.name == 'currency':
+                chunk.chunks.append([currency] * count)
+            else:
+                chunk.add(rows, count)
+
+    return pd.DataFrame(dict((chunk.name, chunk.column(np, pd))
+                             for chunk in chunks), columns=fields)
+
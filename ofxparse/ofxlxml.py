@@ -0,0 +1,183 @@
+"""
+An lxml backed tree builder for OfxParser.
+
+The (preprocessed) document is parsed with lxml's recovering XML parser,
+and the resulting elements are wrapped in LxmlTag, which offers the same
+subset of the BeautifulSoup Tag API as ofxparse.ofxtree.OfxTag, so the
+parse* methods work on it unchanged.
+"""
+from __future__ import absolute_import
+
+import re
+
+import six
+from six.moves.html_entities import name2codepoint
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+
+XML_ENTITIES = frozenset(['amp', 'lt', 'gt', 'quot', 'apos'])
+
+# How much text lxml_maker feeds the parser at a time.
+CHUNK_SIZE = 1024 * 1024
+
+ENTITY_RE = re.compile(
+    r'&(?:([a-zA-Z][a-zA-Z0-9]*);|#[0-9]+;|#[xX][0-9a-fA-F]+;)?')
+
+
+def fix_entity(match):
+    name = match.group(1)
+    if match.group(0) == '&':
+        # A bare ampersand, which SGML allows but XML does not.
+        return '&amp;'
+    if name is None or name in XML_ENTITIES:
+        return match.group(0)
+    if name in name2codepoint:
+        return '&#%d;' % name2codepoint[name]
+    return '&amp;' + name + ';'
+
+
+@six.python_2_unicode_compatible
+class LxmlTag(object):
+    __slots__ = ('element',)
+
+    def __init__(self, element):
+        self.element = element
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return isinstance(other, LxmlTag) and other.element is self.element
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.element)
+
+    def __iter__(self):
+        return iter(self.contents)
+
+    def __len__(self):
+        return len(self.contents)
+
+    def __str__(self):
+        return etree.tostring(self.element, encoding=six.text_type,
+                              with_tail=False)
+
+    def __repr__(self):
+        return '<LxmlTag %s>' % self.name
+
+    @property
+    def name(self):
+        return self.element.tag
+
+    @property
+    def sourceline(self):
+        return self.element.sourceline
+
+    @property
+    def contents(self):
+        element = self.element
+        contents = [element.text] if element.text is not None else []
+        for child in element:
+            if isinstance(child.tag, six.string_types):
+                contents.append(LxmlTag(child))
+            if child.tail is not None:
+                contents.append(child.tail)
+        return contents
+
+    @property
+    def descendants(self):
+        for node in self.contents:
+            yield node
+            if isinstance(node, LxmlTag):
+                for descendant in node.descendants:
+                    yield descendant
+
+    def iter_tags(self, name=None):
+        if name is None:
+            names = ()
+        elif isinstance(name, six.string_types):
+            names = (name,)
+        else:
+            names = tuple(name)
+        for element in self.element.iterdescendants(*names):
+            if isinstance(element.tag, six.string_types):
+                yield LxmlTag(element)
+
+    def find(self, name):
+        for tag in self.iter_tags(name):
+            return tag
+        return None
+
+    def findAll(self, name):
+        return list(self.iter_tags(name))
+
+    find_all = findAll
+
+
+def split_chunks(text, size=CHUNK_SIZE):
+    """
+    Yield text in pieces of about size characters, with the entities XML
+    understands.  Pieces end before a tag, so no entity is split.
+    """
+    start = 0
+    while start < len(text):
+        end = text.find('<', start + size)
+        if end < 0:
+            end = len(text)
+        chunk = text[start:end]
+        if '&' in chunk:
+            chunk = ENTITY_RE.sub(fix_entity, chunk)
+        yield chunk
+        start = end
+
+
+def lxml_maker(fh):
+    """
+    Build an LxmlTag tree from a preprocessed text stream or string, or
+    the chunks of one that ofxparse.ofxparse.iter_close_tags yields.
+    """
+    if etree is None:
+        raise ImportError('The lxml backend requires lxml to be installed')
+    if isinstance(fh, six.string_types):
+        chunks = [fh]
+    elif hasattr(fh, 'read'):
+        chunks = [fh.read()]
+    else:
+        chunks = fh
+
+    parser = etree.XMLParser(recover=True, huge_tree=True,
+                             resolve_entities=False, remove_comments=True,
+                             remove_pis=True, encoding='utf-8')
+    started = False
+    for text in chunks:
+        if not started:
+            # Skip the SGML headers.
+            start = text.find('<')
+            if start < 0:
+                continue
+            text = text[start:]
+            started = True
+        for chunk in split_chunks(text):
+            parser.feed(chunk.encode('utf-8'))
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        root = None
+
+    document = etree.Element('document')
+    if root is not None:
+        document.append(root)
+        for element in document.iter():
+            if isinstance(element.tag, six.string_types):
+                # Without the {namespace} an OFX 2.x root may declare.
+                element.tag = etree.QName(element).localname.lower()
+    return LxmlTag(document)
@@ -7,11 +7,17 @@ import codecs
 import re
 import collections
 import contextlib
+import copy
+import io
+import itertools
+import mmap
 
 try:
-    from StringIO import StringIO
+    from functools import lru_cache
 except ImportError:
-    from io import StringIO
+    # Python 2 goes without the cache.
+    def lru_cache(maxsize):
+        return lambda func: func
 
 try:
     from collections.abc import Iterable
@@ -20,17 +26,43 @@ except ImportError:
 
 import six
 from . import mcc
+from .compression import (decompressed, detect as detect_compression,
+                          ofx_members, open_archive)
+from .ofxtree import (MappedDocument, OfxTag, escape, is_ascii_compatible,
+                      mapped_tree_maker, tree_maker, xml_tree_maker)
 
 odict = collections
 
-try:
-    from bs4 import BeautifulSoup
+_soup_maker = None
+
+
+def load_soup_maker():
+    """
+    Import BeautifulSoup, which is only done when the beautifulsoup backend
+    is first used, and return the function building a tree with it.
+    """
+    global _soup_maker
+    if _soup_maker is None:
+        try:
+            from bs4 import BeautifulSoup
+
+            def bs4_maker(fh):
+                return BeautifulSoup(fh, 'html.parser')
+            _soup_maker = bs4_maker
+        except ImportError:
+            from BeautifulSoup import BeautifulStoneSoup
+            _soup_maker = BeautifulStoneSoup
+    return _soup_maker
+
+
+def soup_maker(fh):
+    return load_soup_maker()(fh)
 
-    def soup_maker(fh):
-        return BeautifulSoup(fh, 'html.parser')
-except ImportError:
-    from BeautifulSoup import BeautifulStoneSoup
-    soup_maker = BeautifulStoneSoup
+
+def lxml_maker(fh):
+    # lxml is only imported when the lxml backend is first used.
+    from .ofxlxml import lxml_maker
+    return lxml_maker(fh)
 
 
 def try_decode(string, encoding):
@@ -45,6 +77,108 @@ def is_iterable(candidate):
     return isinstance(candidate, Iterable)
 
 
+class TextBuffer(object):
+    """
+    A read-only text stream over a string.  Unlike StringIO, which copies
+    the string into a buffer of its own, it hands out slices of the string,
+    and reading all of it returns the string itself.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def read(self, size=-1):
+        start = self.pos
+        if size is None or size < 0:
+            self.pos = len(self.text)
+        else:
+            self.pos = min(start + size, len(self.text))
+        # A slice of the whole string is the string.
+        return self.text[start:self.pos]
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, pos, whence=0):
+        if whence == 1:
+            pos += self.pos
+        elif whence == 2:
+            pos += len(self.text)
+        self.pos = max(0, min(pos, len(self.text)))
+        return self.pos
+
+
+# How much of the start of a document OfxFile reads its headers from.
+HEAD_SIZE = 1024 * 10
+
+
+def is_seekable(fh):
+    """
+    Return whether fh can seek, which pipes, sockets and the like cannot,
+    though their file objects have a seek method.
+    """
+    if not hasattr(fh, 'seek'):
+        return False
+    seekable = getattr(fh, 'seekable', None)
+    return seekable is None or seekable()
+
+
+class LookaheadStream(object):
+    """
+    A forward-only stream, such as a pipe, a socket or an HTTP response,
+    with its first size bytes (or characters) kept, so that it can seek
+    back within them until it is read past them.  That lets OfxFile sniff
+    the encoding and headers without the stream being spooled anywhere.
+    """
+
+    def __init__(self, fh, size=HEAD_SIZE):
+        self.fh = fh
+        self.head = fh.read(size)
+        # Streams may return less than asked for before the end.
+        while len(self.head) < size:
+            more = fh.read(size - len(self.head))
+            if not more:
+                break
+            self.head += more
+        self.pos = 0
+
+    def read(self, size=-1):
+        head = self.head
+        start = self.pos
+        if start >= len(head):
+            data = self.fh.read() if size is None or size < 0 \
+                else self.fh.read(size)
+        elif size is None or size < 0:
+            data = head[start:] + self.fh.read()
+        elif start + size <= len(head):
+            data = head[start:start + size]
+        else:
+            data = head[start:] + self.fh.read(start + size - len(head))
+        self.pos += len(data)
+        if self.pos > len(head):
+            # There is no going back now.
+            self.head = head[:0]
+        return data
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, pos, whence=0):
+        if whence == 1:
+            pos += self.pos
+        if whence not in (0, 1) or self.pos > len(self.head) or \
+                not 0 <= pos <= len(self.head):
+            raise io.UnsupportedOperation(
+                'can only seek within the first %d bytes of a stream '
+                'that cannot seek' % len(self.head))
+        self.pos = pos
+        return pos
+
+    def seekable(self):
+        return False
+
+
 @contextlib.contextmanager
 def save_pos(fh):
     """
@@ -59,24 +193,141 @@ def save_pos(fh):
         fh.seek(orig_pos)
 
 
+def first_tags(tag, names):
+    """
+    Walk the subtree below tag once, and return a dict mapping each of
+    names to its first descendant of that name, which is what
+    tag.find(name) would return.  Names that do not occur are left out.
+    """
+    found = {}
+    for node in tag.descendants:
+        name = getattr(node, 'name', None)
+        if name in names and name not in found:
+            found[name] = node
+            if len(found) == len(names):
+                break
+    return found
+
+
+def iter_aggregates(tag, names):
+    """
+    Yield the elements below tag whose name is in names, in document order,
+    without looking inside the elements it yields.
+    """
+    stack = tag.contents[::-1]
+    while stack:
+        node = stack.pop()
+        name = getattr(node, 'name', None)
+        if name in names:
+            yield node
+        elif name is not None:
+            stack.extend(node.contents[::-1])
+
+
+TAG_RE = re.compile(r'<(/?)([a-z0-9_\.]+)[^<>]*>', re.IGNORECASE)
+
+
+class TagScanner(object):
+    """
+    Split OFX text, fed to it a piece at a time, into ('open', name, text)
+    and ('close', name, text) events for every tag, where text is the
+    character data up to the next tag.  Aggregates named in aggregates are
+    not broken up: once one closes, its raw text is returned whole as
+    ('aggregate', name, raw).  Only the unconsumed tail of the text is
+    buffered, so memory is bounded by the size of the pieces plus the
+    largest aggregate.
+    """
+
+    def __init__(self, aggregates):
+        self.aggregates = aggregates
+        self.buf = ''
+        self.pos = 0
+        self.start = None  # offset of the aggregate being captured
+        self.name = None
+        self.depth = 0
+
+    def feed(self, text, eof=False):
+        """
+        Add text, which is the last of the document if eof is True, and
+        return the events it completes.
+        """
+        keep = self.pos if self.start is None else self.start
+        buf = self.buf = self.buf[keep:] + text
+        pos = self.pos - keep
+        start = None if self.start is None else 0
+        name, depth = self.name, self.depth
+        aggregates = self.aggregates
+        events = []
+        while True:
+            match = TAG_RE.search(buf, pos)
+            text_end = buf.find('<', match.end()) if match else -1
+            if match is None or (text_end == -1 and not eof):
+                break
+
+            if text_end == -1:
+                text_end = len(buf)
+            is_closing = match.group(1) == '/'
+            tag = match.group(2).lower()
+            pos = match.end()
+
+            if start is not None:
+                if tag == name:
+                    depth += -1 if is_closing else 1
+                    if depth == 0:
+                        events.append(('aggregate', name, buf[start:pos]))
+                        start = None
+            elif not is_closing and tag in aggregates:
+                start, name, depth = match.start(), tag, 1
+            else:
+                events.append((('close' if is_closing else 'open'), tag,
+                               buf[pos:text_end]))
+
+        self.pos, self.start, self.name, self.depth = pos, start, name, depth
+        return events
+
+
+# OFX 2.x documents are XML, with their headers in a processing instruction:
+# <?xml version="1.0"?><?OFX OFXHEADER="200" VERSION="211" ...?>
+XML_PROLOG_RE = re.compile(six.b(r'(?:\xef\xbb\xbf)?\s*<\?xml\s'))
+XML_ENCODING_RE = re.compile(six.b(
+    r'(?:\xef\xbb\xbf)?\s*<\?xml\s[^>]*?encoding\s*=\s*["\']([\w.:-]+)'))
+OFX_PI_RE = re.compile(six.b(r'<\?OFX\s([^>]*?)\??>'), re.IGNORECASE)
+PI_ATTRIBUTE_RE = re.compile(
+    six.b(r'([\w.]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')'))
+
+
 class OfxFile(object):
     def __init__(self, fh):
         """
-        fh should be a seekable file-like byte stream object
+        fh should be a file-like byte stream object.  One that cannot seek
+        is read through a LookaheadStream, one that is compressed is
+        decompressed as it is read, and a text stream is read as it is,
+        without being encoded and decoded again.
         """
         self.headers = odict.OrderedDict()
         self.fh = fh
+        self.text = False
+        self.xml = False
+        self.xml_encoding = None
+        self.encoding = None
 
-        if not is_iterable(self.fh):
-            return
-        if not hasattr(self.fh, "seek"):
+        if not hasattr(self.fh, "read"):
             return  # fh is not a file object, we're doomed.
-
-        # If the file handler is text stream, convert to bytes one:
+        seekable = is_seekable(self.fh)
+        if not seekable:
+            self.fh = LookaheadStream(self.fh)
+        compression = detect_compression(self.fh)
+        if compression is not None:
+            self.fh = decompressed(self.fh, compression)
+            if not seekable:
+                # Seeking back in the decompressed data would seek back in
+                # the compressed stream.
+                self.fh = LookaheadStream(self.fh)
+
+        # A text stream is already decoded, and is not encoded again.
         first = self.fh.read(1)
         self.fh.seek(0)
-        if not isinstance(first, bytes):
-            self.fh = six.BytesIO(six.b(self.fh.read()))
+        self.text = not isinstance(first, bytes)
 
         with save_pos(self.fh):
             self.read_headers()
@@ -84,7 +335,12 @@ class OfxFile(object):
             self.replace_NONE_headers()
 
     def read_headers(self):
-        head_data = self.fh.read(1024 * 10)
+        head_data = self.fh.read(HEAD_SIZE)
+        if not isinstance(head_data, bytes):
+            head_data = head_data.encode('utf-8')
+        if XML_PROLOG_RE.match(head_data):
+            self.read_xml_headers(head_data)
+            return
         head_data = head_data[:head_data.find(six.b('<'))]
 
         for line in head_data.splitlines():
@@ -97,6 +353,22 @@ class OfxFile(object):
 
             self.headers[header] = value
 
+    def read_xml_headers(self, head_data):
+        """
+        Read the headers of an OFX 2.x document from the attributes of its
+        OFX processing instruction.
+        """
+        self.xml = True
+        declaration = XML_ENCODING_RE.match(head_data)
+        if declaration:
+            self.xml_encoding = declaration.group(1).decode('ascii')
+        ofx_pi = OFX_PI_RE.search(head_data)
+        if ofx_pi:
+            for header, double_quoted, single_quoted in \
+                    PI_ATTRIBUTE_RE.findall(ofx_pi.group(1)):
+                value = double_quoted or single_quoted
+                self.headers[header.upper()] = value.strip()
+
     def handle_encoding(self):
         """
         Decode the headers and wrap self.fh in a decoder such that it
@@ -116,8 +388,12 @@ class OfxFile(object):
         if not enc_type:
             # no encoding specified, use the ascii-decoded headers
             self.headers = ascii_headers
-            # decode the body as ascii as well
-            self.fh = codecs.lookup('ascii').streamreader(self.fh)
+            # decode the body as the XML declaration says, or ascii
+            try:
+                codec = codecs.lookup(self.xml_encoding or 'ascii')
+            except LookupError:
+                codec = codecs.lookup('ascii')
+            self.decode_with(codec)
             return
 
         if enc_type == "USASCII":
@@ -130,9 +406,7 @@ class OfxFile(object):
         elif enc_type in ("UNICODE", "UTF-8"):
             encoding = "utf-8"
 
-        codec = codecs.lookup(encoding)
-
-        self.fh = codec.streamreader(self.fh)
+        self.decode_with(codecs.lookup(encoding))
 
         # Decode the headers using the encoding
         self.headers = odict.OrderedDict(
@@ -140,6 +414,29 @@ class OfxFile(object):
             for key, value in six.iteritems(self.headers)
         )
 
+    def decode_with(self, codec):
+        """
+        Have self.fh return text decoded by codec, unless it already does.
+        """
+        self.encoding = codec.name
+        if not self.text:
+            self.fh = codec.streamreader(self.fh)
+
+    def read(self):
+        """
+        Return the (rest of the) document as text and let go of it, so
+        that the caller has the only copy.
+        """
+        fh, self.fh = self.fh, None
+        return fh.read()
+
+    @staticmethod
+    def preprocess(text):
+        """
+        Return the document text as the tree builder should see it.
+        """
+        return text
+
     def replace_NONE_headers(self):
         """
         Any headers that indicate 'none' should be replaced with Python
@@ -150,6 +447,71 @@ class OfxFile(object):
                 self.headers[header] = None
 
 
+CLOSING_TAG_RE = re.compile(r'</([a-z0-9_\.]+)>', re.IGNORECASE)
+SIMPLE_TAG_RE = re.compile(r'<(/?)([a-z0-9_\.]+)>', re.IGNORECASE)
+
+# How many pieces of its output close_tags joins at a time.
+CHUNK_PIECES = 4096
+
+
+def close_tags(ofx_string):
+    """
+    Return ofx_string with an explicit closing tag added after every
+    element that is never closed anywhere in the string (SGML-style leaf
+    elements), leaving all other data intact.
+    """
+    return ''.join(iter_close_tags(ofx_string))
+
+
+def iter_close_tags(ofx_string, chunk_pieces=CHUNK_PIECES):
+    """
+    Yield the text close_tags returns a chunk at a time, each joined from
+    chunk_pieces of the pieces of text and markup it is made up of.
+    """
+    # find all closing tags as hints
+    closing_tags = set(name.upper()
+                       for name in CLOSING_TAG_RE.findall(ofx_string))
+
+    # close all tags that don't have closing tags and
+    # leave all other data intact.  The pieces are joined into chunks as
+    # they come, as a list of all of them takes many times the memory of
+    # the text.
+    out = []
+    write = out.append
+    last_open_tag = None
+    pos = 0
+    for match in SIMPLE_TAG_RE.finditer(ofx_string):
+        start = match.start()
+        if start > pos:
+            text = ofx_string[pos:start]
+            # Markup other than a simple tag (a processing instruction,
+            # a tag with attributes) also ends the open element, but a
+            # CDATA section is part of its content.
+            if last_open_tag is not None and text.startswith('<') \
+                    and not text.startswith('<!'):
+                write('</%s>' % last_open_tag)
+                last_open_tag = None
+            write(text)
+        if last_open_tag is not None:
+            write('</%s>' % last_open_tag)
+            last_open_tag = None
+        tag_name = match.group(2)
+        if not match.group(1) and tag_name.upper() not in closing_tags:
+            last_open_tag = tag_name
+        write(match.group(0))
+        pos = match.end()
+        if len(out) >= chunk_pieces:
+            yield ''.join(out)
+            del out[:]
+
+    text = ofx_string[pos:]
+    if last_open_tag is not None and text.startswith('<') \
+            and not text.startswith('<!'):
+        write('</%s>' % last_open_tag)
+    write(text)
+    yield ''.join(out)
+
+
 class OfxPreprocessedFile(OfxFile):
     def __init__(self, fh):
         super(OfxPreprocessedFile, self).__init__(fh)
@@ -157,35 +519,61 @@ class OfxPreprocessedFile(OfxFile):
         if self.fh is None:
             return
 
-        ofx_string = self.fh.read()
-
-        # find all closing tags as hints
-        closing_tags = [t.upper() for t in re.findall(r'(?i)</([a-z0-9_\.]+)>',
-                                                      ofx_string)]
-
-        # close all tags that don't have closing tags and
-        # leave all other data intact
-        last_open_tag = None
-        tokens = re.split(r'(?i)(</?[a-z0-9_\.]+>)', ofx_string)
-        new_fh = StringIO()
-        for token in tokens:
-            is_closing_tag = token.startswith('</')
-            is_processing_tag = token.startswith('<?')
-            is_cdata = token.startswith('<!')
-            is_tag = token.startswith('<') and not is_cdata
-            is_open_tag = is_tag and not is_closing_tag \
-                and not is_processing_tag
-            if is_tag:
-                if last_open_tag is not None:
-                    new_fh.write("</%s>" % last_open_tag)
-                    last_open_tag = None
-            if is_open_tag:
-                tag_name = re.findall(r'(?i)<([a-z0-9_\.]+)>', token)[0]
-                if tag_name.upper() not in closing_tags:
-                    last_open_tag = tag_name
-            new_fh.write(token)
-        new_fh.seek(0)
-        self.fh = new_fh
+        self.fh = TextBuffer(close_tags(self.fh.read()))
+        self.text = True
+
+    preprocess = staticmethod(close_tags)
+
+
+class OfxPreprocessedChunks(OfxPreprocessedFile):
+    """
+    An OfxPreprocessedFile for tree builders that can take the text a
+    chunk at a time, so the whole of the preprocessed text is never held.
+    """
+    preprocess = staticmethod(iter_close_tags)
+
+
+# The file objects of files on disk, which can be mapped into memory.
+DISK_FILE_TYPES = (io.FileIO, io.BufferedReader, io.BufferedRandom)
+if six.PY2:
+    DISK_FILE_TYPES += (six.moves.builtins.file,)
+
+
+class OfxMappedFile(OfxFile):
+    """
+    An OfxFile that maps a file on disk into memory rather than reading
+    it: read() returns a MappedDocument for mapped_tree_maker, which
+    tokenizes the bytes in place.  The operating system's page cache
+    serves repeated parses of the file, and processes parsing it share
+    its pages.  Other streams, and encodings that are not ASCII
+    compatible, are read as text.
+    """
+
+    def read(self):
+        fh = self.fh
+        stream = getattr(fh, 'stream', None)
+        if isinstance(stream, DISK_FILE_TYPES) and \
+                is_ascii_compatible(self.encoding):
+            try:
+                buffer = mmap.mmap(stream.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                # An empty file, or one that cannot be mapped.
+                pass
+            else:
+                self.fh = None
+                return MappedDocument(buffer, self.encoding)
+        return super(OfxMappedFile, self).read()
+
+
+# Parser backends: the OfxFile class that reads the document, and the
+# function that builds the tree the parse* methods walk.
+BACKENDS = {
+    'beautifulsoup': (OfxPreprocessedFile, soup_maker),
+    'native': (OfxFile, tree_maker),
+    'lxml': (OfxPreprocessedChunks, lxml_maker),
+    'mmap': (OfxMappedFile, mapped_tree_maker),
+}
 
 
 class Ofx(object):
@@ -197,12 +585,62 @@ class Ofx(object):
 #
 #        return headers + str(self.signon)
 
+    def to_dataframe(self, positions=False, decimals='decimal'):
+        '''
+        Return a pandas DataFrame of the transactions of all the accounts;
+        see ofxparse.ofxframe.to_dataframe.
+        '''
+        from .ofxframe import to_dataframe
+        return to_dataframe(self, positions, decimals)
+
 
 class AccountType(object):
     (Unknown, Bank, CreditCard, Investment) = range(0, 4)
 
 
+# Statement aggregates and the type of account each one describes.
+STATEMENT_ACCOUNT_TYPES = {
+    'stmtrs': AccountType.Bank,
+    'ccstmtrs': AccountType.CreditCard,
+    'invstmtrs': AccountType.Investment,
+}
+
+# Account identification elements and the Account attribute they fill.
+ACCOUNT_FIELDS = {
+    'acctid': 'account_id',
+    'bankid': 'routing_number',
+    'branchid': 'branch_id',
+    'accttype': 'account_type',
+    'brokerid': 'brokerid',
+    'curdef': 'curdef',
+}
+
+# The elements of a position aggregate that parseInvestmentPosition reads.
+POSITION_TAGS = frozenset([
+    'uniqueid', 'units', 'unitprice', 'mktval', 'dtpriceasof',
+])
+
+# The elements of an investment transaction aggregate that
+# parseInvestmentTransaction reads.
+INVESTMENT_TRANSACTION_TAGS = frozenset([
+    'fitid', 'memo', 'dttrade', 'dtsettle', 'uniqueid', 'incometype',
+    'units', 'unitprice', 'commission', 'fees', 'total', 'inv401ksource',
+    'tferaction',
+])
+
+# The elements of a STMTTRN aggregate that parseTransaction reads.
+TRANSACTION_TAGS = frozenset([
+    'trntype', 'name', 'memo', 'trnamt', 'dtposted', 'dtuser', 'fitid',
+    'sic', 'checknum',
+])
+
+
 class Account(object):
+    # Set only when the document has them: desc, brokerid.
+    __slots__ = ('curdef', 'statement', 'account_id', 'routing_number',
+                 'branch_id', 'account_type', 'institution', 'type',
+                 'warnings', 'desc', 'brokerid')
+
     def __init__(self):
         self.curdef = None
         self.statement = None
@@ -222,19 +660,25 @@ class Account(object):
 
 
 class InvestmentAccount(Account):
+    __slots__ = ()
+
     def __init__(self):
         super(InvestmentAccount, self).__init__()
         self.brokerid = ''
 
 
-class BrokerageBalance:
+class BrokerageBalance(object):
+    __slots__ = ('name', 'description', 'value')
+
     def __init__(self):
         self.name = None
         self.description = None
         self.value = None  # decimal
 
 
-class Security:
+class Security(object):
+    __slots__ = ('uniqueid', 'name', 'ticker', 'memo')
+
     def __init__(self, uniqueid, name, ticker, memo):
         self.uniqueid = uniqueid
         self.name = name
@@ -288,6 +732,12 @@ class Signon:
 
 
 class Statement(object):
+    # Set only when the document has them: balance, balance_date,
+    # available_balance, available_balance_date.
+    __slots__ = ('start_date', 'end_date', 'currency', 'transactions',
+                 'discarded_entries', 'warnings', 'balance', 'balance_date',
+                 'available_balance', 'available_balance_date')
+
     def __init__(self):
         self.start_date = ''
         self.end_date = ''
@@ -297,8 +747,22 @@ class Statement(object):
         self.discarded_entries = []
         self.warnings = []
 
+    def to_dataframe(self, positions=False, decimals='decimal'):
+        '''
+        Return a pandas DataFrame of the transactions; see
+        ofxparse.ofxframe.to_dataframe.
+        '''
+        from .ofxframe import to_dataframe
+        return to_dataframe(self, positions, decimals)
+
 
 class InvestmentStatement(object):
+    # Set only when the document has them: all but the first four.
+    __slots__ = ('positions', 'transactions', 'discarded_entries', 'warnings',
+                 'start_date', 'end_date', 'currency', 'available_cash',
+                 'margin_balance', 'short_balance', 'buy_power',
+                 'balance_list')
+
     def __init__(self):
         self.positions = []
         self.transactions = []
@@ -306,8 +770,19 @@ class InvestmentStatement(object):
         self.discarded_entries = []
         self.warnings = []
 
+    def to_dataframe(self, positions=False, decimals='decimal'):
+        '''
+        Return a pandas DataFrame of the transactions or positions; see
+        ofxparse.ofxframe.to_dataframe.
+        '''
+        from .ofxframe import to_dataframe
+        return to_dataframe(self, positions, decimals)
+
 
 class Transaction(object):
+    __slots__ = ('payee', 'type', 'date', 'user_date', 'amount', 'id', 'memo',
+                 'sic', 'mcc', 'checknum')
+
     def __init__(self):
         self.payee = ''
         self.type = ''
@@ -332,6 +807,11 @@ class InvestmentTransaction(object):
                        'selldebt', 'sellmf', 'sellopt', 'sellother',
                        'sellstock', 'split', 'transfer']
 
+    # Set only when the document has them: id, inv401ksource.
+    __slots__ = ('type', 'id', 'tradeDate', 'settleDate', 'memo', 'security',
+                 'income_type', 'units', 'unit_price', 'commission', 'fees',
+                 'total', 'tferaction', 'inv401ksource')
+
     def __init__(self, type):
         self.type = type.lower()
         self.tradeDate = None
@@ -352,6 +832,11 @@ class InvestmentTransaction(object):
 
 
 class Position(object):
+    AGGREGATE_TYPES = ['posmf', 'posstock', 'posopt', 'posother', 'posdebt']
+
+    # Set only when the document has it: date.
+    __slots__ = ('security', 'units', 'unit_price', 'market_value', 'date')
+
     def __init__(self):
         self.security = ''
         self.units = decimal.Decimal(0)
@@ -360,6 +845,8 @@ class Position(object):
 
 
 class Institution(object):
+    __slots__ = ('organization', 'fid')
+
     def __init__(self):
         self.organization = ''
         self.fid = ''
@@ -369,42 +856,695 @@ class OfxParserException(Exception):
     pass
 
 
-class OfxParser(object):
+# The text of each kind of ErrorRecord.
+ERROR_MESSAGES = {
+    'empty_acctid': six.u('Empty acctid tag for %(snippet)s'),
+    'empty_brokerid': six.u('Empty brokerid tag for %(snippet)s'),
+    'empty_start_date': six.u('Statement start date was empty for '
+                              '%(snippet)s'),
+    'invalid_start_date': six.u('Statement start date was not allowed '
+                                '(%(detail)s) for %(snippet)s'),
+    'empty_end_date': six.u('Statement end date was empty for %(snippet)s'),
+    'invalid_end_date': six.u('Statement end date was not allowed '
+                              '(%(detail)s) for %(snippet)s'),
+    'empty_currency': six.u('Currency definition was empty for %(snippet)s'),
+    'empty_balance': six.u('%(detail)s balance amount was empty for '
+                           '%(snippet)s'),
+    'empty_balance_date': six.u('%(detail)s balance date was empty for '
+                                '%(snippet)s'),
+    'invalid_balance_date': six.u('%(detail)s balance date was not allowed '
+                                  'for %(snippet)s'),
+    'invalid_transaction': six.u('%(tag)s: %(detail)s'),
+    'discarded_transaction': six.u('%(detail)s'),
+    'invalid_position': six.u('Error parsing positions: %(detail)s'),
+}
+
+# How much of an element's markup an ErrorRecord keeps.
+SNIPPET_LENGTH = 120
+
+
+def markup_snippet(tag, limit=SNIPPET_LENGTH):
+    """
+    Return the markup of tag, as str() gives it, but cut off after limit
+    characters, so that only that much of the subtree is serialized.
+    """
+    parts = [six.u('<%s>') % tag.name]
+    length = len(parts[0])
+    stack = [(iter(tag.contents), six.u('</%s>') % tag.name)]
+    while stack and length <= limit:
+        nodes, end = stack[-1]
+        node = next(nodes, None)
+        if node is None:
+            stack.pop()
+            text = end
+        elif isinstance(node, six.string_types):
+            text = escape(node)
+        else:
+            text = six.u('<%s>') % node.name
+            stack.append((iter(node.contents), six.u('</%s>') % node.name))
+        parts.append(text)
+        length += len(text)
+    text = six.u('').join(parts)
+    if stack or length > limit:
+        return text[:limit] + six.u('...')
+    return text
+
+
+class ErrorRecord(six.text_type):
+    """
+    A warning, or an entry discarded, while parsing with fail_fast off.
+
+    A record is the text of its message, so it can be used like the
+    strings warnings used to hold, but it does not hold on to the element
+    it is about, which would keep the whole document tree alive.  It also
+    has the kind of problem (code, a key of ERROR_MESSAGES), the element's
+    name (tag), where the element starts in the source if the tree builder
+    tracks that (line, or the character offset), the first SNIPPET_LENGTH
+    characters of its markup (snippet) and any further detail, such as the
+    exception raised.
+    """
+
+    def __new__(cls, code, tag=None, detail=None, snippet=None, line=None,
+                offset=None):
+        record = six.text_type.__new__(cls, ERROR_MESSAGES[code] % {
+            'tag': tag, 'detail': detail, 'snippet': snippet})
+        record.code = code
+        record.tag = tag
+        record.detail = detail
+        record.snippet = snippet
+        record.line = line
+        record.offset = offset
+        return record
+
+    def __getnewargs__(self):
+        return (self.code, self.tag, self.detail, self.snippet, self.line,
+                self.offset)
+
     @classmethod
-    def parse(cls, file_handle, fail_fast=True, custom_date_format=None):
+    def about(cls, code, element, detail=None):
+        """
+        Make a record of a problem with element, a tag of any of the trees.
+        """
+        return cls(code, element.name, detail, markup_snippet(element),
+                   getattr(element, 'sourceline', None),
+                   element.offset if isinstance(element, OfxTag) else None)
+
+    def entry(self):
+        """
+        Return the dict discarded_entries holds for the record: the record
+        as 'error', and the markup as 'content'.
+        """
+        return {'error': self, 'content': self.snippet}
+
+
+# Where a document in a stream of several starts its body, ends, and where
+# the header block of the next one may start without its end before it.
+BODY_START_RE = re.compile(r'<OFX\s*>', re.IGNORECASE)
+BODY_END_RE = re.compile(r'</OFX\s*>', re.IGNORECASE)
+HEADER_START_RE = re.compile(r'OFXHEADER\s*:|<\?xml[\s?]', re.IGNORECASE)
+DOCUMENT_MARKS = {
+    six.text_type: (BODY_START_RE, BODY_END_RE, HEADER_START_RE),
+    bytes: tuple(re.compile(pattern.pattern.encode('ascii'), re.IGNORECASE)
+                 for pattern in (BODY_START_RE, BODY_END_RE,
+                                 HEADER_START_RE)),
+}
+
+# How much of what was fed before a piece is searched with it, so that
+# marks split between pieces are found.
+MARK_OVERLAP = 64
+
+
+class DocumentSplitter(object):
+    """
+    The incremental core of OfxParser.iter_parse: feed it a stream that
+    holds one or more OFX documents one after the other, each with its
+    own header block, a piece at a time, and it yields the bytes (or
+    text) of each document the piece completes.  A document ends after
+    its </OFX> tag, or where the header block of the next one starts.
+    Only the document being read is kept.
+    """
+
+    def __init__(self):
+        self.pieces = []  # of the current document, before tail
+        self.tail = None  # the end of what was fed, searched again
+        self.pos = 0  # where in tail the search goes on
+        self.body = False  # the current document's <OFX> has been seen
+
+    def feed(self, data, eof=False):
+        """
+        Add data, which is the last of the stream if eof is True, and
+        yield the documents it completes.
+        """
+        if self.tail is None:
+            self.tail = data[:0]
+        body_start_re, body_end_re, header_start_re = \
+            DOCUMENT_MARKS[bytes if isinstance(data, bytes)
+                           else six.text_type]
+        text = self.tail + data
+        start = 0  # of the current document in text
+        pos = self.pos
+        while True:
+            if not self.body:
+                match = body_start_re.search(text, pos)
+                if match is None:
+                    break
+                self.body = True
+                pos = match.end()
+            end = body_end_re.search(text, pos)
+            header = header_start_re.search(text, pos)
+            if header is not None and \
+                    (end is None or header.start() < end.start()):
+                cut = header.start()
+            elif end is not None:
+                cut = end.end()
+            else:
+                break
+            self.pieces.append(text[start:cut])
+            # The headers have to start the document.
+            yield text[:0].join(self.pieces).lstrip()
+            self.pieces = []
+            self.body = False
+            start = pos = cut
+
+        if eof:
+            rest = text[:0].join(self.pieces) + text[start:]
+            self.pieces = []
+            self.tail = text[:0]
+            self.pos = 0
+            self.body = False
+            if rest.strip():
+                yield rest.lstrip()
+            return
+        keep = max(start, len(text) - MARK_OVERLAP)
+        if keep > start:
+            self.pieces.append(text[start:keep])
+        self.tail = text[keep:]
+        self.pos = max(0, pos - keep)
+
+
+class TransactionStream(object):
+    """
+    The incremental core of OfxParser.iter_transactions: feed it the text
+    of a document a piece at a time, and it yields the (account,
+    transaction) pairs each piece completes, parsed by parser.
+    """
+
+    def __init__(self, parser):
+        self.parser = parser.interning()
+        self.scanner = TagScanner(
+            set(['stmttrn'] + InvestmentTransaction.AGGREGATE_TYPES))
+        self.account = None
+        self.institution = None
+        self.in_fi = False
+
+    def feed(self, text, eof=False):
+        """
+        Add text, which is the last of the document if eof is True, and
+        yield the pairs it completes.
+        """
+        parser = self.parser
+        for event, name, text in self.scanner.feed(text, eof):
+            account = self.account
+            if event == 'aggregate':
+                if account is None:
+                    continue
+                if name != 'stmttrn' and \
+                        account.type != AccountType.Investment:
+                    continue
+                txn_ofx = tree_maker(text).find(name)
+                if parser.decimal_separator is None:
+                    parser = self.parser = parser.configured(
+                        decimal_separator=detect_decimal_separator(txn_ofx))
+                try:
+                    if name == 'stmttrn':
+                        transaction = parser.parseTransaction(txn_ofx)
+                    else:
+                        transaction = parser.parseInvestmentTransaction(
+                            txn_ofx)
+                except (OfxParserException, ValueError, IndexError,
+                        decimal.InvalidOperation):
+                    e = sys.exc_info()[1]
+                    if parser.fail_fast:
+                        raise
+                    account.warnings.append(ErrorRecord(
+                        'invalid_transaction', name, six.text_type(e),
+                        text[:SNIPPET_LENGTH]))
+                    continue
+                yield account, transaction
+            elif name in STATEMENT_ACCOUNT_TYPES:
+                if event == 'open':
+                    account_type = STATEMENT_ACCOUNT_TYPES[name]
+                    if account_type == AccountType.Investment:
+                        account = InvestmentAccount()
+                    else:
+                        account = Account()
+                    account.type = account_type
+                    account.institution = self.institution
+                    self.account = account
+                else:
+                    self.account = None
+            elif name == 'fi':
+                self.in_fi = event == 'open'
+                if self.in_fi:
+                    self.institution = Institution()
+            elif event == 'open' and self.in_fi and name == 'org':
+                self.institution.organization = text.strip()
+            elif event == 'open' and self.in_fi and name == 'fid':
+                self.institution.fid = text.strip()
+            elif event == 'open' and account is not None and \
+                    name in ACCOUNT_FIELDS:
+                attr = ACCOUNT_FIELDS[name]
+                if hasattr(account, attr) and not getattr(account, attr) \
+                        and text.strip():
+                    setattr(account, attr, text.strip())
+
+
+# The outcome of parsing one source with OfxParser.parse_many: the ofx
+# object, or the exception that parsing raised.
+ParseResult = collections.namedtuple('ParseResult', 'source ofx error')
+
+
+def iter_batches(sources, batch_size):
+    """
+    Group sources into lists of (source, sendable) pairs, where sendable
+    can be pickled to a worker process: a path as is, or a file handle's
+    contents read into memory.
+    """
+    batch = []
+    for source in sources:
+        if hasattr(source, 'read'):
+            data = source.read()
+            if isinstance(data, bytes):
+                sendable = io.BytesIO(data)
+            else:
+                sendable = io.StringIO(data)
+        else:
+            sendable = source
+        batch.append((source, sendable))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_batch(parser, sources, backend):
+    """
+    Parse each of sources (paths or file handles) in a worker process, and
+    return an (ofx, error) pair for each.
+    """
+    # The results of the batch share their repeated values.
+    parser = parser.interning()
+    results = []
+    for source in sources:
+        try:
+            if hasattr(source, 'read'):
+                ofx = parser.parse(source, backend=backend)
+            else:
+                with open(source, 'rb') as fh:
+                    ofx = parser.parse(fh, backend=backend)
+            results.append((ofx, None))
+        except Exception:
+            results.append((None, sys.exc_info()[1]))
+    return results
+
+
+TZ_RE = re.compile(r"\[(?P<tz>[-+]?\d+\.?\d*)\:\w*\]$")
+MSEC_RE = re.compile(r"^[0-9]*\.([0-9]{0,5})")
+
+DIGITS = '0123456789'
+TZ_NAME_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+
+
+def strptime_ofx_datetime(ofxDateTime, custom_date_format=None):
+    """
+    Parse an OFX date and time with strptime, which accepts anything
+    parse_ofx_datetime does, and then some.
+    """
+    # Some places (e.g. Newfoundland) have non-integer offsets.
+    res = TZ_RE.search(ofxDateTime)
+    if res:
+        tz = float(res.group('tz'))
+    else:
+        tz = 0
+
+    timeZoneOffset = datetime.timedelta(hours=tz)
+
+    res = MSEC_RE.search(ofxDateTime)
+    if res:
+        msec = datetime.timedelta(seconds=float("0." + res.group(1)))
+    else:
+        msec = datetime.timedelta(seconds=0)
+
+    try:
+        local_date = datetime.datetime.strptime(ofxDateTime[:14],
+                                                '%Y%m%d%H%M%S')
+        return local_date - timeZoneOffset + msec
+    except ValueError:
+        if ofxDateTime[:8] == "00000000":
+            return None
+
+        if not custom_date_format:
+            return datetime.datetime.strptime(
+                ofxDateTime[:8], '%Y%m%d') - timeZoneOffset + msec
+        else:
+            return datetime.datetime.strptime(
+                ofxDateTime[:8], custom_date_format) - timeZoneOffset + msec
+
+
+def tz_offset(ofxDateTime):
+    """
+    Return the offset in hours of a trailing [-5:EST] time zone, 0 if
+    there is none, or None if it is not in a form parse_ofx_datetime knows.
+    """
+    if not ofxDateTime.endswith(']'):
+        return 0
+    tz, colon, name = ofxDateTime[ofxDateTime.rfind('[') + 1:-1].partition(':')
+    hours, _, fraction = tz.lstrip('+-').partition('.')
+    if not colon or len(tz) - len(tz.lstrip('+-')) > 1 or not hours \
+            or hours.strip(DIGITS) or fraction.strip(DIGITS) \
+            or not TZ_NAME_CHARS.issuperset(name):
+        return None
+    return float(tz)
+
+
+@lru_cache(maxsize=4096)
+def parse_ofx_datetime(ofxDateTime, custom_date_format=None):
+    """
+    Parse an OFX date and time, e.g. 20101106160000.00[-5:EST] for 6 Nov
+    2010 4pm UTC-5 aka EST, into a naive UTC datetime.  Dates that are all
+    zeros give None, and dates without a time that are not in %Y%m%d form
+    are read with custom_date_format.
+
+    The fields of the common forms are sliced out directly; anything else
+    goes to strptime.  Results are cached, as statements repeat the same
+    dates over and over.
+    """
+    digits = len(ofxDateTime) - len(ofxDateTime.lstrip(DIGITS))
+    tz = tz_offset(ofxDateTime)
+    if tz is not None and (digits == 14 or (
+            digits == 8 and not custom_date_format and
+            ofxDateTime[:8] != '00000000')):
+        if digits == 14:
+            time = (int(ofxDateTime[8:10]), int(ofxDateTime[10:12]),
+                    int(ofxDateTime[12:14]))
+        else:
+            time = (0, 0, 0)
+        try:
+            local_date = datetime.datetime(
+                int(ofxDateTime[:4]), int(ofxDateTime[4:6]),
+                int(ofxDateTime[6:8]), *time)
+        except ValueError:
+            pass
+        else:
+            if ofxDateTime[digits:digits + 1] == '.':
+                fraction = ofxDateTime[digits + 1:digits + 6]
+                fraction = fraction[:len(fraction) - len(
+                    fraction.lstrip(DIGITS))]
+                msec = datetime.timedelta(seconds=float("0." + fraction))
+                local_date += msec
+            return local_date - datetime.timedelta(hours=tz)
+    return strptime_ofx_datetime(ofxDateTime, custom_date_format)
+
+
+# The elements holding amounts, read with OfxParser.toDecimal.
+NUMBER_TAGS = frozenset([
+    'trnamt', 'balamt', 'units', 'unitprice', 'mktval', 'commission',
+    'fees', 'total', 'availcash', 'marginbalance', 'shortbalance',
+    'buypower', 'value',
+])
+
+# For each decimal separator, the translation of an amount into the form
+# Decimal reads: no thousands separators, spaces or plus signs.
+DECIMAL_TRANSLATIONS = {
+    '.': dict((ord(c), None) for c in ', +'),
+    ',': dict([(ord(','), six.u('.'))] + [(ord(c), None) for c in '. +']),
+}
+
+
+def decimal_separator(value):
+    """
+    Return the decimal separator that the amount value shows it uses, or
+    None if it could be either (1,000) or has none.
+    """
+    point = value.rfind('.')
+    comma = value.rfind(',')
+    if point != -1 and comma != -1:
+        return '.' if point > comma else ','
+    if point == comma:
+        return None
+    separator, other = ('.', ',') if point != -1 else (',', '.')
+    if value.count(separator) > 1:
+        # 1.000.000 or 1,000,000
+        return other
+    fraction = value[max(point, comma) + 1:]
+    if len(fraction.strip()) == 3:
+        return None
+    return separator
+
+
+def detect_decimal_separator(tree):
+    """
+    Return the decimal separator of the first amount below tree that
+    shows it, or None.
+    """
+    for tag in iter_aggregates(tree, NUMBER_TAGS):
+        if tag.contents and isinstance(tag.contents[0], six.string_types):
+            separator = decimal_separator(tag.contents[0].strip())
+            if separator is not None:
+                return separator
+    return None
+
+
+DOT_THOUSANDS_RE = re.compile(r'.*\..*,')
+COMMA_THOUSANDS_RE = re.compile(r'.*,.*\.')
+
+
+def guess_decimal(d):
+    """
+    Convert the amount d, guessing its separators from d alone.
+    """
+    # Handle 10,000.50 formatted numbers
+    if DOT_THOUSANDS_RE.search(d):
+        d = d.replace('.', '')
+    # Handle 10.000,50 formatted numbers
+    if COMMA_THOUSANDS_RE.search(d):
+        d = d.replace(',', '')
+    # Handle 10000,50 formatted numbers
+    if '.' not in d and ',' in d:
+        d = d.replace(',', '.')
+    # Handle 1 025,53 formatted numbers
+    d = d.replace(' ', '')
+    # Handle +1058,53 formatted numbers
+    d = d.replace('+', '')
+    return decimal.Decimal(d)
+
+
+@lru_cache(maxsize=4096)
+def parse_decimal(d, decimal_separator=None):
+    """
+    Convert the amount d to a Decimal, given its decimal separator ('.' or
+    ','), or guessing it from d alone if that is None.  Results are
+    cached, as statements repeat the same amounts.
+    """
+    if decimal_separator is None:
+        return guess_decimal(d)
+    return decimal.Decimal(
+        six.text_type(d).translate(DECIMAL_TRANSLATIONS[decimal_separator]))
+
+
+class parsermethod(object):
+    '''
+    A method decorator for OfxParser: called on a parser instance, the
+    method uses that parser's settings; called on the class, as a
+    classmethod would be, it is bound to a new parser with the default
+    settings.
+    '''
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            instance = owner()
+        return self.func.__get__(instance, owner)
+
+
+class OfxParser(object):
+    '''
+    An OfxParser holds the settings of a parse:
+
+    If fail_fast is True, the parser will fail on any errors.
+    If fail_fast is False, the parser will log poor statements in the
+    statement class and continue to run. Note: the library does not
+    guarantee that no exceptions will be raised to the caller, only
+    that statements will include bad transactions (which are marked).
+
+    custom_date_format is the strptime format of dates that are not
+    in the OFX format.
+
+    decimal_separator is '.' or ',', the decimal separator of the amounts
+    in the documents to parse, as for some institutions it is always the
+    same.  If it is None, it is worked out once per document, from the
+    first amount that shows it.
+
+    If columnar is True, statements keep their transactions and positions
+    in the tables of ofxparse.ofxtable rather than in lists, one array per
+    field, and make the row objects only when they are read, as read-only
+    snapshots: changes to them are not kept.
+
+    If intern is True, values that repeat across a document, such as
+    transaction types, payees, SIC codes, currencies and securities, are
+    stored once, as is the Institution of its accounts, so the accounts of
+    one institution share a single Institution object: changing it for one
+    changes it for all of them.  Memos, which are mostly unique, are not
+    interned.  See also session().
+
+    A parser is never changed by parsing, so one instance can be shared
+    by any number of threads, except a session(), which remembers the
+    values it interns.  The parse* methods can also be called on the
+    class itself, which parses with the default settings.
+    '''
+
+    def __init__(self, fail_fast=True, custom_date_format=None,
+                 decimal_separator=None, columnar=False, intern=False):
+        self.fail_fast = fail_fast
+        self.custom_date_format = custom_date_format
+        self.decimal_separator = decimal_separator
+        self.columnar = columnar
+        self.intern = intern
+        # The values seen so far, within a document or a session().
+        self.strings = None
+        self.institutions = None
+
+    def configured(self, fail_fast=None, custom_date_format=None,
+                   decimal_separator=None, columnar=None, intern=None):
         '''
-        parse is the main entry point for an OfxParser. It takes a file
-        handle and an optional log_errors flag.
+        Return a copy of this parser with the settings that are not None
+        replaced.
+        '''
+        parser = copy.copy(self)
+        if fail_fast is not None:
+            parser.fail_fast = fail_fast
+        if custom_date_format is not None:
+            parser.custom_date_format = custom_date_format
+        if decimal_separator is not None:
+            parser.decimal_separator = decimal_separator
+        if columnar is not None:
+            parser.columnar = columnar
+        if intern is not None:
+            parser.intern = intern
+        return parser
+
+    def session(self):
+        '''
+        Return a copy of this parser that interns repeated values across
+        all the documents it parses, not just within each one, so that the
+        results of a batch of files share them.  The copy grows with the
+        distinct values it sees.
+
+        Parsing changes a session, but only by adding to its memos with
+        dict.setdefault, which is atomic under CPython's global
+        interpreter lock, so threads may share one; its results then share
+        values with every document any of them parses.
+        '''
+        parser = copy.copy(self)
+        parser.strings = {}
+        parser.institutions = {}
+        return parser
 
-        If fail_fast is True, the parser will fail on any errors.
-        If fail_fast is False, the parser will log poor statements in the
-        statement class and continue to run. Note: the library does not
-        guarantee that no exceptions will be raised to the caller, only
-        that statements will include bad transactions (which are marked).
+    def interning(self):
+        '''
+        Return this parser, or a session() for one document if it interns
+        and is not part of a session already.
+        '''
+        if self.intern and self.strings is None:
+            return self.session()
+        return self
+
+    def interned(self, value):
+        '''
+        Return the value equal to value that was seen before in this
+        document or session, if any.
+        '''
+        if self.strings is None:
+            return value
+        return self.strings.setdefault(value, value)
 
+    @parsermethod
+    def parse(self, file_handle, fail_fast=None, custom_date_format=None,
+              backend='beautifulsoup', decimal_separator=None):
         '''
-        cls.fail_fast = fail_fast
-        cls.custom_date_format = custom_date_format
+        parse is the main entry point for an OfxParser. It takes a file
+        handle, and optionally settings that override the parser's own
+        (see OfxParser).
 
-        if not hasattr(file_handle, 'seek'):
-            raise TypeError(six.u('parse() accepts a seek-able file handle\
-                            , not %s' % type(file_handle).__name__))
+        backend selects how the document tree is built, one of the keys
+        of BACKENDS. 'native' is much faster than the default
+        'beautifulsoup' on large files, and 'mmap' builds the same tree as
+        'native' from a file on disk without reading it into memory.
 
+        '''
+        if fail_fast is not None or custom_date_format is not None or \
+                decimal_separator is not None:
+            return self.configured(
+                fail_fast, custom_date_format, decimal_separator).parse(
+                    file_handle, backend=backend)
+
+        if not hasattr(file_handle, 'read'):
+            raise TypeError(six.u('parse() accepts a file handle, not %s')
+                            % type(file_handle).__name__)
+        if backend not in BACKENDS:
+            raise ValueError(six.u('Unknown parser backend %r, expected one '
+                                   'of %s') % (backend, ', '.join(BACKENDS)))
+        file_cls, tree_builder = BACKENDS[backend]
+
+        # OFX 2.x is XML, and needs no repair when it is well-formed.  As
+        # OfxPreprocessedFile rewrites the document when it is made, the
+        # document is read with OfxFile and preprocessed only if need be.
+        ofx = None
+        if issubclass(file_cls, OfxPreprocessedFile):
+            ofx_file = OfxFile(file_handle)
+        else:
+            ofx_file = file_cls(file_handle)
+        # A stream that cannot seek is not given to expat first, as it
+        # could not be read again if the document is not well-formed.
+        stream = getattr(ofx_file.fh, 'stream', ofx_file.fh)
+        if ofx_file.xml and is_seekable(stream):
+            with save_pos(stream):
+                ofx = xml_tree_maker(stream)
+        if ofx is None:
+            # The document is decoded once, and the tree builder is given
+            # the text itself.
+            ofx = tree_builder(file_cls.preprocess(ofx_file.read()))
+
+        parser = self.interning()
+        if self.decimal_separator is None:
+            # Read every amount in the document the same way.
+            parser = parser.configured(
+                decimal_separator=detect_decimal_separator(ofx))
+        return parser.parseOfx(ofx, ofx_file.headers)
+
+    @parsermethod
+    def parseOfx(self, ofx, headers):
+        '''
+        Build the ofx object from a document tree.
+        '''
         ofx_obj = Ofx()
 
         # Store the headers
-        ofx_file = OfxPreprocessedFile(file_handle)
-        ofx_obj.headers = ofx_file.headers
+        ofx_obj.headers = headers
         ofx_obj.accounts = []
         ofx_obj.signon = None
 
-        ofx = soup_maker(ofx_file.fh)
         if ofx.find('ofx') is None:
             raise OfxParserException('The ofx file is empty!')
 
         sonrs_ofx = ofx.find('sonrs')
         if sonrs_ofx:
-            ofx_obj.signon = cls.parseSonrs(sonrs_ofx)
+            ofx_obj.signon = self.parseSonrs(sonrs_ofx)
 
         stmttrnrs = ofx.find('stmttrnrs')
         if stmttrnrs:
@@ -444,88 +1584,218 @@ class OfxParser(object):
 
         stmtrs_ofx = ofx.findAll('stmtrs')
         if stmtrs_ofx:
-            ofx_obj.accounts += cls.parseStmtrs(stmtrs_ofx, AccountType.Bank)
+            ofx_obj.accounts += self.parseStmtrs(stmtrs_ofx, AccountType.Bank)
 
         ccstmtrs_ofx = ofx.findAll('ccstmtrs')
         if ccstmtrs_ofx:
-            ofx_obj.accounts += cls.parseStmtrs(
+            ofx_obj.accounts += self.parseStmtrs(
                 ccstmtrs_ofx, AccountType.CreditCard)
 
         invstmtrs_ofx = ofx.findAll('invstmtrs')
         if invstmtrs_ofx:
-            ofx_obj.accounts += cls.parseInvstmtrs(invstmtrs_ofx)
+            ofx_obj.accounts += self.parseInvstmtrs(invstmtrs_ofx)
             seclist_ofx = ofx.find('seclist')
             if seclist_ofx:
-                ofx_obj.security_list = cls.parseSeclist(seclist_ofx)
+                ofx_obj.security_list = self.parseSeclist(seclist_ofx)
             else:
                 ofx_obj.security_list = None
 
         acctinfors_ofx = ofx.find('acctinfors')
         if acctinfors_ofx:
-            ofx_obj.accounts += cls.parseAcctinfors(acctinfors_ofx, ofx)
+            ofx_obj.accounts += self.parseAcctinfors(acctinfors_ofx, ofx)
 
         fi_ofx = ofx.find('fi')
         if fi_ofx:
             for account in ofx_obj.accounts:
-                account.institution = cls.parseOrg(fi_ofx)
+                account.institution = self.parseOrg(fi_ofx)
 
         if ofx_obj.accounts:
             ofx_obj.account = ofx_obj.accounts[0]
 
         return ofx_obj
 
-    @classmethod
-    def parseOfxDateTime(cls, ofxDateTime):
-        # dateAsString looks something like 20101106160000.00[-5:EST]
-        # for 6 Nov 2010 4pm UTC-5 aka EST
-
-        # Some places (e.g. Newfoundland) have non-integer offsets.
-        res = re.search(r"\[(?P<tz>[-+]?\d+\.?\d*)\:\w*\]$", ofxDateTime)
-        if res:
-            tz = float(res.group('tz'))
-        else:
-            tz = 0
-
-        timeZoneOffset = datetime.timedelta(hours=tz)
-
-        res = re.search(r"^[0-9]*\.([0-9]{0,5})", ofxDateTime)
-        if res:
-            msec = datetime.timedelta(seconds=float("0." + res.group(1)))
-        else:
-            msec = datetime.timedelta(seconds=0)
-
-        try:
-            local_date = datetime.datetime.strptime(ofxDateTime[:14], '%Y%m%d%H%M%S')
-            return local_date - timeZoneOffset + msec
-        except ValueError:
-            if ofxDateTime[:8] == "00000000":
-                return None
+    @parsermethod
+    def iter_transactions(self, file_handle, fail_fast=None,
+                          custom_date_format=None, chunk_size=64 * 1024,
+                          decimal_separator=None):
+        '''
+        iter_transactions is a streaming alternative to parse. It takes
+        the same arguments and yields (account, transaction) pairs as each
+        <STMTTRN> or investment transaction aggregate closes, without ever
+        holding the whole document in memory.
+
+        The accounts only carry the identifying fields that precede the
+        transaction list (account id, routing number, currency, ...); their
+        statement is None. With fail_fast False, transactions that cannot
+        be parsed are skipped and noted in the account's warnings. Unless
+        it is given, the decimal separator is worked out from the first
+        transaction that shows it.
+        '''
+        if fail_fast is not None or custom_date_format is not None or \
+                decimal_separator is not None:
+            parser = self.configured(
+                fail_fast, custom_date_format, decimal_separator)
+            for account, transaction in parser.iter_transactions(
+                    file_handle, chunk_size=chunk_size):
+                yield account, transaction
+            return
 
-            if not cls.custom_date_format:
-                return datetime.datetime.strptime(
-                    ofxDateTime[:8], '%Y%m%d') - timeZoneOffset + msec
-            else:
-                return datetime.datetime.strptime(
-                    ofxDateTime[:8], cls.custom_date_format) - timeZoneOffset + msec
+        if not hasattr(file_handle, 'read'):
+            raise TypeError(six.u('iter_transactions() accepts a file '
+                                  'handle, not %s')
+                            % type(file_handle).__name__)
+
+        ofx_file = OfxFile(file_handle)
+        stream = TransactionStream(self)
+        while True:
+            chunk = ofx_file.fh.read(chunk_size)
+            for account, transaction in stream.feed(chunk, eof=not chunk):
+                yield account, transaction
+            if not chunk:
+                return
+
+    @parsermethod
+    def iter_parse(self, file_handle, fail_fast=None, custom_date_format=None,
+                   backend='beautifulsoup', decimal_separator=None,
+                   chunk_size=64 * 1024):
+        '''
+        iter_parse is parse for streams that hold any number of documents,
+        such as several OFX responses one after the other, each with its
+        own header block, or a zip archive of OFX or QFX files.  It takes
+        the same arguments as parse, and yields an Ofx for each document
+        in turn, or for each file of the archive.
+
+        The stream is read once, chunk_size at a time, and only the
+        document being parsed is held in memory.  It may be compressed
+        like any document parse reads; a zip archive has to be in a stream
+        that can seek.
+        '''
+        if fail_fast is not None or custom_date_format is not None or \
+                decimal_separator is not None:
+            parser = self.configured(
+                fail_fast, custom_date_format, decimal_separator)
+            for ofx in parser.iter_parse(file_handle, backend=backend,
+                                         chunk_size=chunk_size):
+                yield ofx
+            return
 
-    @classmethod
-    def parseAcctinfors(cls, acctinfors_ofx, ofx):
+        if not hasattr(file_handle, 'read'):
+            raise TypeError(six.u('iter_parse() accepts a file handle, '
+                                  'not %s') % type(file_handle).__name__)
+        if backend not in BACKENDS:
+            raise ValueError(six.u('Unknown parser backend %r, expected one '
+                                   'of %s') % (backend, ', '.join(BACKENDS)))
+
+        fh = file_handle
+        if not is_seekable(fh):
+            fh = LookaheadStream(fh)
+        compression = detect_compression(fh)
+        if compression == 'zip':
+            archive = open_archive(fh)
+            for member in ofx_members(archive):
+                with archive.open(member) as member_fh:
+                    ofx = self.parse(member_fh, backend=backend)
+                yield ofx
+            return
+        if compression is not None:
+            fh = decompressed(fh, compression)
+
+        splitter = DocumentSplitter()
+        while True:
+            chunk = fh.read(chunk_size)
+            for document in splitter.feed(chunk, eof=not chunk):
+                if isinstance(document, bytes):
+                    document = io.BytesIO(document)
+                else:
+                    document = io.StringIO(document)
+                yield self.parse(document, backend=backend)
+            if not chunk:
+                return
+
+    @parsermethod
+    def parse_many(self, sources, workers=None, ordered=True, batch_size=1,
+                   max_pending=None, backend='beautifulsoup'):
+        '''
+        parse_many parses many files in parallel, in a pool of worker
+        processes. sources is an iterable of paths or file
+        handles; handles are read in this process and their contents sent
+        to the workers.
+
+        It yields a ParseResult(source, ofx, error) for each source: error
+        is the exception parsing raised, in which case ofx is None, so one
+        bad file does not stop the others. Results come in the order of
+        sources if ordered is True, otherwise as soon as they are done.
+
+        workers is the number of processes (default: one per CPU).
+        Sources are sent to the workers batch_size at a time, and at most
+        max_pending batches (default: twice the number of workers) are
+        in flight, so sources are only read as they are needed.
+        '''
+        import multiprocessing
+        from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                        wait)
+
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if max_pending is None:
+            max_pending = 2 * workers
+        batches = iter_batches(sources, batch_size)
+        pending = collections.deque()
+
+        def submit(count):
+            for batch in itertools.islice(batches, count):
+                future = executor.submit(
+                    parse_batch, self, [sendable for _, sendable in batch],
+                    backend)
+                pending.append((future, batch))
+
+        with ProcessPoolExecutor(workers) as executor:
+            try:
+                submit(max_pending)
+                while pending:
+                    if ordered:
+                        future, batch = pending.popleft()
+                    else:
+                        done = wait([future for future, _ in pending],
+                                    return_when=FIRST_COMPLETED).done
+                        for i, (future, batch) in enumerate(pending):
+                            if future in done:
+                                del pending[i]
+                                break
+                    submit(1)
+                    try:
+                        outcomes = future.result()
+                    except Exception:
+                        # The batch could not be run or sent back.
+                        outcomes = [(None, sys.exc_info()[1])] * len(batch)
+                    for (source, _), (ofx, error) in zip(batch, outcomes):
+                        yield ParseResult(source, ofx, error)
+            finally:
+                for future, _ in pending:
+                    future.cancel()
+
+    @parsermethod
+    def parseOfxDateTime(self, ofxDateTime):
+        return parse_ofx_datetime(ofxDateTime, self.custom_date_format)
+
+    @parsermethod
+    def parseAcctinfors(self, acctinfors_ofx, ofx):
         all_accounts = []
         for i in acctinfors_ofx.findAll('acctinfo'):
             accounts = []
             if i.find('invacctinfo'):
-                accounts += cls.parseInvstmtrs([i])
+                accounts += self.parseInvstmtrs([i])
             elif i.find('ccacctinfo'):
-                accounts += cls.parseStmtrs([i], AccountType.CreditCard)
+                accounts += self.parseStmtrs([i], AccountType.CreditCard)
             elif i.find('bankacctinfo'):
-                accounts += cls.parseStmtrs([i], AccountType.Bank)
+                accounts += self.parseStmtrs([i], AccountType.Bank)
             else:
                 continue
 
             fi_ofx = ofx.find('fi')
             if fi_ofx:
                 for account in all_accounts:
-                    account.institution = cls.parseOrg(fi_ofx)
+                    account.institution = self.parseOrg(fi_ofx)
 
             desc = i.find('desc')
             if hasattr(desc, 'contents'):
@@ -534,8 +1804,8 @@ class OfxParser(object):
             all_accounts += accounts
         return all_accounts
 
-    @classmethod
-    def parseInvstmtrs(cls, invstmtrs_list):
+    @parsermethod
+    def parseInvstmtrs(self, invstmtrs_list):
         ret = []
         for invstmtrs_ofx in invstmtrs_list:
             account = InvestmentAccount()
@@ -545,8 +1815,8 @@ class OfxParser(object):
                     account.account_id = acctid_tag.contents[0].strip()
                 except IndexError:
                     account.warnings.append(
-                        six.u("Empty acctid tag for %s") % invstmtrs_ofx)
-                    if cls.fail_fast:
+                        ErrorRecord.about('empty_acctid', invstmtrs_ofx))
+                    if self.fail_fast:
                         raise
 
             brokerid_tag = invstmtrs_ofx.find('brokerid')
@@ -555,20 +1825,20 @@ class OfxParser(object):
                     account.brokerid = brokerid_tag.contents[0].strip()
                 except IndexError:
                     account.warnings.append(
-                        six.u("Empty brokerid tag for %s") % invstmtrs_ofx)
-                    if cls.fail_fast:
+                        ErrorRecord.about('empty_brokerid', invstmtrs_ofx))
+                    if self.fail_fast:
                         raise
 
             account.type = AccountType.Investment
 
             if invstmtrs_ofx:
-                account.statement = cls.parseInvestmentStatement(
+                account.statement = self.parseInvestmentStatement(
                     invstmtrs_ofx)
             ret.append(account)
         return ret
 
-    @classmethod
-    def parseSeclist(cls, seclist_ofx):
+    @parsermethod
+    def parseSeclist(self, seclist_ofx):
         securityList = []
         for secinfo_ofx in seclist_ofx.findAll('secinfo'):
             uniqueid_tag = secinfo_ofx.find('uniqueid')
@@ -593,176 +1863,187 @@ class OfxParser(object):
                              memo))
         return securityList
 
-    @classmethod
-    def parseInvestmentPosition(cls, ofx):
+    @parsermethod
+    def parseInvestmentPosition(self, ofx):
         position = Position()
-        tag = ofx.find('uniqueid')
+        tags = first_tags(ofx, POSITION_TAGS)
+        tag = tags.get('uniqueid')
         if hasattr(tag, 'contents'):
-            position.security = tag.contents[0].strip()
-        tag = ofx.find('units')
+            position.security = self.interned(tag.contents[0].strip())
+        tag = tags.get('units')
         if hasattr(tag, 'contents'):
-            position.units = cls.toDecimal(tag)
-        tag = ofx.find('unitprice')
+            position.units = self.toDecimal(tag)
+        tag = tags.get('unitprice')
         if hasattr(tag, 'contents'):
-            position.unit_price = cls.toDecimal(tag)
-        tag = ofx.find('mktval')
+            position.unit_price = self.toDecimal(tag)
+        tag = tags.get('mktval')
         if hasattr(tag, 'contents'):
-            position.market_value = cls.toDecimal(tag)
-        tag = ofx.find('dtpriceasof')
+            position.market_value = self.toDecimal(tag)
+        tag = tags.get('dtpriceasof')
         if hasattr(tag, 'contents'):
             try:
-                position.date = cls.parseOfxDateTime(tag.contents[0].strip())
+                position.date = self.parseOfxDateTime(tag.contents[0].strip())
             except ValueError:
                 raise
         return position
 
-    @classmethod
-    def parseInvestmentTransaction(cls, ofx):
+    @parsermethod
+    def parseInvestmentTransaction(self, ofx):
         transaction = InvestmentTransaction(ofx.name)
-        tag = ofx.find('fitid')
+        transaction.type = self.interned(transaction.type)
+        tags = first_tags(ofx, INVESTMENT_TRANSACTION_TAGS)
+        tag = tags.get('fitid')
         if hasattr(tag, 'contents'):
             transaction.id = tag.contents[0].strip()
-        tag = ofx.find('memo')
+        tag = tags.get('memo')
         if hasattr(tag, 'contents'):
             transaction.memo = tag.contents[0].strip()
-        tag = ofx.find('dttrade')
+        tag = tags.get('dttrade')
         if hasattr(tag, 'contents'):
             try:
-                transaction.tradeDate = cls.parseOfxDateTime(
+                transaction.tradeDate = self.parseOfxDateTime(
                     tag.contents[0].strip())
             except ValueError:
                 raise
-        tag = ofx.find('dtsettle')
+        tag = tags.get('dtsettle')
         if hasattr(tag, 'contents'):
             try:
-                transaction.settleDate = cls.parseOfxDateTime(
+                transaction.settleDate = self.parseOfxDateTime(
                     tag.contents[0].strip())
             except ValueError:
                 raise
-        tag = ofx.find('uniqueid')
+        tag = tags.get('uniqueid')
         if hasattr(tag, 'contents'):
-            transaction.security = tag.contents[0].strip()
-        tag = ofx.find('incometype')
+            transaction.security = self.interned(tag.contents[0].strip())
+        tag = tags.get('incometype')
         if hasattr(tag, 'contents'):
-            transaction.income_type = tag.contents[0].strip()
-        tag = ofx.find('units')
+            transaction.income_type = self.interned(tag.contents[0].strip())
+        tag = tags.get('units')
         if hasattr(tag, 'contents'):
-            transaction.units = cls.toDecimal(tag)
-        tag = ofx.find('unitprice')
+            transaction.units = self.toDecimal(tag)
+        tag = tags.get('unitprice')
         if hasattr(tag, 'contents'):
-            transaction.unit_price = cls.toDecimal(tag)
-        tag = ofx.find('commission')
+            transaction.unit_price = self.toDecimal(tag)
+        tag = tags.get('commission')
         if hasattr(tag, 'contents'):
-            transaction.commission = cls.toDecimal(tag)
-        tag = ofx.find('fees')
+            transaction.commission = self.toDecimal(tag)
+        tag = tags.get('fees')
         if hasattr(tag, 'contents'):
-            transaction.fees = cls.toDecimal(tag)
-        tag = ofx.find('total')
+            transaction.fees = self.toDecimal(tag)
+        tag = tags.get('total')
         if hasattr(tag, 'contents'):
-            transaction.total = cls.toDecimal(tag)
-        tag = ofx.find('inv401ksource')
+            transaction.total = self.toDecimal(tag)
+        tag = tags.get('inv401ksource')
         if hasattr(tag, 'contents'):
-            transaction.inv401ksource = tag.contents[0].strip()
-        tag = ofx.find('tferaction')
+            transaction.inv401ksource = self.interned(
+                tag.contents[0].strip())
+        tag = tags.get('tferaction')
         if hasattr(tag, 'contents'):
-            transaction.tferaction = tag.contents[0].strip()
+            transaction.tferaction = self.interned(tag.contents[0].strip())
         return transaction
 
-    @classmethod
-    def parseInvestmentStatement(cls, invstmtrs_ofx):
+    @parsermethod
+    def parseInvestmentStatement(self, invstmtrs_ofx):
         statement = InvestmentStatement()
+        if self.columnar:
+            from .ofxtable import InvestmentTransactionTable, PositionTable
+            statement.transactions = InvestmentTransactionTable()
+            statement.positions = PositionTable()
         currency_tag = invstmtrs_ofx.find('curdef')
         if hasattr(currency_tag, "contents"):
-            statement.currency = currency_tag.contents[0].strip().lower()
+            statement.currency = self.interned(
+                currency_tag.contents[0].strip().lower())
         invtranlist_ofx = invstmtrs_ofx.find('invtranlist')
         if invtranlist_ofx is not None:
             tag = invtranlist_ofx.find('dtstart')
             if hasattr(tag, 'contents'):
                 try:
-                    statement.start_date = cls.parseOfxDateTime(
+                    statement.start_date = self.parseOfxDateTime(
                         tag.contents[0].strip())
                 except IndexError:
-                    statement.warnings.append(six.u('Empty start date.'))
-                    if cls.fail_fast:
+                    statement.warnings.append(
+                        ErrorRecord.about('empty_start_date', tag))
+                    if self.fail_fast:
                         raise
                 except ValueError:
                     e = sys.exc_info()[1]
-                    statement.warnings.append(six.u('Invalid start date:\
-                        %s') % e)
-                    if cls.fail_fast:
+                    statement.warnings.append(ErrorRecord.about(
+                        'invalid_start_date', tag, six.text_type(e)))
+                    if self.fail_fast:
                         raise
 
             tag = invtranlist_ofx.find('dtend')
             if hasattr(tag, 'contents'):
                 try:
-                    statement.end_date = cls.parseOfxDateTime(
+                    statement.end_date = self.parseOfxDateTime(
                         tag.contents[0].strip())
                 except IndexError:
-                    statement.warnings.append(six.u('Empty end date.'))
+                    statement.warnings.append(
+                        ErrorRecord.about('empty_end_date', tag))
                 except ValueError:
                     e = sys.exc_info()[1]
-                    statement.warnings.append(six.u('Invalid end date: \
-                        %s') % e)
-                    if cls.fail_fast:
+                    statement.warnings.append(ErrorRecord.about(
+                        'invalid_end_date', tag, six.text_type(e)))
+                    if self.fail_fast:
                         raise
 
-        for transaction_type in ['posmf', 'posstock', 'posopt', 'posother',
-                                 'posdebt']:
-            try:
-                for investment_ofx in invstmtrs_ofx.findAll(transaction_type):
+        aggregate_types = set(Position.AGGREGATE_TYPES)
+        aggregate_types.update(InvestmentTransaction.AGGREGATE_TYPES)
+        aggregate_types.add('invbanktran')
+        for investment_ofx in iter_aggregates(invstmtrs_ofx, aggregate_types):
+            transaction_type = investment_ofx.name
+            if transaction_type == 'invbanktran':
+                for stmt_ofx in investment_ofx.findAll('stmttrn'):
+                    try:
+                        statement.transactions.append(
+                            self.parseTransaction(stmt_ofx))
+                    except OfxParserException:
+                        ofxError = sys.exc_info()[1]
+                        statement.discarded_entries.append(ErrorRecord.about(
+                            'discarded_transaction', stmt_ofx,
+                            six.text_type(ofxError)).entry())
+                        if self.fail_fast:
+                            raise
+            elif transaction_type in Position.AGGREGATE_TYPES:
+                try:
                     statement.positions.append(
-                        cls.parseInvestmentPosition(investment_ofx))
-            except (ValueError, IndexError, decimal.InvalidOperation,
-                    TypeError):
-                e = sys.exc_info()[1]
-                if cls.fail_fast:
-                    raise
-                statement.discarded_entries.append(
-                    {six.u('error'): six.u("Error parsing positions: \
-                        ") + str(e), six.u('content'): investment_ofx}
-                )
-
-        for transaction_type in InvestmentTransaction.AGGREGATE_TYPES:
-            try:
-                for investment_ofx in invstmtrs_ofx.findAll(transaction_type):
-                    statement.transactions.append(
-                        cls.parseInvestmentTransaction(investment_ofx))
-            except (ValueError, IndexError, decimal.InvalidOperation):
-                e = sys.exc_info()[1]
-                if cls.fail_fast:
-                    raise
-                statement.discarded_entries.append(
-                    {six.u('error'): transaction_type + ": " + str(e),
-                     six.u('content'): investment_ofx}
-                )
-
-        for transaction_ofx in invstmtrs_ofx.findAll('invbanktran'):
-            for stmt_ofx in transaction_ofx.findAll('stmttrn'):
+                        self.parseInvestmentPosition(investment_ofx))
+                except (ValueError, IndexError, decimal.InvalidOperation,
+                        TypeError):
+                    e = sys.exc_info()[1]
+                    if self.fail_fast:
+                        raise
+                    statement.discarded_entries.append(ErrorRecord.about(
+                        'invalid_position', investment_ofx,
+                        six.text_type(e)).entry())
+            else:
                 try:
                     statement.transactions.append(
-                        cls.parseTransaction(stmt_ofx))
-                except OfxParserException:
-                    ofxError = sys.exc_info()[1]
-                    statement.discarded_entries.append(
-                        {'error': str(ofxError), 'content': transaction_ofx})
-                    if cls.fail_fast:
+                        self.parseInvestmentTransaction(investment_ofx))
+                except (ValueError, IndexError, decimal.InvalidOperation):
+                    e = sys.exc_info()[1]
+                    if self.fail_fast:
                         raise
+                    statement.discarded_entries.append(ErrorRecord.about(
+                        'invalid_transaction', investment_ofx,
+                        six.text_type(e)).entry())
 
         invbal_ofx = invstmtrs_ofx.find('invbal')
         if invbal_ofx is not None:
-            # <AVAILCASH>18073.98<MARGINBALANCE>+00000000000.00<SHORTBALANCE>+00000000000.00<BUYPOWER>+00000000000.00
+            # <AVAILCASH>18073.98<MARGINBALANCE>+00000000000.00
+            # <SHORTBALANCE>+00000000000.00<BUYPOWER>+00000000000.00
             availcash_ofx = invbal_ofx.find('availcash')
             if availcash_ofx is not None:
-                statement.available_cash = cls.toDecimal(availcash_ofx)
+                statement.available_cash = self.toDecimal(availcash_ofx)
             margin_balance_ofx = invbal_ofx.find('marginbalance')
             if margin_balance_ofx is not None:
-                statement.margin_balance = cls.toDecimal(margin_balance_ofx)
+                statement.margin_balance = self.toDecimal(margin_balance_ofx)
             short_balance_ofx = invbal_ofx.find('shortbalance')
             if short_balance_ofx is not None:
-                statement.short_balance = cls.toDecimal(short_balance_ofx)
+                statement.short_balance = self.toDecimal(short_balance_ofx)
             buy_power_ofx = invbal_ofx.find('buypower')
             if buy_power_ofx is not None:
-                statement.buy_power = cls.toDecimal(buy_power_ofx)
+                statement.buy_power = self.toDecimal(buy_power_ofx)
 
             ballist_ofx = invbal_ofx.find('ballist')
             if ballist_ofx is not None:
@@ -778,13 +2059,13 @@ class OfxParser(object):
                             description_ofx.contents[0].strip()
                     value_ofx = balance_ofx.find('value')
                     if value_ofx is not None:
-                        brokerage_balance.value = cls.toDecimal(value_ofx)
+                        brokerage_balance.value = self.toDecimal(value_ofx)
                     statement.balance_list.append(brokerage_balance)
 
         return statement
 
-    @classmethod
-    def parseOrg(cls, fi_ofx):
+    @parsermethod
+    def parseOrg(self, fi_ofx):
         institution = Institution()
         org = fi_ofx.find('org')
         if hasattr(org, 'contents'):
@@ -794,10 +2075,14 @@ class OfxParser(object):
         if hasattr(fid, 'contents'):
             institution.fid = fid.contents[0].strip()
 
-        return institution
+        if self.institutions is None:
+            return institution
+        # The accounts of one institution share its Institution.
+        return self.institutions.setdefault(
+            (institution.organization, institution.fid), institution)
 
-    @classmethod
-    def parseSonrs(cls, sonrs):
+    @parsermethod
+    def parseSonrs(self, sonrs):
 
         items = [
             'code',
@@ -822,15 +2107,15 @@ class OfxParser(object):
 
         return Signon(idict)
 
-    @classmethod
-    def parseStmtrs(cls, stmtrs_list, accountType):
+    @parsermethod
+    def parseStmtrs(self, stmtrs_list, accountType):
         ''' Parse the <STMTRS> tags and return a list of Accounts object. '''
         ret = []
         for stmtrs_ofx in stmtrs_list:
             account = Account()
             act_curdef = stmtrs_ofx.find('curdef')
             if act_curdef and act_curdef.contents:
-                account.curdef = act_curdef.contents[0].strip()
+                account.curdef = self.interned(act_curdef.contents[0].strip())
             acctid_tag = stmtrs_ofx.find('acctid')
             if acctid_tag and acctid_tag.contents:
                 account.account_id = acctid_tag.contents[0].strip()
@@ -846,12 +2131,12 @@ class OfxParser(object):
             account.type = accountType
 
             if stmtrs_ofx:
-                account.statement = cls.parseStatement(stmtrs_ofx)
+                account.statement = self.parseStatement(stmtrs_ofx)
             ret.append(account)
         return ret
 
-    @classmethod
-    def parseBalance(cls, statement, stmt_ofx, bal_tag_name, bal_attr,
+    @parsermethod
+    def parseBalance(self, statement, stmt_ofx, bal_tag_name, bal_attr,
                      bal_date_attr, bal_type_string):
         bal_tag = stmt_ofx.find(bal_tag_name)
         if hasattr(bal_tag, "contents"):
@@ -859,134 +2144,132 @@ class OfxParser(object):
             dtasof_tag = bal_tag.find('dtasof')
             if hasattr(balamt_tag, "contents"):
                 try:
-                    setattr(statement, bal_attr, cls.toDecimal(balamt_tag))
+                    setattr(statement, bal_attr, self.toDecimal(balamt_tag))
                 except (IndexError, decimal.InvalidOperation):
-                    statement.warnings.append(
-                        six.u("%s balance amount was empty for \
-                            %s") % (bal_type_string, stmt_ofx))
-                    if cls.fail_fast:
+                    statement.warnings.append(ErrorRecord.about(
+                        'empty_balance', stmt_ofx, bal_type_string))
+                    if self.fail_fast:
                         raise OfxParserException("Empty %s balance\
                             " % bal_type_string)
             if hasattr(dtasof_tag, "contents"):
                 try:
-                    setattr(statement, bal_date_attr, cls.parseOfxDateTime(
+                    setattr(statement, bal_date_attr, self.parseOfxDateTime(
                         dtasof_tag.contents[0].strip()))
                 except IndexError:
-                    statement.warnings.append(
-                        six.u("%s balance date was empty for %s\
-                            ") % (bal_type_string, stmt_ofx))
-                    if cls.fail_fast:
+                    statement.warnings.append(ErrorRecord.about(
+                        'empty_balance_date', stmt_ofx, bal_type_string))
+                    if self.fail_fast:
                         raise
                 except ValueError:
-                    statement.warnings.append(
-                        six.u("%s balance date was not allowed for \
-                            %s") % (bal_type_string, stmt_ofx))
-                    if cls.fail_fast:
+                    statement.warnings.append(ErrorRecord.about(
+                        'invalid_balance_date', stmt_ofx, bal_type_string))
+                    if self.fail_fast:
                         raise
 
-    @classmethod
-    def parseStatement(cls, stmt_ofx):
+    @parsermethod
+    def parseStatement(self, stmt_ofx):
         '''
         Parse a statement in ofx-land and return a Statement object.
         '''
         statement = Statement()
+        if self.columnar:
+            from .ofxtable import TransactionTable
+            statement.transactions = TransactionTable()
         dtstart_tag = stmt_ofx.find('dtstart')
         if hasattr(dtstart_tag, "contents"):
             try:
-                statement.start_date = cls.parseOfxDateTime(
+                statement.start_date = self.parseOfxDateTime(
                     dtstart_tag.contents[0].strip())
             except IndexError:
                 statement.warnings.append(
-                    six.u("Statement start date was empty for %s") % stmt_ofx)
-                if cls.fail_fast:
+                    ErrorRecord.about('empty_start_date', stmt_ofx))
+                if self.fail_fast:
                     raise
             except ValueError:
-                statement.warnings.append(
-                    six.u("Statement start date was not allowed for \
-                        %s") % stmt_ofx)
-                if cls.fail_fast:
+                e = sys.exc_info()[1]
+                statement.warnings.append(ErrorRecord.about(
+                    'invalid_start_date', stmt_ofx, six.text_type(e)))
+                if self.fail_fast:
                     raise
 
         dtend_tag = stmt_ofx.find('dtend')
         if hasattr(dtend_tag, "contents"):
             try:
-                statement.end_date = cls.parseOfxDateTime(
+                statement.end_date = self.parseOfxDateTime(
                     dtend_tag.contents[0].strip())
             except IndexError:
                 statement.warnings.append(
-                    six.u("Statement start date was empty for %s") % stmt_ofx)
-                if cls.fail_fast:
-                    raise
-            except ValueError:
-                msg = six.u("Statement start date was not formatted "
-                            "correctly for %s")
-                statement.warnings.append(msg % stmt_ofx)
-                if cls.fail_fast:
+                    ErrorRecord.about('empty_end_date', stmt_ofx))
+                if self.fail_fast:
                     raise
-            except TypeError:
-                statement.warnings.append(
-                    six.u("Statement start date was not allowed for \
-                        %s") % stmt_ofx)
-                if cls.fail_fast:
+            except (ValueError, TypeError):
+                e = sys.exc_info()[1]
+                statement.warnings.append(ErrorRecord.about(
+                    'invalid_end_date', stmt_ofx, six.text_type(e)))
+                if self.fail_fast:
                     raise
 
         currency_tag = stmt_ofx.find('curdef')
         if hasattr(currency_tag, "contents"):
             try:
-                statement.currency = currency_tag.contents[0].strip().lower()
+                statement.currency = self.interned(
+                    currency_tag.contents[0].strip().lower())
             except IndexError:
                 statement.warnings.append(
-                    six.u("Currency definition was empty for %s") % stmt_ofx)
-                if cls.fail_fast:
+                    ErrorRecord.about('empty_currency', stmt_ofx))
+                if self.fail_fast:
                     raise
 
-        cls.parseBalance(statement, stmt_ofx, 'ledgerbal',
+        self.parseBalance(statement, stmt_ofx, 'ledgerbal',
                          'balance', 'balance_date', 'ledger')
 
-        cls.parseBalance(statement, stmt_ofx, 'availbal', 'available_balance',
+        self.parseBalance(statement, stmt_ofx, 'availbal', 'available_balance',
                          'available_balance_date', 'ledger')
 
         for transaction_ofx in stmt_ofx.findAll('stmttrn'):
             try:
                 statement.transactions.append(
-                    cls.parseTransaction(transaction_ofx))
+                    self.parseTransaction(transaction_ofx))
             except OfxParserException:
                 ofxError = sys.exc_info()[1]
-                statement.discarded_entries.append(
-                    {'error': str(ofxError), 'content': transaction_ofx})
-                if cls.fail_fast:
+                statement.discarded_entries.append(ErrorRecord.about(
+                    'discarded_transaction', transaction_ofx,
+                    six.text_type(ofxError)).entry())
+                if self.fail_fast:
                     raise
 
         return statement
 
-    @classmethod
-    def parseTransaction(cls, txn_ofx):
+    @parsermethod
+    def parseTransaction(self, txn_ofx):
         '''
         Parse a transaction in ofx-land and return a Transaction object.
         '''
         transaction = Transaction()
+        tags = first_tags(txn_ofx, TRANSACTION_TAGS)
 
-        type_tag = txn_ofx.find('trntype')
+        type_tag = tags.get('trntype')
         if hasattr(type_tag, 'contents'):
             try:
-                transaction.type = type_tag.contents[0].lower().strip()
+                transaction.type = self.interned(
+                    type_tag.contents[0].lower().strip())
             except IndexError:
                 raise OfxParserException(six.u("Empty transaction type"))
             except TypeError:
                 raise OfxParserException(
                     six.u("No Transaction type (a required field)"))
 
-        name_tag = txn_ofx.find('name')
+        name_tag = tags.get('name')
         if hasattr(name_tag, "contents"):
             try:
-                transaction.payee = name_tag.contents[0].strip()
+                transaction.payee = self.interned(name_tag.contents[0].strip())
             except IndexError:
                 raise OfxParserException(six.u("Empty transaction name"))
             except TypeError:
                 raise OfxParserException(
                     six.u("No Transaction name (a required field)"))
 
-        memo_tag = txn_ofx.find('memo')
+        memo_tag = tags.get('memo')
         if hasattr(memo_tag, "contents"):
             try:
                 transaction.memo = memo_tag.contents[0].strip()
@@ -996,10 +2279,10 @@ class OfxParser(object):
             except TypeError:
                 pass
 
-        amt_tag = txn_ofx.find('trnamt')
+        amt_tag = tags.get('trnamt')
         if hasattr(amt_tag, "contents"):
             try:
-                transaction.amount = cls.toDecimal(amt_tag)
+                transaction.amount = self.toDecimal(amt_tag)
             except IndexError:
                 raise OfxParserException("Invalid Transaction Date")
             except decimal.InvalidOperation:
@@ -1009,7 +2292,8 @@ class OfxParser(object):
                     transaction.amount = 0
                 else:
                     raise OfxParserException(
-                        six.u("Invalid Transaction Amount: '%s'") % amt_tag.contents[0])
+                        six.u("Invalid Transaction Amount: '%s'")
+                        % amt_tag.contents[0])
             except TypeError:
                 raise OfxParserException(
                     six.u("No Transaction Amount (a required field)"))
@@ -1017,10 +2301,10 @@ class OfxParser(object):
             raise OfxParserException(
                 six.u("Missing Transaction Amount (a required field)"))
 
-        date_tag = txn_ofx.find('dtposted')
+        date_tag = tags.get('dtposted')
         if hasattr(date_tag, "contents"):
             try:
-                transaction.date = cls.parseOfxDateTime(
+                transaction.date = self.parseOfxDateTime(
                     date_tag.contents[0].strip())
             except IndexError:
                 raise OfxParserException("Invalid Transaction Date")
@@ -1034,10 +2318,10 @@ class OfxParser(object):
             raise OfxParserException(
                 six.u("Missing Transaction Date (a required field)"))
 
-        user_date_tag = txn_ofx.find('dtuser')
+        user_date_tag = tags.get('dtuser')
         if hasattr(user_date_tag, "contents"):
             try:
-                transaction.user_date = cls.parseOfxDateTime(
+                transaction.user_date = self.parseOfxDateTime(
                     user_date_tag.contents[0].strip())
             except IndexError:
                 raise OfxParserException("Invalid Transaction User Date")
@@ -1047,7 +2331,7 @@ class OfxParser(object):
             except TypeError:
                 pass
 
-        id_tag = txn_ofx.find('fitid')
+        id_tag = tags.get('fitid')
         if hasattr(id_tag, "contents"):
             try:
                 transaction.id = id_tag.contents[0].strip()
@@ -1060,49 +2344,29 @@ class OfxParser(object):
             raise OfxParserException(six.u("Missing FIT id (a required \
                                      field)"))
 
-        sic_tag = txn_ofx.find('sic')
+        sic_tag = tags.get('sic')
         if hasattr(sic_tag, 'contents'):
             try:
-                transaction.sic = sic_tag.contents[0].strip()
+                transaction.sic = self.interned(sic_tag.contents[0].strip())
             except IndexError:
                 raise OfxParserException(six.u("Empty transaction Standard \
                                          Industry Code (SIC)"))
 
-        if transaction.sic is not None and transaction.sic in mcc.codes:
-            try:
-                transaction.mcc = mcc.codes.get(transaction.sic, '').get('combined \
-                    description')
-            except IndexError:
-                raise OfxParserException(six.u("Empty transaction Merchant Category \
-                    Code (MCC)"))
-            except AttributeError:
-                if cls.fail_fast:
-                    raise
+        if transaction.sic is not None:
+            description = mcc.description(transaction.sic)
+            if description is not None:
+                transaction.mcc = description
 
-        checknum_tag = txn_ofx.find('checknum')
+        checknum_tag = tags.get('checknum')
         if hasattr(checknum_tag, 'contents'):
             try:
                 transaction.checknum = checknum_tag.contents[0].strip()
             except IndexError:
-                raise OfxParserException(six.u("Empty Check (or other reference) \
-                    number"))
+                raise OfxParserException(
+                    six.u("Empty Check (or other reference) number"))
 
         return transaction
 
-    @classmethod
-    def toDecimal(cls, tag):
-        d = tag.contents[0].strip()
-        # Handle 10,000.50 formatted numbers
-        if re.search(r'.*\..*,', d):
-            d = d.replace('.', '')
-        # Handle 10.000,50 formatted numbers
-        if re.search(r'.*,.*\.', d):
-            d = d.replace(',', '')
-        # Handle 10000,50 formatted numbers
-        if '.' not in d and ',' in d:
-            d = d.replace(',', '.')
-        # Handle 1 025,53 formatted numbers
-        d = d.replace(' ', '')
-        # Handle +1058,53 formatted numbers
-        d = d.replace('+', '')
-        return decimal.Decimal(d)
+    @parsermethod
+    def toDecimal(self, tag):
+        return parse_decimal(tag.contents[0].strip(), self.decimal_separator)
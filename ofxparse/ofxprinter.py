@@ -1,5 +1,7 @@
 import six
 
+from .compression import open_output
+
 
 class OfxPrinter():
     ofx = None
@@ -193,8 +195,12 @@ class OfxPrinter():
         self.out_handle = None
 
     def write(self, filename=None, tabs=0):
+        '''
+        Write the OFX to filename, compressed if its extension is .gz,
+        .bz2, .xz or .zip.
+        '''
         if filename is None:
             filename = self.out_filename
 
-        with open(filename, 'w') as f:
+        with open_output(filename) as f:
             self.writeToFile(f)
@@ -0,0 +1,294 @@
+"""
+Columnar storage for the transactions and positions of a statement.
+
+With OfxParser(columnar=True), statements collect their transactions and
+positions in tables instead of lists: each field is kept in its own
+column as rows are appended, dates as int64 microseconds since the epoch
+and decimals as int64 multiples of a power of ten, so a statement with
+many rows holds a handful of arrays rather than an object per row.  The
+tables are sequences of rows, made on demand, so code that iterates over
+statement.transactions keeps working.
+
+The rows are read-only snapshots: each access makes a new object, so
+table[0] is not table[0], and setting an attribute of a row does not change
+the table.  Parse without columnar=True to edit transactions in place.
+"""
+from __future__ import absolute_import
+
+import collections
+import datetime
+import decimal
+from array import array
+
+from .ofxparse import InvestmentTransaction, Position, Transaction
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+# Stands for a missing date, as numpy's NaT does.
+NAT = -2 ** 63
+
+# Stands for a missing decimal, which no stored value can be.
+NULL = -2 ** 63
+
+INT64_MAX = 2 ** 63 - 1
+
+# The most decimal places a DecimalColumn stores as integers.
+MAX_SCALE = 9
+
+
+def numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('to_numpy() requires numpy to be installed')
+    return numpy
+
+
+class ObjectColumn(object):
+    """
+    A column of arbitrary values, such as strings, in a list.
+    """
+    __slots__ = ('values',)
+
+    def __init__(self):
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        return self.values[i]
+
+    def append(self, value):
+        self.values.append(value)
+
+    def to_numpy(self):
+        return numpy().array(self.values, dtype=object)
+
+
+class DateColumn(object):
+    """
+    A column of naive datetimes, as microseconds since the epoch in an
+    array of int64, with None as NAT.  Any other value is kept aside in
+    others, by position.
+    """
+    __slots__ = ('values', 'others')
+
+    def __init__(self):
+        self.values = array('q')
+        self.others = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        if self.others and i in self.others:
+            return self.others[i]
+        value = self.values[i]
+        if value == NAT:
+            return None
+        return EPOCH + datetime.timedelta(microseconds=value)
+
+    def append(self, value):
+        if value is None:
+            self.values.append(NAT)
+        elif isinstance(value, datetime.datetime) and value.tzinfo is None:
+            delta = value - EPOCH
+            self.values.append(
+                (delta.days * 86400 + delta.seconds) * 1000000 +
+                delta.microseconds)
+        else:
+            self.others[len(self.values)] = value
+            self.values.append(NAT)
+
+    def to_numpy(self):
+        """
+        Return the column as a numpy datetime64[us] array, with NaT for the
+        missing dates and the values kept aside.
+        """
+        return numpy().frombuffer(self.values, dtype='int64') \
+            .astype('datetime64[us]')
+
+
+class DecimalColumn(object):
+    """
+    A column of Decimals, as int64 multiples of 10 ** -scale, with None
+    as NULL.  The scale grows to fit the value with the most decimal
+    places.  Values that do not fit and anything else that is not a finite
+    Decimal are kept aside in others, by position.
+    """
+    __slots__ = ('values', 'scale', 'others')
+
+    def __init__(self):
+        self.values = array('q')
+        self.scale = 0
+        self.others = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        if self.others and i in self.others:
+            return self.others[i]
+        value = self.values[i]
+        if value == NULL:
+            return None
+        return decimal.Decimal(value).scaleb(-self.scale)
+
+    def append(self, value):
+        if value is None:
+            self.values.append(NULL)
+            return
+        if isinstance(value, decimal.Decimal) and value.is_finite():
+            exponent = value.as_tuple()[2]
+            if -exponent > self.scale and -exponent <= MAX_SCALE:
+                self.rescale(-exponent)
+            if -exponent <= self.scale:
+                units = int(value.scaleb(self.scale))
+                if -INT64_MAX <= units <= INT64_MAX:
+                    self.values.append(units)
+                    return
+        self.others[len(self.values)] = value
+        self.values.append(0)
+
+    def rescale(self, scale):
+        factor = 10 ** (scale - self.scale)
+        stored = [value for value in self.values if value != NULL]
+        if stored and max(max(stored), -min(stored)) * factor > INT64_MAX:
+            return
+        self.values = array('q', [value if value == NULL else value * factor
+                                  for value in self.values])
+        self.scale = scale
+
+    def to_numpy(self):
+        """
+        Return the column as a numpy float64 array, with NaN for None and
+        the values kept aside that are not numbers.  The exact values are
+        the int64 values, in units of 10 ** -scale.
+        """
+        np = numpy()
+        values = np.frombuffer(self.values, dtype='int64')
+        result = values / 10.0 ** self.scale
+        result[values == NULL] = np.nan
+        for i, value in self.others.items():
+            try:
+                result[i] = float(value)
+            except (TypeError, ValueError):
+                result[i] = np.nan
+        return result
+
+
+class Table(object):
+    """
+    A sequence of rows, the instances of row_classes, stored as columns.
+    fields lists the column of each attribute; optional names the
+    attributes of a row class that may be left unset, and are when their
+    column holds None.
+
+    Rows are made anew from the columns each time they are read, and
+    changes to them are not kept.
+    """
+    row_classes = ()
+    fields = ()
+    optional = {}
+
+    def __init__(self):
+        self.columns = collections.OrderedDict(
+            (name, column()) for name, column in self.fields)
+        self.classes = array('b')
+
+    def __len__(self):
+        return len(self.classes)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.row(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('table index out of range')
+        return self.row(i)
+
+    def __repr__(self):
+        return '<%s of %d rows>' % (type(self).__name__, len(self))
+
+    def append(self, row):
+        self.classes.append(self.row_classes.index(type(row)))
+        for name, column in self.columns.items():
+            column.append(getattr(row, name, None))
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def row(self, i):
+        """
+        Make the row at position i, a copy of its values.
+        """
+        cls = self.row_classes[self.classes[i]]
+        optional = self.optional.get(cls, ())
+        row = cls.__new__(cls)
+        for name in cls.__slots__:
+            value = self.columns[name][i]
+            if value is None and name in optional:
+                continue
+            setattr(row, name, value)
+        return row
+
+    def column(self, name):
+        return self.columns[name]
+
+
+class TransactionTable(Table):
+    row_classes = (Transaction,)
+    fields = (
+        ('id', ObjectColumn),
+        ('type', ObjectColumn),
+        ('date', DateColumn),
+        ('user_date', DateColumn),
+        ('amount', DecimalColumn),
+        ('payee', ObjectColumn),
+        ('memo', ObjectColumn),
+        ('sic', ObjectColumn),
+        ('mcc', ObjectColumn),
+        ('checknum', ObjectColumn),
+    )
+
+
+class InvestmentTransactionTable(Table):
+    """
+    The transactions of an investment statement: investment transactions,
+    and the bank transactions of its INVBANKTRAN aggregates, in document
+    order.
+    """
+    row_classes = (InvestmentTransaction, Transaction)
+    fields = TransactionTable.fields + (
+        ('tradeDate', DateColumn),
+        ('settleDate', DateColumn),
+        ('security', ObjectColumn),
+        ('income_type', ObjectColumn),
+        ('units', DecimalColumn),
+        ('unit_price', DecimalColumn),
+        ('commission', DecimalColumn),
+        ('fees', DecimalColumn),
+        ('total', DecimalColumn),
+        ('tferaction', ObjectColumn),
+        ('inv401ksource', ObjectColumn),
+    )
+    optional = {InvestmentTransaction: ('id', 'inv401ksource')}
+
+
+class PositionTable(Table):
+    row_classes = (Position,)
+    fields = (
+        ('security', ObjectColumn),
+        ('units', DecimalColumn),
+        ('unit_price', DecimalColumn),
+        ('market_value', DecimalColumn),
+        ('date', DateColumn),
+    )
+    optional = {Position: ('date',)}
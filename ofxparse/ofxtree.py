@@ -0,0 +1,415 @@
+"""
+A small, purpose-built tokenizer and tree builder for OFX documents.
+
+It understands SGML-style OFX 1.x (leaf elements that are never closed) as
+well as XML-style OFX 2.x natively, so documents do not need to be run
+through OfxPreprocessedFile first.  The tree it builds offers the subset
+of the BeautifulSoup Tag API that OfxParser relies on (name, contents,
+find, findAll), so either can be handed to the parse* methods.
+
+Well-formed OFX 2.x documents can also be fed straight to expat, which
+builds the same tree through OfxTreeTarget.
+"""
+from __future__ import absolute_import
+
+import bisect
+import re
+from xml.etree import ElementTree
+
+import six
+
+try:
+    from html import unescape
+except ImportError:
+    from HTMLParser import HTMLParser
+    unescape = HTMLParser().unescape
+
+
+# Tags are matched the way html.parser matches them, so both builders agree
+# on what is markup and what is character data.
+TOKEN_RE = re.compile(
+    r'<(?:'
+    r'(/?)([a-zA-Z][^\t\n\r\f />\x00]*)[^>]*'  # start or end tag
+    r'|!\[CDATA\[(.*?)\]\]'                    # CDATA section
+    r'|!--.*?--'                               # comment
+    r'|[!?][^>]*'                              # declaration or PI
+    r')>', re.DOTALL)
+
+# The same, for tokenizing the bytes of a document in an ASCII compatible
+# encoding.
+BYTES_TOKEN_RE = re.compile(TOKEN_RE.pattern.encode('ascii'), re.DOTALL)
+
+
+def escape(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;') \
+        .replace('>', '&gt;')
+
+
+@six.python_2_unicode_compatible
+class OfxTag(object):
+    """
+    An element of the tree.  Elements made by OfxTreeBuilder are numbered
+    in document order, and each records the number of its last descendant
+    (end), so the document root's index of elements by name answers find
+    and findAll for any subtree with a binary search instead of a walk.
+    They also record where their start tag is in the text (offset).
+    """
+    __slots__ = ('name', 'contents', 'parent', 'order', 'end', 'index',
+                 'offset')
+
+    def __init__(self, name, parent=None, order=None, offset=None):
+        self.name = name
+        self.contents = []
+        self.parent = parent
+        self.order = order
+        self.end = order
+        self.offset = offset
+
+    def __bool__(self):
+        # Like a BeautifulSoup Tag, an element is true even when empty.
+        return True
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        return iter(self.contents)
+
+    def __len__(self):
+        return len(self.contents)
+
+    def __str__(self):
+        return six.u('<%s>%s</%s>') % (
+            self.name,
+            six.u('').join(
+                six.text_type(child) if isinstance(child, OfxTag)
+                else escape(child)
+                for child in self.contents
+            ),
+            self.name)
+
+    def __repr__(self):
+        return '<OfxTag %s>' % self.name
+
+    @property
+    def descendants(self):
+        """
+        All tags and strings below this element, in document order.
+        """
+        stack = self.contents[::-1]
+        while stack:
+            node = stack.pop()
+            yield node
+            if isinstance(node, OfxTag) and node.contents:
+                stack.extend(node.contents[::-1])
+
+    def tree_index(self):
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        return getattr(root, 'index', None)
+
+    def indexed(self, name):
+        """
+        Return the elements below this one called name using the document
+        index, or None if this element is not part of an indexed tree.
+        """
+        index = self.tree_index()
+        if index is None or self.order is None:
+            return None
+        orders, tags = index.get(name, ((), ()))
+        return tags[bisect.bisect_right(orders, self.order):
+                    bisect.bisect_right(orders, self.end)]
+
+    def iter_tags(self, name=None):
+        """
+        Yield the elements below this one in document order, optionally
+        only those called name (a tag name or a collection of them).
+        """
+        if isinstance(name, six.string_types):
+            tags = self.indexed(name)
+            if tags is not None:
+                for tag in tags:
+                    yield tag
+                return
+            match = (name,)
+        elif name is None:
+            match = None
+        else:
+            match = frozenset(name)
+        stack = self.contents[::-1]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, OfxTag):
+                if match is None or node.name in match:
+                    yield node
+                if node.contents:
+                    stack.extend(node.contents[::-1])
+
+    def find(self, name):
+        for tag in self.iter_tags(name):
+            return tag
+        return None
+
+    def findAll(self, name):
+        if isinstance(name, six.string_types):
+            tags = self.indexed(name)
+            if tags is not None:
+                return tags
+        return list(self.iter_tags(name))
+
+    find_all = findAll
+
+
+class OfxTreeBuilder(object):
+    """
+    Build an OfxTag tree from OFX text.
+
+    A leaf element is closed as soon as another tag follows its character
+    data.  An element that is only closed implicitly, by the end tag of one
+    of its ancestors, is taken to be an empty SGML leaf: anything nested
+    inside it is moved back up to its parent.
+    """
+
+    def __init__(self):
+        self.root = OfxTag('[document]', order=0)
+        self.root.index = {}
+
+    def build(self, text, encoding=None):
+        """
+        Build the tree of text or, given its encoding, of a buffer of bytes
+        such as an mmap.  The encoding has to be ASCII compatible: the
+        markup is matched in the bytes, and only character data and tag
+        names are decoded, a piece at a time.
+        """
+        token_re = TOKEN_RE if encoding is None else BYTES_TOKEN_RE
+        root = self.root
+        index = root.index
+        # The name of each tag as it is written, lowercased and decoded.
+        names = {}
+        count = 0
+        current = root
+        stack = []
+        has_children = False  # current has element children
+        leaf = False  # current holds character data, close at the next tag
+        pos = 0
+        for match in token_re.finditer(text):
+            start = match.start()
+            if start > pos:
+                data = text[pos:start]
+                # Whitespace between tags is mostly dropped, so it is only
+                # decoded when it is kept.
+                space = data.isspace()
+                if not space:
+                    if encoding is not None:
+                        # ASCII reads the same in any ASCII compatible
+                        # encoding, and has the fastest decoder.
+                        try:
+                            data = data.decode('ascii')
+                        except UnicodeDecodeError:
+                            data = data.decode(encoding)
+                    if '&' in data:
+                        data = unescape(data)
+                        space = data.isspace()
+                if not space:
+                    current.contents.append(data)
+                    leaf = not has_children
+                elif not current.contents:
+                    if encoding is not None and \
+                            not isinstance(data, six.text_type):
+                        data = data.decode(encoding)
+                    current.contents.append(data)
+            pos = match.end()
+
+            closing, name, data = match.groups()
+            if name is None:
+                if data is not None:
+                    if encoding is not None:
+                        data = data.decode(encoding)
+                    current.contents.append(data)
+                    leaf = not has_children
+                continue
+            if name in names:
+                name = names[name]
+            else:
+                names[name] = (
+                    name if encoding is None else name.decode(encoding)
+                ).lower()
+                name = names[name]
+
+            if not closing:
+                if leaf and stack:
+                    current.end = count
+                    current, has_children = stack.pop()
+                count += 1
+                tag = OfxTag(name, current, count, start)
+                current.contents.append(tag)
+                if name in index:
+                    orders, tags = index[name]
+                else:
+                    orders, tags = index[name] = ([], [])
+                orders.append(count)
+                tags.append(tag)
+                stack.append((current, True))
+                current = tag
+                has_children = leaf = False
+            elif current.name == name:
+                current.end = count
+                current, has_children = stack.pop()
+                leaf = False
+            elif any(tag.name == name for tag, _ in stack):
+                while current.name != name:
+                    self.close_implicitly(current)
+                    current, has_children = stack.pop()
+                current.end = count
+                current, has_children = stack.pop()
+                leaf = False
+
+        if pos < len(text):
+            data = text[pos:]
+            if encoding is not None:
+                data = data.decode(encoding)
+            if '&' in data:
+                data = unescape(data)
+            if not data.isspace() or not current.contents:
+                current.contents.append(data)
+        current.end = count
+        for tag, _ in stack:
+            tag.end = count
+        return root
+
+    @staticmethod
+    def close_implicitly(tag):
+        """
+        Hoist everything from the first element child of tag onwards up to
+        tag's parent, leaving tag with just its leading character data.
+        """
+        tag.end = tag.order
+        for i, child in enumerate(tag.contents):
+            if isinstance(child, OfxTag):
+                moved = tag.contents[i:]
+                del tag.contents[i:]
+                for node in moved:
+                    if isinstance(node, OfxTag):
+                        node.parent = tag.parent
+                tag.parent.contents.extend(moved)
+                return
+
+
+def tree_maker(fh):
+    """
+    Build an OfxTag tree from a text stream or string.
+    """
+    text = fh if isinstance(fh, six.string_types) else fh.read()
+    return OfxTreeBuilder().build(text)
+
+
+def is_ascii_compatible(encoding):
+    """
+    Return whether text in encoding has its markup as ASCII bytes.
+    """
+    return six.u('<a>&').encode(encoding) == six.b('<a>&')
+
+
+class MappedDocument(object):
+    """
+    The bytes of a document, such as an mmap of its file, and their
+    encoding.
+    """
+    __slots__ = ('buffer', 'encoding')
+
+    def __init__(self, buffer, encoding):
+        self.buffer = buffer
+        self.encoding = encoding
+
+    def close(self):
+        if hasattr(self.buffer, 'close'):
+            self.buffer.close()
+
+
+def mapped_tree_maker(document):
+    """
+    Build an OfxTag tree from a MappedDocument, which is closed when the
+    tree is built, or from text like tree_maker.
+    """
+    if not isinstance(document, MappedDocument):
+        return tree_maker(document)
+    try:
+        return OfxTreeBuilder().build(document.buffer, document.encoding)
+    finally:
+        document.close()
+
+
+def local_name(name):
+    """
+    Return the lowercase name of an element as expat gives it, without the
+    {namespace} of OFX 2.x documents that declare one.
+    """
+    if name.startswith('{'):
+        name = name[name.index('}') + 1:]
+    return name.lower()
+
+
+class OfxTreeTarget(object):
+    """
+    An ElementTree parser target that builds the same OfxTag tree as
+    OfxTreeBuilder from well-formed XML.
+    """
+
+    def __init__(self):
+        self.root = OfxTag('[document]', order=0)
+        self.root.index = {}
+        self.current = self.root
+        self.count = 0
+        self.data_parts = []
+
+    def flush(self):
+        if self.data_parts:
+            data = ''.join(self.data_parts)
+            del self.data_parts[:]
+            if not data.isspace() or not self.current.contents:
+                self.current.contents.append(data)
+
+    def start(self, name, attrs):
+        self.flush()
+        name = local_name(name)
+        self.count += 1
+        tag = OfxTag(name, self.current, self.count)
+        self.current.contents.append(tag)
+        index = self.root.index
+        if name in index:
+            orders, tags = index[name]
+        else:
+            orders, tags = index[name] = ([], [])
+        orders.append(self.count)
+        tags.append(tag)
+        self.current = tag
+
+    def end(self, name):
+        self.flush()
+        self.current.end = self.count
+        self.current = self.current.parent
+
+    def data(self, data):
+        self.data_parts.append(data)
+
+    def close(self):
+        self.flush()
+        self.root.end = self.count
+        return self.root
+
+
+def xml_tree_maker(fh, chunk_size=64 * 1024):
+    """
+    Build an OfxTag tree by feeding an XML byte stream to expat a chunk at
+    a time, or return None if the document is not well-formed.
+    """
+    parser = ElementTree.XMLParser(target=OfxTreeTarget())
+    # The XML declaration has to come first.
+    chunk = fh.read(chunk_size).lstrip()
+    try:
+        while chunk:
+            parser.feed(chunk)
+            chunk = fh.read(chunk_size)
+        return parser.close()
+    except ElementTree.ParseError:
+        return None
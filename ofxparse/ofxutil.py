@@ -5,6 +5,9 @@ import collections
 import xml.etree.ElementTree as ET
 import six
 
+from .compression import compression_of, open_output
+from .ofxparse import OfxFile
+
 if 'OrderedDict' in dir(collections):
     odict = collections
 else:
@@ -15,6 +18,15 @@ class InvalidOFXStructureException(Exception):
     pass
 
 
+def is_file_name(ofx_data):
+    """
+    Return whether ofx_data names an OFX file, possibly compressed, rather
+    than being OFX.
+    """
+    return ofx_data.lower().endswith('.ofx') or \
+        compression_of(ofx_data) is not None
+
+
 class OfxData(object):
     def __init__(self, tag):
         self.nodes = odict.OrderedDict()
@@ -38,8 +50,8 @@ class OfxData(object):
             del self.nodes[name]
 
     def __setattr__(self, name, value):
-        if name in self.__dict__ or name in ['nodes', 'tag', 'data', '\
-                headers', 'xml']:
+        if name in self.__dict__ or name in ['nodes', 'tag', 'data',
+                                             'headers', 'xml']:
             self.__dict__[name] = value
         else:
             self.del_tag(name)
@@ -133,11 +145,13 @@ class OfxUtil(OfxData):
         self.xml = ""
         if ofx_data:
             if isinstance(ofx_data, six.string_types) and not \
-                    ofx_data.lower().endswith('.ofx'):
+                    is_file_name(ofx_data):
                 self.parse(ofx_data)
+            elif isinstance(ofx_data, six.string_types):
+                with open(ofx_data, 'rb') as f:
+                    self.parse(OfxFile(f).read())
             else:
-                self.parse(open(ofx_data).read() if isinstance(
-                    ofx_data, six.string_types) else ofx_data.read())
+                self.parse(OfxFile(ofx_data).read())
 
     def parse(self, ofx):
         try:
@@ -211,7 +225,7 @@ class OfxUtil(OfxData):
         self.load_from_xml(self, self.xml)
 
     def write(self, output_file):
-        with open(output_file, 'wb') as f:
+        with open_output(output_file) as f:
             f.write(str(self))
 
     def __str__(self):
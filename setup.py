@@ -51,8 +51,10 @@ setup_params = dict(
     license='MIT License',
     packages=find_packages(exclude=['ez_setup', 'examples', 'tests']),
     include_package_data=True,
+    package_data={'ofxparse': ['mcc.tsv']},
     zip_safe=True,
     install_requires=REQUIRES,
+    extras_require={'pandas': ['pandas']},
     entry_points="""
     """,
     test_suite='tests',
@@ -1,5 +1,7 @@
 import os
 
+from ofxparse.ofxparse import ErrorRecord
+
 
 def open_file(filename, mode='rb'):
     """
@@ -9,3 +11,49 @@ def open_file(filename, mode='rb'):
     if 'tests' in os.listdir('.'):
         path = os.path.join('tests', path)
     return open(path, mode=mode)
+
+
+def fixture_names():
+    """
+    List the .ofx files in the fixtures directory, including fail_nice/.
+    """
+    base = os.path.join('tests', 'fixtures') \
+        if 'tests' in os.listdir('.') else 'fixtures'
+    names = []
+    for subdir in ('', 'fail_nice'):
+        for name in sorted(os.listdir(os.path.join(base, subdir))):
+            if name.endswith('.ofx'):
+                names.append(os.path.join(subdir, name) if subdir else name)
+    return names
+
+
+def object_graph(obj):
+    """
+    Convert a parse result into plain lists, dicts and values so results
+    from different parser backends can be compared.  Warnings are only
+    counted and discarded entries only keep their code, tag and detail, as
+    where they start and their markup depend on the backend.
+    """
+    if isinstance(obj, ErrorRecord):
+        return [obj.code, obj.tag, obj.detail]
+    if isinstance(obj, (list, tuple)):
+        return [object_graph(item) for item in obj]
+    if isinstance(obj, dict):
+        return dict((key, object_graph(value)) for key, value in obj.items()
+                    if key != 'content')
+    if hasattr(obj, '__dict__') or hasattr(obj, '__slots__'):
+        graph = {}
+        for name in dir(obj):
+            if name.startswith('_'):
+                continue
+            if not hasattr(obj, name):
+                # An optional attribute that was not set.
+                continue
+            value = getattr(obj, name)
+            if callable(value):
+                continue
+            if name == 'warnings':
+                value = len(value)
+            graph[name] = object_graph(value)
+        return type(obj).__name__, graph
+    return obj
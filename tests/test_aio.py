@@ -0,0 +1,94 @@
+from __future__ import absolute_import
+
+import sys
+from unittest import TestCase, skipIf
+
+from ofxparse import OfxParser
+from ofxparse.ofxparse import OfxParserException
+from .support import open_file, object_graph
+
+if sys.version_info >= (3, 6):
+    import asyncio
+    from ofxparse import aio
+else:
+    aio = None
+
+
+class ChunkIterator(object):
+    """
+    An async iterator over chunks of data, written without async syntax
+    so this module still imports on older Pythons.
+    """
+
+    def __init__(self, data, size):
+        self.chunks = [data[i:i + size] for i in range(0, len(data), size)]
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        future = asyncio.get_event_loop().create_future()
+        if self.chunks:
+            future.set_result(self.chunks.pop(0))
+        else:
+            future.set_exception(StopAsyncIteration())
+        return future
+
+
+@skipIf(aio is None, 'asyncio support needs Python 3.6')
+class TestAio(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+    def read(self, name):
+        with open_file(name) as f:
+            return f.read()
+
+    def stream_reader(self, data):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    def collect(self, async_iterator):
+        items = []
+        while True:
+            try:
+                items.append(self.loop.run_until_complete(
+                    async_iterator.__anext__()))
+            except StopAsyncIteration:
+                return items
+
+    def testParse(self):
+        data = self.read('bank_medium.ofx')
+        with open_file('bank_medium.ofx') as f:
+            expected = object_graph(OfxParser.parse(f))
+        for source in (self.stream_reader(data), ChunkIterator(data, 100)):
+            ofx = self.loop.run_until_complete(aio.parse(source))
+            self.assertEqual(expected, object_graph(ofx))
+
+    def testIterTransactions(self):
+        data = self.read('investment_401k.ofx')
+        with open_file('investment_401k.ofx') as f:
+            expected = list(OfxParser.iter_transactions(f))
+        for source in (self.stream_reader(data), ChunkIterator(data, 7)):
+            pairs = self.collect(aio.iter_transactions(source, chunk_size=7))
+            self.assertEqual(len(expected), len(pairs))
+            for (account, txn), (expected_account, expected_txn) in zip(
+                    pairs, expected):
+                self.assertEqual(expected_account.account_id,
+                                 account.account_id)
+                self.assertEqual(object_graph(expected_txn),
+                                 object_graph(txn))
+
+    def testIterTransactionsFailFast(self):
+        data = self.read('fail_nice/date_missing.ofx')
+        with self.assertRaises(OfxParserException):
+            self.collect(aio.iter_transactions(self.stream_reader(data)))
+        parser = OfxParser(fail_fast=False)
+        pairs = self.collect(aio.iter_transactions(
+            self.stream_reader(data), parser=parser))
+        self.assertEqual([], pairs)
@@ -0,0 +1,73 @@
+from __future__ import absolute_import
+
+from datetime import datetime
+from decimal import Decimal
+from unittest import TestCase, skipIf
+
+from ofxparse import OfxParser
+from ofxparse.ofxframe import to_dataframe
+from .support import open_file
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def parse(name, **settings):
+    with open_file(name) as f:
+        return OfxParser(**settings).parse(f)
+
+
+@skipIf(pandas is None, 'pandas is not installed')
+class TestToDataFrame(TestCase):
+    def testBankStatement(self):
+        ofx = parse('bank_medium.ofx')
+        frame = ofx.to_dataframe()
+        transactions = ofx.account.statement.transactions
+        self.assertEqual(len(transactions), len(frame))
+        self.assertEqual(['account', 'currency', 'id', 'type', 'date'],
+                         list(frame.columns[:5]))
+        self.assertEqual('category', frame['type'].dtype.name)
+        self.assertEqual('category', frame['payee'].dtype.name)
+        self.assertEqual(datetime(2009, 4, 1, 17, 20, 17), frame['date'][0])
+        self.assertEqual(Decimal('-6.60'), frame['amount'][0])
+        self.assertEqual('12300 000012345678', frame['account'][0])
+        self.assertTrue(frame['user_date'].isnull().all())
+
+        frame = ofx.account.statement.to_dataframe(decimals='float')
+        self.assertEqual('float64', frame['amount'].dtype.name)
+        self.assertEqual(-6.6, frame['amount'][0])
+
+    def testColumnarMatches(self):
+        for name in ('bank_medium.ofx', 'investment_401k.ofx'):
+            for decimals in ('decimal', 'float'):
+                expected = parse(name).to_dataframe(decimals=decimals)
+                frame = parse(name, columnar=True).to_dataframe(
+                    decimals=decimals)
+                pandas.testing.assert_frame_equal(expected, frame)
+
+    def testManyFiles(self):
+        sources = {'bank': parse('bank_medium.ofx'),
+                   'investment': parse('investment_401k.ofx')}
+        frame = to_dataframe(sources)
+        self.assertEqual('source', frame.columns[0])
+        self.assertEqual(set(['bank', 'investment']),
+                         set(frame['source'].cat.categories))
+        self.assertIn('units', frame.columns)
+        investment = frame[frame['source'] == 'investment']
+        self.assertEqual('buymf', investment['type'].iloc[0])
+        self.assertTrue(investment['units'].iloc[0] is not None)
+
+    def testPositions(self):
+        ofx = parse('investment_401k.ofx')
+        frame = ofx.to_dataframe(positions=True)
+        positions = ofx.account.statement.positions
+        self.assertEqual(len(positions), len(frame))
+        self.assertEqual(positions[0].market_value,
+                         frame['market_value'][0])
+
+    def testEmpty(self):
+        frame = parse('signon_success.ofx').to_dataframe()
+        self.assertEqual(0, len(frame))
+        self.assertEqual('datetime64[us]', frame['date'].dtype.name)
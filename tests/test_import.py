@@ -0,0 +1,57 @@
+from __future__ import absolute_import
+
+import json
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+# The documented budget for ``import ofxparse`` (see README.rst), with room
+# for slow machines.
+IMPORT_BUDGET = 0.1
+
+HEAVY_MODULES = ['bs4', 'lxml', 'ofxparse.ofxparse', 'ofxparse.ofxprinter',
+                 'ofxparse.ofxlxml']
+
+CHILD = '''
+import json, sys, time
+start = time.time()
+import ofxparse
+seconds = time.time() - start
+%s
+print(json.dumps([seconds, [m for m in %r if m in sys.modules]]))
+'''
+
+
+def run_child(statement=''):
+    output = subprocess.check_output(
+        [sys.executable, '-c', CHILD % (statement, HEAVY_MODULES)])
+    return json.loads(output.decode('ascii'))
+
+
+@skipIf(sys.version_info < (3, 7), 'imports are deferred from Python 3.7')
+class TestImport(TestCase):
+    def testImportIsCheap(self):
+        seconds, loaded = min(run_child() for _ in range(3))
+        self.assertEqual([], loaded)
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+    def testNamesLoadOnFirstUse(self):
+        _, loaded = run_child('ofxparse.OfxParser')
+        self.assertEqual(['ofxparse.ofxparse'], loaded)
+        _, loaded = run_child('ofxparse.ofxparse.OfxFile')
+        self.assertEqual(['ofxparse.ofxparse'], loaded)
+
+    def testWarmup(self):
+        _, loaded = run_child(
+            'ofxparse.warmup(); from ofxparse import mcc; '
+            'assert mcc._table is not None')
+        self.assertEqual(['bs4', 'ofxparse.ofxparse', 'ofxparse.ofxprinter'],
+                         [m for m in loaded if m not in
+                          ('lxml', 'ofxparse.ofxlxml')])
+
+    def testPublicNames(self):
+        import ofxparse
+        for name in ofxparse.__all__:
+            self.assertTrue(hasattr(ofxparse, name))
+            self.assertIn(name, dir(ofxparse))
+        self.assertRaises(AttributeError, getattr, ofxparse, 'nothing')
@@ -0,0 +1,82 @@
+from __future__ import absolute_import
+
+from unittest import TestCase
+
+from ofxparse import mcc
+
+
+class TestCodes(TestCase):
+    def testLookup(self):
+        self.assertEqual({
+            'combined description': 'Veterinary Services',
+            'USDA description': 'Veterinary Services',
+            'IRS Description': 'Veterinary Services',
+            'Reportable under 6041/6041A and Authority for Exception': 'Yes',
+        }, mcc.codes['742'])
+        self.assertEqual('Grocery Stores, Supermarkets',
+                         mcc.description('5411'))
+
+    def testMapping(self):
+        self.assertEqual(975, len(mcc.codes))
+        self.assertIn('0', mcc.codes)
+        self.assertIn('9999', mcc.codes)
+        self.assertNotIn('05411', mcc.codes)
+        self.assertNotIn('x', mcc.codes)
+        self.assertNotIn(5411, mcc.codes)
+        self.assertEqual(None, mcc.codes.get('1'))
+        self.assertRaises(KeyError, lambda: mcc.codes['1'])
+        self.assertEqual(None, mcc.description('1'))
+        codes = list(mcc.codes)
+        self.assertEqual(sorted(codes, key=int), codes)
+
+    def testStringsAreShared(self):
+        table = mcc.table()
+        self.assertEqual(len(set(table.strings)), len(table.strings))
+        self.assertIs(mcc.codes['3000']['IRS Description'],
+                      mcc.codes['3001']['IRS Description'])
+
+
+class TestIndex(TestCase):
+    def testRanges(self):
+        airlines = mcc.codes_between(3000, 3299)
+        self.assertEqual('3000', airlines[0])
+        self.assertEqual('3299', airlines[-1])
+        self.assertEqual(airlines, mcc.codes_in('Airlines'))
+        self.assertEqual(['3501', '3502'], mcc.codes_in('Lodging')[:2])
+        self.assertEqual([], mcc.codes_between(3300, 3350))
+        self.assertRaises(KeyError, mcc.codes_in, 'Spaceports')
+
+    def testReverseLookup(self):
+        self.assertEqual(['5411'],
+                         mcc.codes_described('grocery stores, supermarkets'))
+        rentals = mcc.codes_described('Car Rental', mcc.IRS)
+        self.assertEqual(set(mcc.codes_in('Car Rental')), set(rentals))
+        self.assertEqual([], mcc.codes_described('nothing'))
+
+    def testCategory(self):
+        self.assertEqual('Airlines', mcc.category('3100'))
+        self.assertEqual('Airlines', mcc.category(3100))
+        self.assertEqual('Government Services', mcc.category('9999'))
+        self.assertEqual(None, mcc.category('0'))
+        self.assertEqual(None, mcc.category('x'))
+
+    def testReportable(self):
+        self.assertEqual(True, mcc.reportable('742'))
+        self.assertEqual(False, mcc.reportable('9950'))
+        self.assertEqual(None, mcc.reportable('9700'))
+        self.assertEqual(None, mcc.reportable('1'))
+
+    def testClassify(self):
+        class Transaction(object):
+            def __init__(self, sic):
+                self.sic = sic
+
+        result = mcc.classify(
+            [Transaction(sic) for sic in ('5411', '3100', None, '5411')])
+        self.assertEqual(
+            mcc.Classification('5411', 'Grocery Stores, Supermarkets',
+                               'Retail Outlet Services', False), result[0])
+        self.assertEqual('Airlines', result[1].category)
+        self.assertEqual(mcc.Classification(None, None, None, None),
+                         result[2])
+        self.assertIs(result[0], result[3])
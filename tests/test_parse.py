@@ -1,17 +1,31 @@
 from __future__ import absolute_import
 
+import bz2
+import gzip
+import io
 import os
+import pickle
 from datetime import datetime, timedelta
-from decimal import Decimal
-from unittest import TestCase
+from decimal import Decimal, InvalidOperation
+from unittest import TestCase, skipIf
 import sys
+import threading
+import zipfile
 sys.path.insert(0, os.path.abspath('..'))
 
 import six
 
-from .support import open_file
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+from .support import open_file, fixture_names, object_graph
 from ofxparse import OfxParser, AccountType, Account, Statement, Transaction
-from ofxparse.ofxparse import OfxFile, OfxPreprocessedFile, OfxParserException, soup_maker
+from ofxparse.ofxparse import OfxFile, OfxPreprocessedFile, OfxParserException, soup_maker, ErrorRecord, SNIPPET_LENGTH, TransactionStream, TextBuffer, close_tags, iter_close_tags, OfxMappedFile, LookaheadStream
+from ofxparse.ofxtree import (MappedDocument, OfxTreeBuilder,
+                              mapped_tree_maker, tree_maker, xml_tree_maker)
+from ofxparse.ofxlxml import etree as lxml_etree, lxml_maker
 
 
 class TestOfxFile(TestCase):
@@ -123,10 +137,65 @@ NEWFILEUID:NONE
         ofx_file = self.OfxFileCls(fh)
         self.assertEqual(len(ofx_file.headers.keys()), 2)
 
+    def testXmlHeaders(self):
+        expect = {"OFXHEADER": six.u("200"),
+                  "VERSION": six.u("200"),
+                  "SECURITY": None,
+                  "OLDFILEUID": None,
+                  "NEWFILEUID": None,
+                  }
+        with open_file('suncorp.ofx') as f:
+            ofx_file = self.OfxFileCls(f)
+            self.assertTrue(ofx_file.xml)
+            self.assertEqual(expect, ofx_file.headers)
+            self.assertHeadersTypes(ofx_file.headers)
+            self.assertTrue(type(ofx_file.fh.read()) is six.text_type)
+
+    def testTextIsNotEncodedAgain(self):
+        text = six.u("""OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+SECURITY:NONE
+ENCODING:UTF-8
+CHARSET:CSUNICODE
+COMPRESSION:NONE
+OLDFILEUID:NONE
+NEWFILEUID:NONE
+
+<OFX><NAME>\u65e5\u672c \u20ac</NAME></OFX>
+""")
+        ofx_file = self.OfxFileCls(six.StringIO(text))
+        self.assertEqual('utf-8', ofx_file.encoding)
+        self.assertIn(six.u('<NAME>\u65e5\u672c \u20ac</NAME>'),
+                      ofx_file.read())
+        self.assertIsNone(ofx_file.fh)
+
+
+class TestTextBuffer(TestCase):
+    def testRead(self):
+        text = six.u('<OFX>abc</OFX>')
+        fh = TextBuffer(text)
+        self.assertEqual('<OFX>', fh.read(5))
+        self.assertEqual(5, fh.tell())
+        self.assertEqual('abc</OFX>', fh.read())
+        self.assertEqual('', fh.read(1))
+        fh.seek(0)
+        # Reading all of it gives the string itself.
+        self.assertIs(text, fh.read())
+        fh.seek(-6, 2)
+        self.assertEqual('</OFX>', fh.read())
+
 
 class TestOfxPreprocessedFile(TestOfxFile):
     OfxFileCls = OfxPreprocessedFile
 
+    def testChunks(self):
+        with open_file('bank_medium.ofx') as f:
+            text = f.read().decode('ascii')
+        chunks = list(iter_close_tags(text, 50))
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(close_tags(text), ''.join(chunks))
+
     def testPreprocess(self):
         fh = six.BytesIO(six.b("""OFXHEADER:100
 DATA:OFXSGML
@@ -221,6 +290,624 @@ class TestParse(TestCase):
         self.assertEqual('SAVINGS', ofx.accounts[1].account_type)
 
 
+def pipe(data, mode='rb'):
+    """
+    Return the reading end of an OS pipe that a thread writes data into.
+    """
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, 'wb') as f:
+            f.write(data)
+    thread = threading.Thread(target=write)
+    thread.daemon = True
+    thread.start()
+    return io.open(read_fd, mode, encoding=None if 'b' in mode else 'ascii')
+
+
+class TestForwardOnlyStreams(TestCase):
+    def expected(self, name, backend):
+        with open_file(name) as f:
+            return object_graph(OfxParser.parse(f, backend=backend))
+
+    def testPipe(self):
+        for name in ('bank_medium.ofx', 'suncorp.ofx', 'vanguard.ofx'):
+            with open_file(name) as f:
+                data = f.read()
+            for backend in ('beautifulsoup', 'native', 'mmap'):
+                with pipe(data) as f:
+                    self.assertFalse(f.seekable())
+                    ofx = OfxParser.parse(f, backend=backend)
+                self.assertEqual(self.expected(name, backend),
+                                 object_graph(ofx))
+
+    def testTextPipe(self):
+        with open_file('bank_medium.ofx') as f:
+            data = f.read()
+        with pipe(data, 'r') as f:
+            ofx = OfxParser.parse(f, backend='native')
+        self.assertEqual(self.expected('bank_medium.ofx', 'native'),
+                         object_graph(ofx))
+
+    def testReadOnly(self):
+        class Reader(object):
+            # Nothing but read(), like some HTTP and socket wrappers.
+            def __init__(self, data):
+                self.read = io.BytesIO(data).read
+
+        with open_file('checking.ofx') as f:
+            data = f.read()
+        for backend in ('beautifulsoup', 'native', 'mmap'):
+            ofx = OfxParser.parse(Reader(data), backend=backend)
+            self.assertEqual(self.expected('checking.ofx', backend),
+                             object_graph(ofx))
+
+    def testIterTransactions(self):
+        with open_file('bank_medium.ofx') as f:
+            data = f.read()
+        with pipe(data) as f:
+            pairs = list(OfxParser.iter_transactions(f, chunk_size=100))
+        self.assertEqual(3, len(pairs))
+
+    def testLookahead(self):
+        stream = LookaheadStream(io.BufferedReader(io.BytesIO(b'0123456789')),
+                                 size=4)
+        self.assertEqual(b'01', stream.read(2))
+        self.assertEqual(0, stream.seek(0))
+        self.assertEqual(b'0123', stream.read(4))
+        self.assertEqual(1, stream.seek(-3, 1))
+        self.assertEqual(b'12345', stream.read(5))
+        self.assertEqual(6, stream.tell())
+        # It cannot go back once it has read past what it keeps.
+        self.assertRaises(io.UnsupportedOperation, stream.seek, 0)
+        self.assertEqual(b'6789', stream.read())
+
+
+def compress(data, compression):
+    """
+    Return data compressed in the given format, as a zip archive with the
+    member names given by compression if it is a list.
+    """
+    if compression == 'gzip':
+        return gzip.compress(data)
+    if compression == 'bz2':
+        return bz2.compress(data)
+    if compression == 'xz':
+        return lzma.compress(data)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name in compression:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+@skipIf(six.PY2, 'compressed streams are read with Python 3')
+class TestCompressedStreams(TestCase):
+    def expected(self, name, backend):
+        with open_file(name) as f:
+            return object_graph(OfxParser.parse(f, backend=backend))
+
+    def testCompressed(self):
+        for name in ('bank_medium.ofx', 'suncorp.ofx'):
+            with open_file(name) as f:
+                data = f.read()
+            for compression in ('gzip', 'bz2', 'xz', ['statement.QFX']):
+                compressed = io.BytesIO(compress(data, compression))
+                for backend in ('beautifulsoup', 'native', 'mmap'):
+                    compressed.seek(0)
+                    ofx = OfxParser.parse(compressed, backend=backend)
+                    self.assertEqual(self.expected(name, backend),
+                                     object_graph(ofx))
+
+    def testCompressedPipe(self):
+        with open_file('bank_medium.ofx') as f:
+            data = f.read()
+        for compression in ('gzip', 'bz2', 'xz'):
+            with pipe(compress(data, compression)) as f:
+                ofx = OfxParser.parse(f, backend='native')
+            self.assertEqual(self.expected('bank_medium.ofx', 'native'),
+                             object_graph(ofx))
+        with pipe(compress(data, ['statement.ofx'])) as f:
+            self.assertRaises(io.UnsupportedOperation, OfxParser.parse, f)
+
+    def testIterTransactions(self):
+        with open_file('bank_medium.ofx') as f:
+            data = f.read()
+        compressed = io.BytesIO(compress(data, 'gzip'))
+        pairs = list(OfxParser.iter_transactions(compressed, chunk_size=100))
+        self.assertEqual(3, len(pairs))
+
+    def testZipMembers(self):
+        with open_file('bank_medium.ofx') as f:
+            data = f.read()
+        # Files that are not OFX are left alone.
+        compressed = compress(data, ['README.txt', 'statement.ofx'])
+        ofx = OfxParser.parse(io.BytesIO(compressed), backend='native')
+        self.assertEqual(self.expected('bank_medium.ofx', 'native'),
+                         object_graph(ofx))
+        compressed = compress(data, ['one.ofx', 'two.ofx'])
+        self.assertRaises(ValueError, OfxParser.parse,
+                          io.BytesIO(compressed))
+
+
+class TestMultipleDocuments(TestCase):
+    names = ['bank_medium.ofx', 'suncorp.ofx', 'vanguard.ofx', 'fidelity.ofx']
+
+    def setUp(self):
+        self.documents = []
+        for name in self.names:
+            with open_file(name) as f:
+                self.documents.append(f.read())
+        self.expected = [
+            object_graph(OfxParser.parse(io.BytesIO(document),
+                                         backend='native'))
+            for document in self.documents]
+
+    def parsed(self, f, **kwargs):
+        return [object_graph(ofx)
+                for ofx in OfxParser.iter_parse(f, backend='native',
+                                                **kwargs)]
+
+    def testConcatenated(self):
+        data = six.b('\r\n').join(self.documents)
+        for chunk_size in (7, 100, 64 * 1024):
+            self.assertEqual(self.expected, self.parsed(
+                io.BytesIO(data), chunk_size=chunk_size))
+
+    def testSingle(self):
+        for name in fixture_names():
+            with open_file(name) as f:
+                data = f.read()
+            try:
+                expected = [object_graph(OfxParser.parse(io.BytesIO(data)))]
+            except Exception as e:
+                expected = type(e)
+            try:
+                parsed = [object_graph(ofx) for ofx in
+                          OfxParser.iter_parse(io.BytesIO(data))]
+            except Exception as e:
+                parsed = type(e)
+            self.assertEqual(expected, parsed, name)
+
+    def testUnterminated(self):
+        # The next header block ends a document that is cut short.
+        first = self.documents[0]
+        first = first[:first.rindex(six.b('</OFX>'))]
+        data = first + six.b('\n') + self.documents[1]
+        parsed = self.parsed(io.BytesIO(data), chunk_size=100)
+        self.assertEqual(2, len(parsed))
+        self.assertEqual(self.expected[1], parsed[1])
+
+    def testText(self):
+        data = six.b('\n').join(self.documents).decode('ascii')
+        self.assertEqual(self.expected, self.parsed(io.StringIO(data)))
+
+    def testPipe(self):
+        with pipe(six.b('').join(self.documents)) as f:
+            self.assertEqual(self.expected, self.parsed(f, chunk_size=100))
+
+    @skipIf(six.PY2, 'compressed streams are read with Python 3')
+    def testCompressed(self):
+        data = six.b('').join(self.documents)
+        for compression in ('gzip', 'xz'):
+            with pipe(compress(data, compression)) as f:
+                self.assertEqual(self.expected, self.parsed(f))
+
+    @skipIf(six.PY2, 'compressed streams are read with Python 3')
+    def testZip(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            archive.writestr('README.txt', 'Not OFX')
+            for name, document in zip(self.names, self.documents):
+                archive.writestr(name, document)
+        buffer.seek(0)
+        self.assertEqual(self.expected, self.parsed(buffer))
+
+
+class TestBackends(TestCase):
+    def parseResult(self, name, backend, fail_fast):
+        with open_file(name) as f:
+            try:
+                return object_graph(OfxParser.parse(
+                    f, fail_fast=fail_fast, backend=backend))
+            except Exception as e:
+                return type(e)
+
+    def assertBackendMatchesBeautifulSoup(self, backend):
+        for name in fixture_names():
+            for fail_fast in (True, False):
+                self.assertEqual(
+                    self.parseResult(name, 'beautifulsoup', fail_fast),
+                    self.parseResult(name, backend, fail_fast),
+                    '%s differs (fail_fast=%s)' % (name, fail_fast))
+
+    def testNativeMatchesBeautifulSoup(self):
+        self.assertBackendMatchesBeautifulSoup('native')
+
+    @skipIf(lxml_etree is None, 'lxml is not installed')
+    def testLxmlMatchesBeautifulSoup(self):
+        self.assertBackendMatchesBeautifulSoup('lxml')
+
+    def testMmapMatchesBeautifulSoup(self):
+        self.assertBackendMatchesBeautifulSoup('mmap')
+
+    def testMmap(self):
+        with open_file('bank_medium.ofx') as f:
+            document = OfxMappedFile(f).read()
+            self.assertIsInstance(document, MappedDocument)
+            self.assertEqual(b'OFXHEADER', document.buffer[:9])
+            tree = mapped_tree_maker(document)
+        self.assertTrue(document.buffer.closed)
+        self.assertEqual(1, len(tree.findAll('stmtrs')))
+
+        # Other streams are read as text.
+        with open_file('bank_medium.ofx') as f:
+            data = f.read()
+        text = OfxMappedFile(six.BytesIO(data)).read()
+        self.assertEqual(data.decode('ascii'), text)
+        self.assertEqual(six.text_type(tree), six.text_type(
+            mapped_tree_maker(text)))
+
+    def testUnknownBackend(self):
+        with open_file('bank_medium.ofx') as f:
+            self.assertRaises(ValueError, OfxParser.parse, f,
+                              backend='nonesuch')
+
+
+class TestTreeMaker(TestCase):
+    def testUnclosedLeaves(self):
+        tree = tree_maker('<STMTTRN><TRNTYPE>POS<NAME>A &amp; B'
+                          '<MEMO>x</STMTTRN>')
+        stmttrn = tree.find('stmttrn')
+        self.assertEqual(['trntype', 'name', 'memo'],
+                         [tag.name for tag in stmttrn.contents])
+        self.assertEqual('A & B', stmttrn.find('name').contents[0])
+
+    def testEmptyUnclosedLeaf(self):
+        tree = tree_maker('<STMTTRN><MEMO><FITID>1<NAME>n</STMTTRN>')
+        stmttrn = tree.find('stmttrn')
+        self.assertEqual([], stmttrn.find('memo').contents)
+        self.assertEqual(['memo', 'fitid', 'name'],
+                         [tag.name for tag in stmttrn.contents])
+        self.assertEqual(['fitid', 'name'],
+                         [tag.name for tag in stmttrn.findAll(
+                             ['name', 'fitid'])])
+
+    def testClosedLeavesAndCData(self):
+        tree = tree_maker('<OFX><NAME><![CDATA[<b>]]></NAME>'
+                          '<NAME>two</NAME></OFX>')
+        names = tree.find('ofx').findAll('name')
+        self.assertEqual(['<b>', 'two'], [n.contents[0] for n in names])
+        self.assertEqual(None, names[0].find('name'))
+
+    def testBytes(self):
+        text = six.u('OFXHEADER:100\n\n<OFX><NAME>Caf\xe9 &amp; co'
+                     '<MEMO><![CDATA[\u20ac<b>]]></MEMO> <Trn.Amt>1</OFX> ')
+        for encoding in ('utf-8', 'cp1252'):
+            tree = OfxTreeBuilder().build(text.encode(encoding), encoding)
+            self.assertEqual(six.text_type(tree_maker(text)),
+                             six.text_type(tree))
+            self.assertEqual([six.u('Caf\xe9 & co')],
+                             tree.find('name').contents)
+            self.assertEqual(['trn.amt'],
+                             [tag.name for tag in tree.findAll('trn.amt')])
+
+
+class TestXmlTreeMaker(TestCase):
+    def testWellFormed(self):
+        fh = six.BytesIO(six.b(
+            '  <?xml version="1.0"?><?OFX OFXHEADER="200"?>\n'
+            '<OFX><STMTTRN><NAME>A &amp; B</NAME><MEMO></MEMO>'
+            '<FITID><![CDATA[<1>]]></FITID></STMTTRN></OFX>'))
+        # A tiny chunk size splits tags across feeds.
+        tree = xml_tree_maker(fh, chunk_size=5)
+        stmttrn = tree.find('ofx').find('stmttrn')
+        self.assertEqual(['name', 'memo', 'fitid'],
+                         [tag.name for tag in stmttrn.contents])
+        self.assertEqual(['A & B'], stmttrn.find('name').contents)
+        self.assertEqual([], stmttrn.find('memo').contents)
+        self.assertEqual(['<1>'], stmttrn.find('fitid').contents)
+
+    def testNamespacedRoot(self):
+        # OFX 2.x documents may put their elements in the OFX namespace.
+        for name in ('suncorp.ofx', 'anzcc.ofx'):
+            with open_file(name) as f:
+                data = f.read()
+            start = data.upper().index(six.b('<OFX>'))
+            namespaced = data[:start] + \
+                six.b('<OFX xmlns="http://ofx.net/ifx/2.0/ofx">') + \
+                data[start + 5:]
+            backends = ['beautifulsoup', 'native', 'mmap']
+            if lxml_etree is not None:
+                backends.append('lxml')
+            for backend in backends:
+                self.assertEqual(
+                    object_graph(OfxParser.parse(six.BytesIO(data),
+                                                 backend=backend)),
+                    object_graph(OfxParser.parse(six.BytesIO(namespaced),
+                                                 backend=backend)),
+                    '%s with %s' % (name, backend))
+
+    def testNotWellFormed(self):
+        # anzcc.ofx claims to be OFX 2.x but leaves its leaves unclosed.
+        with open_file('anzcc.ofx') as f:
+            self.assertEqual(None, xml_tree_maker(f))
+        with open_file('anzcc.ofx') as f:
+            ofx = OfxParser.parse(f)
+        self.assertEqual('1234123412341234', ofx.account.number)
+
+
+@skipIf(lxml_etree is None, 'lxml is not installed')
+class TestLxmlMaker(TestCase):
+    def testEntities(self):
+        tree = lxml_maker('<OFX><NAME>AT&T &amp; co&nbsp;</NAME></OFX>')
+        self.assertEqual(six.u('AT&T & co\xa0'),
+                         tree.find('name').contents[0])
+
+    def testLowercaseNames(self):
+        tree = lxml_maker('<OFX><StmtTrn><TRNAMT>1</TRNAMT></StmtTrn></OFX>')
+        stmttrn = tree.find('ofx').find('stmttrn')
+        self.assertEqual('stmttrn', stmttrn.name)
+        self.assertEqual(['1'], stmttrn.find('trnamt').contents)
+
+    def testChunks(self):
+        with open_file('bank_medium.ofx') as f:
+            text = close_tags(f.read().decode('ascii'))
+        self.assertEqual(six.text_type(lxml_maker(text)), six.text_type(
+            lxml_maker(iter_close_tags(text, 3))))
+
+
+class TestIterTransactions(TestCase):
+    def testMatchesParse(self):
+        with open_file('bank_medium.ofx') as f:
+            ofx = OfxParser.parse(f)
+        with open_file('bank_medium.ofx') as f:
+            # A tiny chunk size splits tags across reads.
+            pairs = list(OfxParser.iter_transactions(f, chunk_size=7))
+        expected = ofx.account.statement.transactions
+        self.assertEqual(len(expected), len(pairs))
+        for (account, txn), expected_txn in zip(pairs, expected):
+            self.assertEqual('12300 000012345678', account.number)
+            self.assertEqual('160000100', account.routing_number)
+            self.assertEqual(AccountType.Bank, account.type)
+            self.assertEqual(expected_txn.id, txn.id)
+            self.assertEqual(expected_txn.amount, txn.amount)
+            self.assertEqual(expected_txn.date, txn.date)
+            self.assertEqual(expected_txn.payee, txn.payee)
+
+    def testTextStream(self):
+        class Reader(io.StringIO):
+            sizes = []
+
+            def read(self, size=-1):
+                self.sizes.append(size)
+                return super(Reader, self).read(size)
+
+        with open_file('bank_medium.ofx') as f:
+            text = f.read().decode('ascii')
+        fh = Reader(text)
+        pairs = list(OfxParser.iter_transactions(fh, chunk_size=100))
+        self.assertEqual(3, len(pairs))
+        # The stream is read a chunk at a time, never all at once.
+        self.assertTrue(fh.sizes)
+        self.assertTrue(all(0 <= size <= 1024 * 10 for size in fh.sizes),
+                        fh.sizes)
+
+    def testMultipleAccounts(self):
+        statement = '''<STMTRS><CURDEF>USD<BANKACCTFROM><BANKID>123
+<ACCTID>%s<ACCTTYPE>CHECKING</BANKACCTFROM><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20120602<TRNAMT>-1.00<FITID>%s</STMTTRN>
+</BANKTRANLIST></STMTRS>'''
+        fh = six.BytesIO(six.b(
+            "OFXHEADER:100\nDATA:OFXSGML\nVERSION:102\n\n<OFX><SIGNONMSGSRSV1>"
+            "<SONRS><FI><ORG>blah<FID>1000</FI></SONRS></SIGNONMSGSRSV1>"
+            "<BANKMSGSRSV1>" + statement % ('9100', 'A') +
+            statement % ('9200', 'B') + "</BANKMSGSRSV1></OFX>"))
+        pairs = list(OfxParser.iter_transactions(fh))
+        self.assertEqual([('9100', 'A'), ('9200', 'B')],
+                         [(a.number, t.id) for a, t in pairs])
+        self.assertEqual('usd', pairs[0][0].curdef.lower())
+        self.assertEqual('blah', pairs[0][0].institution.organization)
+
+    def testInvestmentTransactions(self):
+        with open_file('vanguard401k.ofx') as f:
+            pairs = list(OfxParser.iter_transactions(f, chunk_size=100))
+        self.assertEqual(5, len(pairs))
+        account, txn = pairs[-1]
+        self.assertEqual(AccountType.Investment, account.type)
+        self.assertEqual('vanguard.com', account.brokerid)
+        self.assertEqual('0123456', account.account_id)
+        self.assertEqual('transfer', txn.type)
+        self.assertEqual('1234567890123456795AAA', txn.id)
+
+    def testFailNicely(self):
+        with open_file('fail_nice/date_missing.ofx') as f:
+            pairs = list(OfxParser.iter_transactions(f, fail_fast=False))
+        self.assertEqual([], pairs)
+
+        with open_file('fail_nice/date_missing.ofx') as f:
+            self.assertRaises(OfxParserException, list,
+                              OfxParser.iter_transactions(f))
+
+
+class TestParserInstances(TestCase):
+    def testSettings(self):
+        parser = OfxParser(custom_date_format='%d%m%Y')
+        self.assertEqual(datetime(2011, 1, 15),
+                         parser.parseOfxDateTime('15012011'))
+        # The class itself parses with the default settings.
+        self.assertRaises(ValueError, OfxParser.parseOfxDateTime, '15012011')
+
+    def testConfigured(self):
+        parser = OfxParser()
+        lenient = parser.configured(fail_fast=False)
+        self.assertTrue(parser.fail_fast)
+        self.assertFalse(lenient.fail_fast)
+        self.assertEqual(None, lenient.custom_date_format)
+
+    def testConcurrentParses(self):
+        with open_file('fail_nice/date_missing.ofx') as f:
+            data = f.read()
+        lenient = OfxParser(fail_fast=False)
+        errors = []
+
+        def work(fail_fast):
+            for _ in range(20):
+                try:
+                    if fail_fast:
+                        OfxParser.parse(six.BytesIO(data), backend='native')
+                    else:
+                        lenient.parse(six.BytesIO(data), backend='native')
+                except OfxParserException:
+                    if not fail_fast:
+                        errors.append('raised with fail_fast False')
+                else:
+                    if fail_fast:
+                        errors.append('did not raise with fail_fast True')
+
+        # Switch threads as often as possible to provoke any race.
+        if hasattr(sys, 'setswitchinterval'):
+            self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+            sys.setswitchinterval(1e-6)
+        threads = [threading.Thread(target=work, args=(i % 2 == 0,))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+
+
+class TestInterning(TestCase):
+    def parse(self, parser, name='multiple_accounts2.ofx'):
+        with open_file(name) as f:
+            return parser.parse(f)
+
+    def testWithinADocument(self):
+        ofx = self.parse(OfxParser(intern=True))
+        first, second = ofx.accounts[:2]
+        self.assertIs(first.institution, second.institution)
+        transactions = [t for account in ofx.accounts
+                        for t in account.statement.transactions]
+        types = dict((t.type, t.type) for t in transactions)
+        for transaction in transactions:
+            self.assertIs(types[transaction.type], transaction.type)
+
+    def testOff(self):
+        # Off by default.
+        for parser in (OfxParser(), OfxParser(intern=False)):
+            ofx = self.parse(parser)
+            first, second = ofx.accounts[:2]
+            self.assertIsNot(first.institution, second.institution)
+
+    def testMemosNotInterned(self):
+        parser = OfxParser(intern=True).session()
+        ofx = self.parse(parser, 'checking.ofx')
+        transactions = [t for account in ofx.accounts
+                        for t in account.statement.transactions]
+        # Those that are not also the payee of a transaction.
+        memos = set(t.memo for t in transactions) - \
+            set(t.payee for t in transactions)
+        self.assertTrue(memos)
+        self.assertFalse(memos & set(parser.strings))
+
+    def testSession(self):
+        parser = OfxParser(intern=True)
+        session = parser.session()
+        first = self.parse(session)
+        second = self.parse(session)
+        self.assertIs(first.accounts[0].institution,
+                      second.accounts[0].institution)
+        self.assertIsNot(self.parse(parser).accounts[0].institution,
+                         self.parse(parser).accounts[0].institution)
+        # The parser a session was made from is left alone.
+        self.assertEqual(None, parser.strings)
+
+
+class TestDecimalSeparator(TestCase):
+    statement = '''OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><CURDEF>EUR
+<BANKACCTFROM><BANKID>1<ACCTID>1<ACCTTYPE>CHECKING</BANKACCTFROM>
+<BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20120601<TRNAMT>%s<FITID>A</STMTTRN>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20120602<TRNAMT>%s<FITID>B</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>'''
+
+    def amounts(self, first, second, **kwargs):
+        fh = six.BytesIO(six.b(self.statement % (first, second)))
+        ofx = OfxParser.parse(fh, **kwargs)
+        amounts = [t.amount for t in ofx.account.statement.transactions]
+        fh.seek(0)
+        self.assertEqual(
+            amounts, [t.amount for _, t in
+                      OfxParser.iter_transactions(fh, **kwargs)])
+        return amounts
+
+    def testDetectedPerDocument(self):
+        # 1.000 alone could be either; the document uses commas.
+        self.assertEqual([Decimal('-1.50'), Decimal('1000')],
+                         self.amounts('-1,50', '1.000'))
+        self.assertEqual([Decimal('1000000'), Decimal('1.000')],
+                         self.amounts('1,000,000', '1.000'))
+
+    def testUndetectedFallsBackToEachValue(self):
+        self.assertEqual([Decimal('1.000'), Decimal('1.000')],
+                         self.amounts('1.000', '1,000'))
+
+    def testDeclared(self):
+        self.assertEqual([Decimal('1000'), Decimal('1.000')],
+                         self.amounts('1.000', '1,000',
+                                      decimal_separator=','))
+        parser = OfxParser(decimal_separator='.')
+        self.assertEqual(Decimal('1000.5'),
+                         parser.toDecimal(tree_maker('<a>+1 000.50</a>')
+                                          .find('a')))
+
+
+class TestParseMany(TestCase):
+    def testResults(self):
+        names = ['bank_medium.ofx', 'fail_nice/date_missing.ofx',
+                 'checking.ofx', 'vanguard.ofx']
+        paths = [os.path.join(os.path.dirname(__file__), 'fixtures', name)
+                 for name in names]
+        missing = paths[0] + '.missing'
+        with open_file('suncorp.ofx') as handle:
+            sources = paths + [missing, handle]
+            results = list(OfxParser.parse_many(sources, workers=2,
+                                                batch_size=2))
+        self.assertEqual(sources, [result.source for result in results])
+
+        for result, name in zip(results, names + ['', 'suncorp.ofx']):
+            if result.error is not None:
+                continue
+            with open_file(name) as f:
+                expected = OfxParser.parse(f)
+            self.assertEqual(object_graph(expected), object_graph(result.ofx))
+
+        # Errors are returned, not raised.
+        self.assertEqual(None, results[1].ofx)
+        self.assertTrue(isinstance(results[1].error, OfxParserException))
+        self.assertTrue(isinstance(results[4].error, EnvironmentError))
+        self.assertEqual(
+            [False, True, False, False, True, False],
+            [result.error is not None for result in results])
+
+    def testUnorderedWithSettings(self):
+        path = os.path.join(os.path.dirname(__file__), 'fixtures',
+                            'fail_nice', 'date_missing.ofx')
+        parser = OfxParser(fail_fast=False)
+        results = list(parser.parse_many([path] * 3, workers=2,
+                                         ordered=False, max_pending=1))
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.assertEqual(None, result.error)
+            self.assertEqual(
+                3, len(result.ofx.account.statement.discarded_entries))
+
+
 class TestStringToDate(TestCase):
     ''' Test the string to date parser '''
     def test_bad_format(self):
@@ -269,6 +956,32 @@ class TestStringToDate(TestCase):
             OfxParser.parseOfxDateTime('20120922230000 [+9:JST]'),
             datetime(2012, 9, 22, 14, 0))
 
+    def test_parses_fractional_seconds(self):
+        self.assertEqual(
+            OfxParser.parseOfxDateTime('20090401122017.5[-5:EST]'),
+            datetime(2009, 4, 1, 17, 20, 17, 500000))
+        self.assertEqual(
+            OfxParser.parseOfxDateTime('20090401122017.1234567'),
+            datetime(2009, 4, 1, 12, 20, 17, 123450))
+
+    def test_unusual_forms(self):
+        # Forms the sliced fast path leaves to strptime.
+        self.assertEqual(OfxParser.parseOfxDateTime('200904011220'),
+                         datetime(2009, 4, 1, 12, 2))
+        self.assertEqual(OfxParser.parseOfxDateTime('20090401250000'),
+                         datetime(2009, 4, 1))
+        self.assertEqual(
+            OfxParser.parseOfxDateTime('20090401122017[-5:E-T]'),
+            datetime(2009, 4, 1, 12, 20, 17))
+
+    def test_custom_date_format_is_part_of_the_cache_key(self):
+        parser = OfxParser(custom_date_format='%d%m%Y')
+        self.assertEqual(parser.parseOfxDateTime('01122011'),
+                         datetime(2011, 12, 1))
+        self.assertRaises(ValueError, OfxParser.parseOfxDateTime, '01122011')
+        self.assertEqual(parser.parseOfxDateTime('01122011'),
+                         datetime(2011, 12, 1))
+
 
 class TestParseStmtrs(TestCase):
     input = '''
@@ -449,6 +1162,47 @@ class TestParseTransaction(TestCase):
         transaction = OfxParser.parseTransaction(txn.find('stmttrn'))
         self.assertEqual('700', transaction.checknum)
 
+    def testThatParseTransactionLooksUpTheMcc(self):
+        input = '''
+<STMTTRN>
+ <TRNTYPE>POS
+ <DTPOSTED>20130306
+ <TRNAMT>-10.00
+ <FITID>1
+ <SIC>5411
+</STMTTRN>
+'''
+        txn = soup_maker(input)
+        transaction = OfxParser.parseTransaction(txn.find('stmttrn'))
+        self.assertEqual('5411', transaction.sic)
+        self.assertEqual('Grocery Stores, Supermarkets', transaction.mcc)
+
+        txn = soup_maker(input.replace('5411', '1'))
+        transaction = OfxParser.parseTransaction(txn.find('stmttrn'))
+        self.assertEqual('', transaction.mcc)
+
+    def testThatParseTransactionReadsTheFirstOfEachField(self):
+        input = '''
+<STMTTRN>
+ <TRNTYPE>DEBIT
+ <DTPOSTED>20130306
+ <TRNAMT>-10.00
+ <FITID>1
+ <PAYEE>
+  <NAME>PAYEE NAME
+  <ADDR1>1 MAIN ST
+ </PAYEE>
+ <NAME>LATER NAME
+ <MEMO>FIRST
+ <MEMO>SECOND
+</STMTTRN>
+'''
+        for maker in (soup_maker, tree_maker):
+            txn = maker(input)
+            transaction = OfxParser.parseTransaction(txn.find('stmttrn'))
+            self.assertEqual('PAYEE NAME', transaction.payee)
+            self.assertEqual('FIRST', transaction.memo)
+
     def testThatParseTransactionWithCommaAsDecimalPoint(self):
         input = '''
 <STMTTRN>
@@ -552,6 +1306,30 @@ class TestParseTransaction(TestCase):
             self.assertEqual(0, transaction.amount)
 
 
+class TestModelClasses(TestCase):
+    def testSlots(self):
+        from ofxparse.ofxparse import (
+            BrokerageBalance, Institution, InvestmentAccount,
+            InvestmentStatement, InvestmentTransaction, Position, Security)
+        objects = [
+            Transaction(), InvestmentTransaction('buymf'), Position(),
+            Security('1', 'name', 'TCKR', ''), Account(), InvestmentAccount(),
+            Statement(), InvestmentStatement(), Institution(),
+            BrokerageBalance()]
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+
+    def testOptionalAttributes(self):
+        with open_file('fidelity.ofx') as f:
+            ofx = OfxParser.parse(f)
+        position = ofx.account.statement.positions[0]
+        self.assertTrue(hasattr(position, 'date'))
+        del position.date
+        self.assertFalse(hasattr(position, 'date'))
+        self.assertFalse(hasattr(Statement(), 'balance'))
+        self.assertFalse(hasattr(Account(), 'desc'))
+
+
 class TestTransaction(TestCase):
     def testThatAnEmptyTransactionIsValid(self):
         t = Transaction()
@@ -589,6 +1367,56 @@ class TestInvestmentAccount(TestCase):
         # Success!
 
 
+class TestParseInvestmentStatement(TestCase):
+    sample = '''
+<OFX>
+ <INVSTMTMSGSRSV1>
+  <INVSTMTTRNRS>
+   <INVSTMTRS>
+    <CURDEF>USD
+    <INVACCTFROM><BROKERID>example.com<ACCTID>1234</INVACCTFROM>
+    <INVTRANLIST>
+     <DTSTART>20110101<DTEND>20110624
+     <BUYSTOCK><INVBUY><INVTRAN><FITID>1<DTTRADE>20110103</INVTRAN>
+      <UNITS>10<UNITPRICE>1.50<TOTAL>-15.00</INVBUY></BUYSTOCK>
+     <INCOME><INVTRAN><FITID>2<DTTRADE>20110104</INVTRAN>
+      <INCOMETYPE>DIV<TOTAL>2.00</INCOME>
+     <BUYSTOCK><INVBUY><INVTRAN><FITID>3<DTTRADE>20110105</INVTRAN>
+      <UNITS>ten<UNITPRICE>1.50<TOTAL>-15.00</INVBUY></BUYSTOCK>
+     <INVBANKTRAN><STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20110106
+      <TRNAMT>5.00<FITID>4</STMTTRN></INVBANKTRAN>
+     <BUYSTOCK><INVBUY><INVTRAN><FITID>5<DTTRADE>20110107</INVTRAN>
+      <UNITS>20<UNITPRICE>1.50<TOTAL>-30.00</INVBUY></BUYSTOCK>
+    </INVTRANLIST>
+    <INVPOSLIST>
+     <POSSTOCK><INVPOS><UNITS>30<UNITPRICE>1.50</INVPOS></POSSTOCK>
+     <POSMF><INVPOS><UNITS>5<UNITPRICE>10.00</INVPOS></POSMF>
+    </INVPOSLIST>
+   </INVSTMTRS>
+  </INVSTMTTRNRS>
+ </INVSTMTMSGSRSV1>
+</OFX>
+'''
+
+    def testDocumentOrder(self):
+        for backend in ('beautifulsoup', 'native'):
+            ofx = OfxParser.parse(six.BytesIO(six.b(self.sample)),
+                                  fail_fast=False, backend=backend)
+            statement = ofx.account.statement
+            # The unreadable third transaction is discarded on its own.
+            self.assertEqual(['1', '2', '4', '5'],
+                             [t.id for t in statement.transactions])
+            self.assertEqual(['buystock', 'income', 'credit', 'buystock'],
+                             [t.type for t in statement.transactions])
+            self.assertEqual(1, len(statement.discarded_entries))
+            self.assertEqual([Decimal('30'), Decimal('5')],
+                             [p.units for p in statement.positions])
+
+    def testFailFast(self):
+        with self.assertRaises(InvalidOperation):
+            OfxParser.parse(six.BytesIO(six.b(self.sample)))
+
+
 class TestVanguardInvestmentStatement(TestCase):
     def testForUnclosedTags(self):
         with open_file('vanguard.ofx') as f:
@@ -1023,6 +1851,86 @@ class TestGracefulFailures(TestCase):
         self.assertEqual(ofx.status['severity'], 'ERROR')
         self.assertEqual(ofx.status['message'], 'General Server Error')
 
+    def testDiscardedEntryRecords(self):
+        for backend in ('beautifulsoup', 'native'):
+            with open_file('fail_nice/date_missing.ofx') as f:
+                ofx = OfxParser.parse(f, False, backend=backend)
+            entry = ofx.account.statement.discarded_entries[0]
+            self.assertEqual(['content', 'error'], sorted(entry))
+            record = entry['error']
+            self.assertIsInstance(record, ErrorRecord)
+            self.assertEqual(record.code, 'discarded_transaction')
+            self.assertEqual(record.tag, 'stmttrn')
+            self.assertEqual(record,
+                             'Missing Transaction Date (a required field)')
+            self.assertEqual(entry['content'], record.snippet)
+            self.assertTrue(entry['content'].startswith('<stmttrn>'))
+        # Where the element starts, as each tree builder knows it.
+        self.assertIsNone(record.line)
+        self.assertEqual(b'<STMTTRN>',
+                         open_file('fail_nice/date_missing.ofx').read()
+                         [record.offset:record.offset + 9].upper())
+
+    def testInvalidDateWarningHasError(self):
+        with open_file('fidelity.ofx') as f:
+            data = f.read().replace(six.b('<DTSTART>20120710000000.000'),
+                                    six.b('<DTSTART>2012-07-10'))
+        ofx = OfxParser.parse(six.BytesIO(data), False)
+        warning = ofx.account.statement.warnings[0]
+        self.assertEqual('invalid_start_date', warning.code)
+        # The error that made the date invalid is kept in the message.
+        self.assertTrue(warning.detail)
+        self.assertIn(warning.detail, warning)
+
+    def testWarningRecords(self):
+        with open_file('fail_nice/empty_balance.ofx') as f:
+            ofx = OfxParser.parse(f, False)
+        warning = ofx.account.statement.warnings[0]
+        self.assertEqual(warning.code, 'empty_balance')
+        self.assertEqual(warning.tag, 'stmtrs')
+        self.assertEqual(warning.detail, 'ledger')
+        self.assertEqual(19, warning.line)
+        self.assertTrue(warning.startswith(
+            'ledger balance amount was empty for <stmtrs>'))
+        # A record is the text of its message, and pickles as one.
+        self.assertIsInstance(warning, six.text_type)
+        copy = pickle.loads(pickle.dumps(warning))
+        self.assertEqual(warning, copy)
+        self.assertEqual((warning.code, warning.detail, warning.line),
+                         (copy.code, copy.detail, copy.line))
+
+    def testRecordsKeepShortSnippets(self):
+        # A record keeps a bounded piece of its element's markup, never the
+        # element, however large the element is.
+        tree = tree_maker('<stmtrs><curdef></curdef><banktranlist>' +
+                          '<stmttrn><trnamt>1</trnamt></stmttrn>' * 1000 +
+                          '</banktranlist></stmtrs>')
+        record = ErrorRecord.about('empty_currency', tree.find('stmtrs'))
+        self.assertEqual(SNIPPET_LENGTH + 3, len(record.snippet))
+        self.assertTrue(record.snippet.startswith(
+            '<stmtrs><curdef></curdef><banktranlist><stmttrn>'))
+        self.assertTrue(record.snippet.endswith('...'))
+
+        small = ErrorRecord.about('empty_currency', tree.find('stmttrn'))
+        self.assertEqual('<stmttrn><trnamt>1</trnamt></stmttrn>',
+                         small.snippet)
+        self.assertEqual(six.text_type(tree.find('stmttrn')), small.snippet)
+
+    def testStreamWarningRecords(self):
+        with open_file('fail_nice/decimal_error.ofx') as f:
+            text = f.read().decode('ascii')
+        # Stop after the transaction list, while the account is still open.
+        end = text.upper().index('</BANKTRANLIST>')
+        text = text[:end + len('</BANKTRANLIST>')]
+        stream = TransactionStream(OfxParser(fail_fast=False))
+        self.assertEqual([], list(stream.feed(text)))
+        warning = stream.account.warnings[0]
+        self.assertEqual(('invalid_transaction', 'stmttrn'),
+                         (warning.code, warning.tag))
+        self.assertEqual("stmttrn: Invalid Transaction Amount: '$120'",
+                         six.text_type(warning))
+        self.assertTrue(warning.snippet.upper().startswith('<STMTTRN>'))
+
 
 class TestParseSonrs(TestCase):
 
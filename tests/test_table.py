@@ -0,0 +1,143 @@
+from __future__ import absolute_import
+
+import pickle
+from datetime import datetime
+from decimal import Decimal
+from unittest import TestCase, skipIf
+
+from ofxparse import OfxParser
+from ofxparse.ofxparse import Transaction, Position
+from ofxparse.ofxtable import (DateColumn, DecimalColumn, NAT, NULL,
+                               TransactionTable, PositionTable)
+from .support import open_file, object_graph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestColumns(TestCase):
+    def testDecimalColumn(self):
+        column = DecimalColumn()
+        for value in ['1', '-2.5', '0.125', '100.10']:
+            column.append(Decimal(value))
+        self.assertEqual(3, column.scale)
+        self.assertEqual([1000, -2500, 125, 100100], list(column.values))
+        self.assertEqual(Decimal('-2.500'), column[1])
+        self.assertEqual({}, column.others)
+
+    def testDecimalColumnKeepsAsideWhatDoesNotFit(self):
+        column = DecimalColumn()
+        values = [Decimal('1.5'), None, Decimal('1E+30'),
+                  Decimal('0.0000000001'), Decimal('NaN')]
+        for value in values:
+            column.append(value)
+        self.assertEqual(1, column.scale)
+        self.assertEqual(Decimal('1.5'), column[0])
+        for i in range(2, 5):
+            self.assertTrue(i in column.others)
+        self.assertEqual(None, column[1])
+        self.assertEqual(Decimal('1E+30'), column[2])
+
+    def testDecimalColumnNone(self):
+        # None is stored in the array, not kept aside, and survives a
+        # rescale.
+        column = DecimalColumn()
+        for value in [Decimal('1'), None, Decimal('0.25')]:
+            column.append(value)
+        self.assertEqual({}, column.others)
+        self.assertEqual(NULL, column.values[1])
+        self.assertEqual([Decimal('1'), None, Decimal('0.25')],
+                         [column[i] for i in range(3)])
+
+    def testDateColumn(self):
+        column = DateColumn()
+        column.append(datetime(2009, 4, 1, 12, 20, 17, 5))
+        column.append(None)
+        column.append(datetime(1969, 12, 31))
+        self.assertEqual(1238588417000005, column.values[0])
+        self.assertEqual(NAT, column.values[1])
+        self.assertEqual(datetime(2009, 4, 1, 12, 20, 17, 5), column[0])
+        self.assertEqual(None, column[1])
+        self.assertEqual(datetime(1969, 12, 31), column[2])
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def testToNumpy(self):
+        dates = DateColumn()
+        dates.append(datetime(2009, 4, 1))
+        dates.append(None)
+        self.assertEqual(numpy.datetime64('2009-04-01'), dates.to_numpy()[0])
+        self.assertTrue(numpy.isnat(dates.to_numpy()[1]))
+        amounts = DecimalColumn()
+        amounts.append(Decimal('1.25'))
+        amounts.append(None)
+        self.assertEqual(1.25, amounts.to_numpy()[0])
+        self.assertTrue(numpy.isnan(amounts.to_numpy()[1]))
+
+
+class TestTables(TestCase):
+    def testRows(self):
+        table = TransactionTable()
+        for i in range(3):
+            transaction = Transaction()
+            transaction.id = str(i)
+            transaction.amount = Decimal(i)
+            table.append(transaction)
+        self.assertEqual(3, len(table))
+        self.assertEqual('2', table[-1].id)
+        self.assertEqual(['0', '1'], [t.id for t in table[:2]])
+        self.assertEqual(['0', '1', '2'], table.column('id').values)
+        self.assertRaises(IndexError, lambda: table[3])
+        self.assertTrue(isinstance(table[0], Transaction))
+
+    def testRowsAreSnapshots(self):
+        table = TransactionTable()
+        transaction = Transaction()
+        transaction.memo = 'parsed'
+        table.append(transaction)
+        self.assertIsNot(table[0], table[0])
+        table[0].memo = 'changed'
+        self.assertEqual('parsed', table[0].memo)
+
+    def testOptionalAttributes(self):
+        table = PositionTable()
+        table.append(Position())
+        self.assertFalse(hasattr(table[0], 'date'))
+
+    def testPickle(self):
+        table = TransactionTable()
+        table.append(Transaction())
+        copy = pickle.loads(pickle.dumps(table))
+        self.assertEqual(1, len(copy))
+
+
+class TestColumnarParse(TestCase):
+    def assertSameAsLists(self, name):
+        with open_file(name) as f:
+            expected = OfxParser.parse(f)
+        with open_file(name) as f:
+            ofx = OfxParser(columnar=True).parse(f)
+        for account in ofx.accounts:
+            statement = account.statement
+            statement.transactions = list(statement.transactions)
+            if hasattr(statement, 'positions'):
+                statement.positions = list(statement.positions)
+        self.assertEqual(object_graph(expected), object_graph(ofx))
+
+    def testBankStatement(self):
+        with open_file('bank_medium.ofx') as f:
+            ofx = OfxParser(columnar=True).parse(f)
+        transactions = ofx.account.statement.transactions
+        self.assertTrue(isinstance(transactions, TransactionTable))
+        self.assertEqual(Decimal('-6.60'), transactions[0].amount)
+        self.assertEqual(2, transactions.column('amount').scale)
+        self.assertSameAsLists('bank_medium.ofx')
+
+    def testInvestmentStatement(self):
+        with open_file('fidelity.ofx') as f:
+            ofx = OfxParser(columnar=True).parse(f)
+        statement = ofx.account.statement
+        self.assertTrue(isinstance(statement.positions, PositionTable))
+        self.assertSameAsLists('fidelity.ofx')
+        self.assertSameAsLists('investment_401k.ofx')
@@ -1,13 +1,14 @@
 from __future__ import absolute_import
 
 from ofxparse import OfxParser, OfxPrinter
-from unittest import TestCase
+from unittest import TestCase, skipIf
+import six
 from six import StringIO
 from os import close, remove
 from tempfile import mkstemp
 import sys
 sys.path.append('..')
-from .support import open_file
+from .support import open_file, object_graph
 
 
 class TestOfxWrite(TestCase):
@@ -32,6 +33,21 @@ class TestOfxWrite(TestCase):
         printer.writeToFile(output_buffer, tabs=1)
         assert output_buffer.getvalue().startswith("OFXHEADER")
 
+    @skipIf(six.PY2, 'compressed files are written with Python 3')
+    def test_using_ofx_printer_compressed(self):
+        with open_file('checking.ofx') as f:
+            ofx = OfxParser.parse(f)
+        for suffix in ('.ofx', '.ofx.gz', '.ofx.bz2', '.ofx.xz', '.zip'):
+            fd, name = mkstemp(suffix=suffix)
+            close(fd)
+            try:
+                OfxPrinter(ofx=ofx, filename=name).write(tabs=1)
+                with open(name, 'rb') as f:
+                    written = OfxParser.parse(f)
+            finally:
+                remove(name)
+            self.assertEqual(object_graph(ofx), object_graph(written))
+
 if __name__ == "__main__":
     import unittest
     unittest.main()
@@ -1,4 +1,5 @@
 from ofxparse import OfxParser
+from ofxparse.ofxframe import to_dataframe
 import pandas as pd
 
 import argparse
@@ -37,54 +38,56 @@ parser.add_argument('--id-length', metavar='24', type=int, default=24,
 args = parser.parse_args()
 
 
-data = {}
+ofxs = {}
 for fname in args.files:
-    ofx = OfxParser.parse(file(fname))
-    for account in ofx.accounts:
-        df = data.get(account.number, pd.DataFrame(columns=fields+['fname']))
-        for transaction in account.statement.transactions:
-            s = pd.Series([getattr(transaction,f) for f in fields], index=fields)
-            s['fname'] = fname.split('/')[-1]
-            df = df.append(s, ignore_index=True)
-        df['id'] = df['id'].str[:args.id_length]  # clip the last part of the ID which changes from download to download
-        data[account.number] = df
-
-print "Writing result to", args.output
-writer = pd.ExcelWriter(args.output)
-
-for account_number, df in data.iteritems():
-    # A transaction is identified using all `fields`
-    # collapse all repeated transactions from the same file into one row
-    # find the number of repeated transactions and
-    # put it in samedayrepeat column
-    df_count = df.groupby(fields+['fname']).size()
-    df_count = df_count.reset_index()
-    df_count.columns = list(df_count.columns[:-1]) + ['samedayrepeat']
-
-    # two transactions from the same file are always different
-    # but the same transaction can appear in multiple files if they overlap.
-    # check we have the same samedayrepeat for the same transaction on different files
-    df_size_fname_count = df_count.reset_index().groupby(fields).samedayrepeat.nunique()
-    assert (df_size_fname_count == 1).all(), "Different samedayrepeat in different files"
-
-    # take one file as an example
-    df1 = df_count.reset_index().groupby(fields+['samedayrepeat']).first()
-    df1 = df1.reset_index()
-
-    # expand back the collapsed transactions
-    # duplicate rows according to samedayrepeat value
-    df2 = df1.copy()
-    for i in range(2,df1.samedayrepeat.max()+1):
-        df2 = df2.append(df1[i<=df1.samedayrepeat])
-
-    # sort according to date
-    df2 = df2.reset_index().set_index('date').sort_index()
-    # filter dates
-    df2 = df2.ix[args.start:args.end]
-
-    #cleanup
-    df2 = df2.reset_index()[fields]
-
-    df2.to_excel(writer, account_number, index=False)
-
-writer.save()
+    with open(fname, 'rb') as f:
+        ofxs[fname] = OfxParser.parse(f)
+
+# One frame for every account in every file, built a column at a time.
+frame = to_dataframe(ofxs)
+frame['fname'] = frame['source'].astype(str).str.split('/').str[-1]
+# clip the last part of the ID which changes from download to download
+frame['id'] = frame['id'].str[:args.id_length]
+for field in fields:
+    if isinstance(frame[field].dtype, pd.CategoricalDtype):
+        frame[field] = frame[field].astype(object)
+
+print("Writing result to", args.output)
+with pd.ExcelWriter(args.output) as writer:
+    for account_number, df in frame.groupby('account', observed=True):
+        df = df[fields + ['fname']]
+
+        # A transaction is identified using all `fields`
+        # collapse all repeated transactions from the same file into one row
+        # find the number of repeated transactions and
+        # put it in samedayrepeat column
+        df_count = df.groupby(fields + ['fname']).size()
+        df_count = df_count.reset_index()
+        df_count.columns = list(df_count.columns[:-1]) + ['samedayrepeat']
+
+        # two transactions from the same file are always different
+        # but the same transaction can appear in multiple files if they
+        # overlap.  check we have the same samedayrepeat for the same
+        # transaction on different files
+        df_size_fname_count = df_count.groupby(fields).samedayrepeat.nunique()
+        assert (df_size_fname_count == 1).all(), \
+            "Different samedayrepeat in different files"
+
+        # take one file as an example
+        df1 = df_count.groupby(fields + ['samedayrepeat']).first()
+        df1 = df1.reset_index()
+
+        # expand back the collapsed transactions
+        # duplicate rows according to samedayrepeat value
+        df2 = pd.concat([df1] + [df1[i <= df1.samedayrepeat]
+                                 for i in range(2, df1.samedayrepeat.max() + 1)])
+
+        # sort according to date
+        df2 = df2.set_index('date').sort_index()
+        # filter dates
+        df2 = df2.loc[args.start:args.end]
+
+        # cleanup
+        df2 = df2.reset_index()[fields]
+
+        df2.to_excel(writer, sheet_name=str(account_number), index=False)